@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from app.domain.controller.chat_controller import generate_response
 from app.domain.model.chat_model import ChatRequest, ChatResponse
 
@@ -26,7 +27,8 @@ async def chat(request: ChatRequest):
     - **status**: 요청 처리 상태
     """
     try:
-        response = generate_response(request.message)
+        # 모델 추론은 동기 작업이므로 스레드풀에서 실행 (이벤트 루프와 마감 시각 처리를 막지 않도록)
+        response = await run_in_threadpool(generate_response, request.message)
         return ChatResponse(response=response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
@@ -1,5 +1,16 @@
 import os
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, StoppingCriteria, StoppingCriteriaList
+
+from app.middleware.deadline_middleware import check_deadline, remaining_budget
+
+
+class DeadlineStoppingCriteria(StoppingCriteria):
+    """요청 마감 시각이 지나면 토큰 생성을 멈춥니다."""
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        remaining = remaining_budget()
+        return remaining is not None and remaining <= 0
+
 
 class ChatService:
     def __init__(self):
@@ -8,6 +19,7 @@ class ChatService:
         self.model = AutoModelForCausalLM.from_pretrained("lcw99/ko-dialoGPT-korean-chit-chat", token=token)
 
     def get_response(self, message: str) -> str:
+        check_deadline("tokenize")
         inputs = self.tokenizer(
             message + self.tokenizer.eos_token,
             return_tensors="pt",
@@ -22,7 +34,10 @@ class ChatService:
             do_sample=True,
             temperature=0.7,
             top_p=0.9,
-            pad_token_id=self.tokenizer.eos_token_id
+            pad_token_id=self.tokenizer.eos_token_id,
+            stopping_criteria=StoppingCriteriaList([DeadlineStoppingCriteria()])
         )
+        # 마감 시각 때문에 생성을 멈춘 경우 잘린 응답은 반환하지 않음
+        check_deadline("decode")
         response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         return response 
\ No newline at end of file
@@ -6,6 +6,8 @@ from dotenv import load_dotenv
 
 # 라우터 임포트
 from app.api.chatbot_router import router as chatbot_router
+from app.middleware.deadline_middleware import DeadlineMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
 
 # 환경 변수 로드
 load_dotenv()
@@ -33,11 +35,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="chatbot")
+
 # 라우터 등록 ###
 app.include_router(chatbot_router, tags=["chatbot"])
 
-# 직접 실행 시 Uvicorn 서버로 실행
+# 직접 실행 시 운영 모드로 실행 (SERVER_MODE=development이면 --reload)
 if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("PORT", "8082"))
-    uvicorn.run("app.main:app", host="0.0.0.0", port=port, reload=True)
+    from app.launcher import run
+    run("app.main:app", port=8082)
@@ -0,0 +1,147 @@
+# deadline_middleware.py
+import time
+import json
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 게이트웨이가 전달하는 요청 마감 시각 헤더 (Unix epoch 초)
+DEADLINE_HEADER = b"x-request-deadline"
+
+# 현재 요청의 마감 시각 (헤더가 없으면 None)
+_request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(BaseException):
+    """
+    요청 마감 시각이 지나 처리를 중단할 때 발생하는 예외
+
+    asyncio.CancelledError처럼 BaseException을 상속하므로 핸들러와 서비스의 `except Exception` 처리에 걸리지 않고
+    DeadlineMiddleware까지 전달되어 504 응답이 됩니다.
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        super().__init__(f"요청 처리 마감 시각이 지나 '{stage}' 단계를 실행하지 않습니다.")
+
+
+def remaining_budget() -> Optional[float]:
+    """
+    현재 요청의 남은 처리 시간(초)을 반환합니다. 마감 시각이 없으면 None을 반환합니다.
+
+    run_in_threadpool로 실행한 동기 작업에도 컨텍스트가 복사되므로 스레드 안에서도 사용할 수 있습니다.
+    """
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def check_deadline(stage: str):
+    """
+    마감 시각이 지났으면 DeadlineExceeded를 발생시킵니다. 마감 시각이 없는 요청에서는 아무것도 하지 않습니다.
+
+    스레드풀에서 실행 중인 동기 작업은 취소할 수 없으므로, 다운로드·파싱·DB 저장·모델 호출 같은
+    단계 사이에서 호출하여 마감 시각 이후에는 다음 단계를 시작하지 않도록 합니다.
+    """
+    remaining = remaining_budget()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(stage)
+
+
+class DeadlineMiddleware:
+    """
+    X-Request-Deadline 헤더를 읽어 남은 시간이 지나면 요청 처리를 취소하는 ASGI 미들웨어
+
+    - 도착 시점에 이미 마감 시각이 지났으면 핸들러를 실행하지 않고 504를 반환합니다.
+    - 응답을 시작하기 전에 마감 시각이 지나면 바로 504를 보내고 핸들러 태스크를 취소합니다.
+      (스레드풀 작업은 끝날 때까지 기다리며, 그 뒤 핸들러가 보내는 응답은 버립니다.)
+    - 핸들러가 check_deadline()으로 DeadlineExceeded를 발생시키면 504를 반환합니다.
+    - 마감 시각 전에 응답을 시작한 스트리밍 응답(SSE 등)은 마감 시각 이후에도 계속 전송합니다.
+    헤더가 없는 요청은 그대로 통과합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline = None
+        for name, value in scope.get("headers", []):
+            if name == DEADLINE_HEADER:
+                try:
+                    deadline = float(value.decode())
+                except ValueError:
+                    deadline = None
+                break
+
+        if deadline is None:
+            await self.app(scope, receive, send)
+            return
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            logger.warning(f"마감 시각이 지난 요청을 거절합니다: {scope.get('path')}")
+            await self._send_timeout(send)
+            return
+
+        response_started = asyncio.Event()
+        timed_out = False
+
+        async def send_wrapper(message):
+            if timed_out:
+                # 이미 504를 보낸 요청의 늦은 응답은 버림
+                return
+            if message["type"] == "http.response.start":
+                response_started.set()
+            await send(message)
+
+        token = _request_deadline.set(deadline)
+        try:
+            # 핸들러 태스크는 생성 시점의 컨텍스트(마감 시각 포함)를 복사해 실행됨
+            handler = asyncio.ensure_future(self.app(scope, receive, send_wrapper))
+        finally:
+            _request_deadline.reset(token)
+
+        started_waiter = asyncio.ensure_future(response_started.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {handler, started_waiter}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if handler in done or response_started.is_set():
+                await handler
+                return
+            timed_out = True
+            handler.cancel()
+            logger.warning(f"마감 시각이 지나 요청 처리를 취소했습니다: {scope.get('path')}")
+            await self._send_timeout(send)
+            await asyncio.gather(handler, return_exceptions=True)
+        except DeadlineExceeded as e:
+            if response_started.is_set() or timed_out:
+                return
+            logger.warning(f"마감 시각이 지나 요청 처리를 중단했습니다: {scope.get('path')} ({e.stage} 단계 전)")
+            await self._send_timeout(send)
+        except asyncio.CancelledError:
+            handler.cancel()
+            raise
+        finally:
+            started_waiter.cancel()
+
+    @staticmethod
+    async def _send_timeout(send):
+        body = json.dumps({"detail": "요청 처리 마감 시각이 지났습니다."}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
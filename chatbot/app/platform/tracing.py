@@ -0,0 +1,331 @@
+# tracing.py
+import os
+import json
+import time
+import queue
+import atexit
+import random
+import inspect
+import logging
+import functools
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# W3C Trace Context 헤더
+TRACEPARENT_HEADER = "traceparent"
+
+# OTLP span kind 값
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """서비스 사이에 전달되는 추적 컨텍스트 (trace id, span id, 샘플링 여부)"""
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """traceparent 헤더 값(00-{trace_id}-{span_id}-{flags})을 파싱합니다. 형식이 잘못되었으면 None을 반환합니다."""
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3][:2], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return SpanContext(parts[1], parts[2], bool(flags & 1))
+
+
+@dataclass
+class Span:
+    """처리 구간 하나의 시작/종료 시각과 속성"""
+    name: str
+    context: SpanContext
+    parent_span_id: Optional[str]
+    kind: str
+    service: str
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException):
+        self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": self.service,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class SpanExporter(ABC):
+    """
+    종료된 span을 모아 백그라운드 스레드에서 내보내는 기본 클래스
+
+    요청 처리 경로에서는 큐에 넣기만 하고, 큐가 가득 차면 span을 버립니다. (dropped로 집계)
+    """
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 512, flush_interval: float = 2.0):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pid: Optional[int] = None
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def _ensure_started(self):
+        # 스레드는 fork 후에 남지 않으므로(gunicorn preload 등) 프로세스마다 처음 내보낼 때 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.max_queue)
+                self._thread = threading.Thread(target=self._worker, name="span-exporter", daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def export(self, span: Span):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self):
+        """남은 span을 내보내고 스레드를 종료합니다."""
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def _worker(self):
+        stopping = False
+        while not stopping:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            if batch:
+                try:
+                    self.write(batch)
+                except Exception as e:
+                    logger.warning(f"span 내보내기 실패 ({len(batch)}개): {e}")
+
+    @abstractmethod
+    def write(self, spans: List[Span]):
+        """span 배치를 내보냅니다. (내보내기 스레드에서 호출)"""
+
+
+class FileSpanExporter(SpanExporter):
+    """span을 JSON Lines 파일에 한 줄씩 추가합니다. (배치마다 한 번의 append 쓰기)"""
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        super().__init__(**kwargs)
+
+    def write(self, spans: List[Span]):
+        data = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(data)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """span을 OTLP/HTTP JSON 형식으로 collector({endpoint}/v1/traces)에 전송합니다."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, **kwargs):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def write(self, spans: List[Span]):
+        by_service: Dict[str, List[Dict[str, Any]]] = {}
+        for span in spans:
+            by_service.setdefault(span.service, []).append({
+                "traceId": span.context.trace_id,
+                "spanId": span.context.span_id,
+                "parentSpanId": span.parent_span_id or "",
+                "name": span.name,
+                "kind": SPAN_KINDS.get(span.kind, 1),
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            })
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+                    "scopeSpans": [{"scope": {"name": "conan.tracing"}, "spans": otlp_spans}],
+                }
+                for service, otlp_spans in by_service.items()
+            ]
+        }
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload, default=str).encode(),
+            headers={"content-type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def create_exporter() -> Optional[SpanExporter]:
+    """
+    TRACE_EXPORTER 설정에 따라 exporter를 생성합니다.
+
+    - none(기본값): span을 만들고 컨텍스트는 전달하지만 내보내지 않음
+    - file: TRACE_FILE(기본값 traces/spans.jsonl)에 JSON Lines로 저장
+    - otlp: TRACE_OTLP_ENDPOINT(기본값 http://localhost:4318)의 collector로 전송
+    """
+    kind = os.getenv("TRACE_EXPORTER", "none").lower()
+    if kind == "file":
+        return FileSpanExporter(os.getenv("TRACE_FILE", "traces/spans.jsonl"))
+    if kind == "otlp":
+        return OtlpHttpSpanExporter(os.getenv("TRACE_OTLP_ENDPOINT", "http://localhost:4318"))
+    if kind != "none":
+        logger.warning(f"지원하지 않는 TRACE_EXPORTER 값입니다: {kind}")
+    return None
+
+
+class Tracer:
+    """
+    span을 생성하고 현재 span을 contextvar로 관리합니다.
+
+    새 span은 현재 span(없으면 요청으로 받은 상위 컨텍스트)의 하위로 만들어지고,
+    상위가 없으면 TRACE_SAMPLE_RATIO 비율로 샘플링 여부를 정합니다.
+    스레드풀(run_in_threadpool)에서 실행되는 동기 코드도 컨텍스트가 복사되므로 같은 trace에 기록됩니다.
+    """
+
+    def __init__(self, service_name: str, exporter: Optional[SpanExporter], sample_ratio: float):
+        self.service_name = service_name
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def configure(self, service_name: str):
+        """
+        환경변수에서 설정을 읽습니다.
+
+        서비스가 .env를 읽은 뒤 적용되도록 임포트 시점이 아니라 TracingMiddleware 생성 시점에 호출합니다.
+        """
+        self.service_name = os.getenv("TRACE_SERVICE_NAME", service_name)
+        self.sample_ratio = float(os.getenv("TRACE_SAMPLE_RATIO", "1.0"))
+        if self.exporter is None:
+            self.exporter = create_exporter()
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", parent: Optional[SpanContext] = None, **attributes):
+        """
+        with 블록을 하나의 span으로 기록합니다. 블록에서 발생한 예외는 span에 기록한 뒤 그대로 전달합니다.
+
+        Args:
+            parent: 상위 컨텍스트. 지정하지 않으면 현재 span을 상위로 사용합니다.
+        """
+        current = _current_span.get()
+        if parent is None and current is not None:
+            parent = current.context
+        if parent is not None:
+            context = SpanContext(parent.trace_id, os.urandom(8).hex(), parent.sampled)
+        else:
+            context = SpanContext(os.urandom(16).hex(), os.urandom(8).hex(), random.random() < self.sample_ratio)
+
+        span = Span(
+            name=name,
+            context=context,
+            parent_span_id=parent.span_id if parent else None,
+            kind=kind,
+            service=self.service_name,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if context.sampled and self.exporter is not None:
+                self.exporter.export(span)
+
+    def traced(self, name: str):
+        """함수 호출 전체를 span으로 기록하는 데코레이터 (동기/비동기 함수 모두 지원)"""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+# 서비스 전역 tracer (TracingMiddleware가 생성될 때 설정을 읽음)
+tracer = Tracer(service_name="unknown", exporter=None, sample_ratio=1.0)
@@ -1,5 +1,6 @@
 from typing import Optional
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from app.domain.service.dsdcheck_service import DsdCheckService, compare_excel_and_dart_statements
 from app.domain.model.dsdcheck_schema import (
@@ -11,6 +12,7 @@ from app.domain.model.dsdcheck_schema import (
 from app.foundation.preprocess_excel_data import parse_financial_excel
 from app.platform.dart_client import DartClient
 from app.foundation.preprocess_financial_data import preprocess_financial_statements
+from app.middleware.deadline_middleware import check_deadline
 
 
 class DsdCheckController:
@@ -47,11 +49,13 @@ class DsdCheckController:
         return await self.service.parse_uploaded_excel(file)
 
     async def compare_excel_to_dart(self, file: UploadFile, corp_name: str, year: int) -> list[ComparisonResult]:
-        # 1. 엑셀 파싱
-        excel_statements, _, _ = parse_financial_excel(file)
+        # 1. 엑셀 파싱 (동기 작업은 스레드풀에서 실행하고 단계마다 마감 시각 확인)
+        excel_statements, _, _ = await run_in_threadpool(parse_financial_excel, file)
         # 2. DART 데이터 조회
-        corp_code = self.dart_client.get_corp_code_local(corp_name)
-        raw_financial_data = self.dart_client.get_all_financial_statements(corp_code, year)
+        check_deadline("dart")
+        corp_code = await run_in_threadpool(self.dart_client.get_corp_code_local, corp_name)
+        raw_financial_data = await run_in_threadpool(self.dart_client.get_all_financial_statements, corp_code, year)
         dart_statements = preprocess_financial_statements(raw_financial_data)
         # 3. 비교
+        check_deadline("compare")
         return compare_excel_and_dart_statements(excel_statements, dart_statements)
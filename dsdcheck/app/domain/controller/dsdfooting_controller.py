@@ -1,4 +1,5 @@
 from fastapi import UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from app.domain.service.dsdfooting_service import DSDFootingService
 from app.domain.model.dsdfooting_schema import FootingResponse
 import logging
@@ -34,8 +35,8 @@ class DSDFootingController:
             # 파일 컨텐츠 읽기
             contents = await file.read()
             
-            # 서비스 호출하여 검증 수행
-            result = self.service.check_footing(contents)
+            # 서비스 호출하여 검증 수행 (엑셀 파싱과 검증은 동기 작업이므로 스레드풀에서 실행)
+            result = await run_in_threadpool(self.service.check_footing, contents)
             
             logging.info(f"Successfully validated {result.total_sheets} sheets with {result.mismatch_count} mismatches")
             return result
@@ -1,6 +1,7 @@
 import logging
 from typing import Optional, List
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from app.platform.dart_client import DartClient
 from app.foundation.preprocess_financial_data import preprocess_financial_statements, validate_financial_data
@@ -13,6 +14,7 @@ from app.domain.model.dsdcheck_schema import (
     ComparisonResult
 )
 from app.foundation.compare_logic import compare_statements
+from app.middleware.deadline_middleware import check_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,8 @@ class DsdCheckService:
             전처리된 재무제표 응답 또는 None
         """
         try:
-            # 1. 기업코드 조회
-            corp_code = self.dart_client.get_corp_code_local(request.corp_name)
+            # 1. 기업코드 조회 (DART 호출과 파싱은 동기 작업이므로 스레드풀에서 실행)
+            corp_code = await run_in_threadpool(self.dart_client.get_corp_code_local, request.corp_name)
             if not corp_code:
                 logger.error(f"기업명 '{request.corp_name}'에 해당하는 기업코드를 찾을 수 없습니다.")
                 return None
@@ -43,13 +45,16 @@ class DsdCheckService:
             logger.info(f"기업코드 조회 성공: {request.corp_name} -> {corp_code}")
             
             # 2. 연결 및 별도 재무제표 조회
-            raw_financial_data = self.dart_client.get_all_financial_statements(corp_code, request.year)
+            raw_financial_data = await run_in_threadpool(
+                self.dart_client.get_all_financial_statements, corp_code, request.year
+            )
             
             if not raw_financial_data or (not raw_financial_data.get("CFS") and not raw_financial_data.get("OFS")):
                 logger.error(f"재무제표 데이터를 찾을 수 없습니다: {request.corp_name}, {request.year}")
                 return None
             
             # 3. 데이터 전처리
+            check_deadline("preprocess")
             processed_statements = preprocess_financial_statements(raw_financial_data)
             
             if not processed_statements:
@@ -89,7 +94,7 @@ class DsdCheckService:
             logger.info(f"엑셀 파일 파싱 시작: 파일명: {file.filename}")
             
             # 1. 엑셀 파일 파싱
-            statements, corp_name, year = parse_financial_excel(file)
+            statements, corp_name, year = await run_in_threadpool(parse_financial_excel, file)
             
             if not statements:
                 logger.error("엑셀 파일에서 재무제표 데이터를 추출할 수 없습니다.")
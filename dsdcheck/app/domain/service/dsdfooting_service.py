@@ -2,6 +2,7 @@ import pandas as pd
 from typing import List, Dict, Any, Tuple
 from app.domain.model.dsdfooting_schema import FootingResultItem, FootingResponse, YearlyFootingSheetResult
 from app.domain.model.validation_rules import VALIDATION_RULES
+from app.middleware.deadline_middleware import check_deadline
 import logging
 from io import BytesIO
 
@@ -181,6 +182,8 @@ class DSDFootingService:
                 # 각 시트별로 검증
                 for sheet_name in xls.sheet_names:
                     if sheet_name in self.SHEET_TITLES:
+                        # 요청 마감 시각이 지났으면 남은 시트는 검증하지 않음
+                        check_deadline(f"footing.{sheet_name}")
                         try:
                             # 연도별 데이터프레임 전처리
                             year_dfs = self._preprocess_dataframe(sheet_name, xls)
@@ -0,0 +1,201 @@
+# launcher.py
+import os
+import sys
+import argparse
+import logging
+import importlib.util
+from typing import Any, Dict, Optional
+
+import uvicorn
+
+logger = logging.getLogger("launcher")
+
+# 백엔드의 keep-alive 유지 시간은 게이트웨이 커넥션 풀의 유휴 만료 시간(기본 30초)보다 길어야
+# 서버가 먼저 닫은 커넥션을 게이트웨이가 재사용하다 실패하는 경우가 생기지 않음
+DEFAULT_KEEP_ALIVE = 65
+
+# 마스터 프로세스에 임포트되어 있으면 preload(fork)를 거부하는 모듈
+# (CUDA 컨텍스트와 OpenMP 스레드 풀은 fork 후 자식 프로세스에서 정상 동작하지 않아 워커가 멈출 수 있음)
+FORK_UNSAFE_MODULES = ("torch", "tensorflow", "jax")
+
+
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    value = os.getenv(name)
+    return default if value is None or value == "" else value
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = _env(name)
+    return default if value is None else int(value)
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop(value: str) -> str:
+    """auto이면 uvloop가 설치되어 있을 때 uvloop, 아니면 asyncio를 사용합니다."""
+    if value == "auto":
+        return "uvloop" if _installed("uvloop") else "asyncio"
+    return value
+
+
+def resolve_http(value: str) -> str:
+    """auto이면 httptools가 설치되어 있을 때 httptools, 아니면 h11을 사용합니다."""
+    if value == "auto":
+        return "httptools" if _installed("httptools") else "h11"
+    return value
+
+
+def default_workers() -> int:
+    """CPU 수만큼, 최대 4개 (모델을 올리는 서비스는 워커마다 메모리를 사용하므로 상한을 둠)"""
+    return max(1, min(os.cpu_count() or 1, 4))
+
+
+def server_options(port: int, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    환경변수에서 서버 실행 설정을 읽습니다.
+
+    SERVER_MODE가 development이면 워커 1개와 --reload로 실행하고, 그 외에는 운영 모드로 실행합니다.
+    """
+    development = _env("SERVER_MODE", "production") == "development"
+    return {
+        "development": development,
+        "host": _env("SERVER_HOST", "0.0.0.0"),
+        "port": _env_int("PORT", port),
+        "workers": 1 if development else _env_int("SERVER_WORKERS", workers or default_workers()),
+        "loop": resolve_loop(_env("SERVER_LOOP", "auto")),
+        "http": resolve_http(_env("SERVER_HTTP", "auto")),
+        "backlog": _env_int("SERVER_BACKLOG", 2048),
+        "keep_alive": _env_int("SERVER_KEEP_ALIVE", DEFAULT_KEEP_ALIVE),
+        "graceful_timeout": _env_int("SERVER_GRACEFUL_TIMEOUT", 30),
+        "worker_timeout": _env_int("SERVER_WORKER_TIMEOUT", 120),
+        "limit_concurrency": _env_int("SERVER_LIMIT_CONCURRENCY", None),
+        "max_requests": _env_int("SERVER_MAX_REQUESTS", 0),
+        "preload": _env("SERVER_PRELOAD", "0") == "1",
+        "log_level": _env("SERVER_LOG_LEVEL", "info"),
+    }
+
+
+def _uvicorn_worker_class(options: Dict[str, Any]):
+    """SERVER_LOOP, SERVER_HTTP, SERVER_LIMIT_CONCURRENCY를 uvicorn 설정으로 전달하는 gunicorn 워커 클래스"""
+    if _installed("uvicorn_worker"):
+        from uvicorn_worker import UvicornWorker
+    else:
+        from uvicorn.workers import UvicornWorker
+
+    class ConfiguredUvicornWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            **UvicornWorker.CONFIG_KWARGS,
+            "loop": options["loop"],
+            "http": options["http"],
+            "limit_concurrency": options["limit_concurrency"],
+        }
+
+    return ConfiguredUvicornWorker
+
+
+def _check_fork_safe(app_path: str):
+    """마스터 프로세스가 fork하면 안 되는 라이브러리(torch 등)를 임포트했으면 실행을 중단합니다."""
+    loaded = [module for module in FORK_UNSAFE_MODULES if module in sys.modules]
+    if loaded:
+        raise RuntimeError(
+            f"{app_path}가 {', '.join(loaded)}를 임포트하므로 preload로 워커를 fork할 수 없습니다. "
+            f"SERVER_PRELOAD=0으로 실행하세요."
+        )
+
+
+def _run_gunicorn(app_path: str, options: Dict[str, Any]):
+    """
+    gunicorn(UvicornWorker)으로 앱을 마스터 프로세스에서 한 번 로드한 뒤 워커를 fork합니다.
+
+    임포트 시점에 로드하는 데이터는 copy-on-write로 워커 간에 공유되어 워커 수만큼 메모리를 쓰지 않습니다.
+    loop/http/limit_concurrency는 워커 클래스로 전달하며, torch 등 fork에 안전하지 않은 라이브러리를
+    임포트하는 앱은 워커를 fork하기 전에 실행을 중단합니다. (GPU/torch 서비스는 preload를 사용하지 않음)
+    """
+    from gunicorn.app.base import BaseApplication
+    from uvicorn.importer import import_from_string
+
+    config = {
+        "bind": f"{options['host']}:{options['port']}",
+        "workers": options["workers"],
+        "worker_class": _uvicorn_worker_class(options),
+        "preload_app": True,
+        "backlog": options["backlog"],
+        "keepalive": options["keep_alive"],
+        "graceful_timeout": options["graceful_timeout"],
+        "timeout": options["worker_timeout"],
+        "max_requests": options["max_requests"],
+        "max_requests_jitter": options["max_requests"] // 10,
+        "loglevel": options["log_level"],
+    }
+
+    class PreloadApplication(BaseApplication):
+        def load_config(self):
+            for key, value in config.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            app = import_from_string(app_path)
+            _check_fork_safe(app_path)
+            return app
+
+    PreloadApplication().run()
+
+
+def run(app_path: str, port: int, workers: Optional[int] = None):
+    """
+    서비스를 실행합니다.
+
+    Args:
+        app_path: "app.main:app" 형식의 앱 경로 (워커 프로세스마다 다시 임포트함)
+        port: PORT 환경변수가 없을 때 사용할 포트
+        workers: SERVER_WORKERS가 없을 때 사용할 워커 수 (기본값: CPU 수, 최대 4)
+    """
+    options = server_options(port, workers)
+
+    if options["development"]:
+        logger.info(f"🛠️ 개발 모드로 실행합니다: {app_path} (port={options['port']}, reload)")
+        uvicorn.run(app_path, host=options["host"], port=options["port"], reload=True, log_level=options["log_level"])
+        return
+
+    logger.info(
+        f"🚀 운영 모드로 실행합니다: {app_path} (port={options['port']}, workers={options['workers']}, "
+        f"loop={options['loop']}, http={options['http']}, preload={options['preload']})"
+    )
+    if options["preload"] and options["workers"] > 1:
+        if _installed("gunicorn"):
+            _run_gunicorn(app_path, options)
+            return
+        logger.warning("gunicorn이 설치되지 않아 preload 없이 워커마다 앱을 로드합니다.")
+
+    uvicorn.run(
+        app_path,
+        host=options["host"],
+        port=options["port"],
+        workers=options["workers"],
+        loop=options["loop"],
+        http=options["http"],
+        backlog=options["backlog"],
+        timeout_keep_alive=options["keep_alive"],
+        timeout_graceful_shutdown=options["graceful_timeout"],
+        limit_concurrency=options["limit_concurrency"],
+        limit_max_requests=options["max_requests"] or None,
+        log_level=options["log_level"],
+    )
+
+
+def main():
+    """Dockerfile에서 사용하는 진입점: python -m app.launcher app.main:app --port 8080"""
+    parser = argparse.ArgumentParser(description="서비스 실행기")
+    parser.add_argument("app", nargs="?", default="app.main:app", help="앱 경로 (기본값: app.main:app)")
+    parser.add_argument("--port", type=int, default=8000, help="PORT 환경변수가 없을 때 사용할 포트")
+    parser.add_argument("--workers", type=int, default=None, help="SERVER_WORKERS가 없을 때 사용할 워커 수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    run(args.app, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api.dsdfooting_router import router as dsdfooting_router
 from .api.dsdcheck_router import router as dsdcheck_router
+from .middleware.deadline_middleware import DeadlineMiddleware
+from .middleware.tracing_middleware import TracingMiddleware
 
 # 환경변수 로딩
 load_dotenv()
@@ -30,10 +32,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="dsdcheck")
+
 # 라우터 등록
 app.include_router(dsdfooting_router)
 app.include_router(dsdcheck_router)
 
 @app.get("/")
 async def root():
-    return {"message": "재무제표 검증 서비스 API"} 
\ No newline at end of file
+    return {"message": "재무제표 검증 서비스 API"} 
+
+
+# 직접 실행 시 운영 모드로 실행 (SERVER_MODE=development이면 --reload)
+if __name__ == "__main__":
+    from app.launcher import run
+    run("app.main:app", port=8086)
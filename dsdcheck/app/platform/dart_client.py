@@ -5,6 +5,8 @@ from typing import Optional, List
 import logging
 
 from app.domain.model.dsdcheck_schema import DartFinancialApiResponse, DartFinancialApiItem
+from app.middleware.deadline_middleware import check_deadline, remaining_budget
+from app.platform.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,7 @@ class DartClient:
         if not self.dart_api_key:
             raise ValueError("DART_API_KEY가 환경변수에 설정되지 않았습니다.")
     
+    @tracer.traced("dart.corp_code_lookup")
     def get_corp_code_local(self, corp_name: str) -> Optional[str]:
         """
         로컬 CORPCODE.xml 파일에서 기업명으로 기업코드를 조회
@@ -57,6 +60,7 @@ class DartClient:
             logger.error(f"기업코드 조회 중 오류 발생: {e}")
             return None
     
+    @tracer.traced("dart.financial_statements")
     def get_financial_statements(self, corp_code: str, year: int, fs_div: str) -> Optional[List[DartFinancialApiItem]]:
         """
         DART API를 통해 재무제표 데이터를 조회
@@ -79,7 +83,10 @@ class DartClient:
                 "fs_div": fs_div
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            # 요청 마감 시각이 있으면 남은 시간 안에서만 기다림
+            budget = remaining_budget()
+            timeout = 30 if budget is None else max(1.0, min(30.0, budget))
+            response = requests.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -118,6 +125,7 @@ class DartClient:
         result = {}
         
         # 연결재무제표 조회
+        check_deadline("dart.financial_statements.CFS")
         cfs_data = self.get_financial_statements(corp_code, year, "CFS")
         if cfs_data:
             result["CFS"] = cfs_data
@@ -126,6 +134,7 @@ class DartClient:
             result["CFS"] = []
         
         # 별도재무제표 조회
+        check_deadline("dart.financial_statements.OFS")
         ofs_data = self.get_financial_statements(corp_code, year, "OFS")
         if ofs_data:
             result["OFS"] = ofs_data
@@ -1,5 +1,5 @@
 from app.domain.service.opendart_service import OpenDartService
-import asyncio
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, Dict, Any
 
 class DocumentFetchController:
@@ -24,11 +24,9 @@ class DocumentFetchController:
         Returns:
             Dict[str, Any]: 처리 결과 정보를 포함하는 사전
         """
-        loop = asyncio.get_event_loop()
-        
         try:
-            result = await loop.run_in_executor(
-                None, 
+            # run_in_threadpool은 요청 컨텍스트(마감 시각, trace)를 스레드로 복사함
+            result = await run_in_threadpool(
                 lambda: self.service.fetch_by_corp_code(
                     corp_code=corp_code, 
                     auto_extract=auto_extract, 
@@ -69,11 +67,8 @@ class DocumentFetchController:
         Returns:
             Dict[str, Any]: 처리 결과 정보를 포함하는 사전
         """
-        loop = asyncio.get_event_loop()
-        
         try:
-            result = await loop.run_in_executor(
-                None, 
+            result = await run_in_threadpool(
                 lambda: self.service.download_corp_code_list(
                     auto_extract=auto_extract, 
                     delete_zip=delete_zip
@@ -7,6 +7,9 @@ from dotenv import load_dotenv
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from app.foundation.xbrl_parser.corp_index import get_corp_index
+from app.platform.tracing import tracer
+
 load_dotenv()
 API_KEY = os.getenv("DART_API_KEY")
 SAVE_DIR = Path("/app/app/dart_documents")
@@ -24,6 +27,7 @@ class OpenDartRepository:
         print(f"[INFO] 저장 경로: {self.save_dir}")
         print(f"[INFO] 압축 해제 경로: {self.extract_dir}")
 
+    @tracer.traced("opendart.list")
     def get_document_info(self, corp_code: str, bsns_year: int = None, reprt_code: str = None, 
                         bgn_de: str = None, end_de: str = None, pblntf_ty: str = "A") -> Optional[str]:
         """
@@ -122,6 +126,7 @@ class OpenDartRepository:
             print(f"[ERROR] 문서 정보 조회 중 예상치 못한 오류: {e}")
             raise
 
+    @tracer.traced("opendart.download_zip")
     def download_xbrl_zip(self, rcept_no: str, reprt_code: str = "11011", filename: str = None, auto_extract: bool = True, delete_zip: bool = False, 
                          corp_code: str = None, bsns_year: int = None) -> str:
         """
@@ -209,6 +214,7 @@ class OpenDartRepository:
             print(f"[ERROR] XBRL 파일 다운로드 중 오류: {e}")
             raise
     
+    @tracer.traced("opendart.extract_zip")
     def _extract_zip_file(self, zip_path: Path, delete_zip: bool = False, 
                          corp_code: str = None, bsns_year: int = None, reprt_code: str = None) -> str:
         """
@@ -265,6 +271,9 @@ class OpenDartRepository:
             extracted_files = list(extract_dir.glob("*"))
             print(f"[INFO] 추출된 파일 수: {len(extracted_files)}")
             
+            # XBRLParser가 디렉토리를 다시 스캔하지 않도록 공시 디렉토리 인덱스 갱신
+            get_corp_index(self.extract_dir).add(extract_dir)
+            
             return str(extract_dir)
             
         except Exception as e:
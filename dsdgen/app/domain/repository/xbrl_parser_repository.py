@@ -23,6 +23,7 @@ from asyncpg.pool import Pool
 from asyncpg.exceptions import UniqueViolationError, PostgresError
 
 from app.foundation.db.asyncpg_pool import get_pool
+from app.platform.tracing import tracer
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -84,6 +85,7 @@ async def _ensure_unique_constraint(conn) -> bool:
         return False
 
 
+@tracer.traced("db.insert_dsd_source_bulk")
 async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     XBRL 파싱 결과 레코드를 dsd_source 테이블에 대량으로 삽입합니다.
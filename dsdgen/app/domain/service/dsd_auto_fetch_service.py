@@ -7,9 +7,12 @@ import logging
 import asyncio
 from datetime import datetime
 import json
+from fastapi.concurrency import run_in_threadpool
 
 from app.domain.repository.dsdgen_r_repository import DsdgenReadRepository
 from app.domain.model.dsdgen_schema import DsdSourceSchema, DsdSourceListResponse
+from app.middleware.deadline_middleware import check_deadline
+from app.platform.tracing import tracer
 from .opendart_service import OpenDartService
 from .xbrl_parser_service import XBRLParserService
 
@@ -62,7 +65,9 @@ class DsdAutoFetchService:
         try:
             # 1. dsd_source 테이블에서 해당 기업코드 데이터 조회
             logger.info("기업코드 %s에 대한 DSD 소스 데이터 조회 시도", corp_code)
-            sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
+            with tracer.span("dsd_auto_fetch.lookup", corp_code=corp_code) as span:
+                sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
+                span.set_attribute("rows", len(sources) if sources else 0)
             
             # 2. 데이터가 있으면 그대로 반환
             if sources and len(sources) > 0:
@@ -73,9 +78,11 @@ class DsdAutoFetchService:
             # 3. 데이터가 없으면 생성 프로세스 시작
             logger.info("기업코드 %s의 DSD 소스 데이터가 없어 생성 프로세스 시작", corp_code)
             
-            # a. OpenDART에서 기업 XBRL zip 파일 다운로드 (동기 함수이므로 await 사용 안 함)
+            # a. OpenDART에서 기업 XBRL zip 파일 다운로드 (동기 함수이므로 스레드풀에서 실행)
+            check_deadline("download")
             logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 시도", corp_code)
-            zip_path = self.opendart_service.fetch_by_corp_code(corp_code)
+            with tracer.span("dsd_auto_fetch.download", corp_code=corp_code):
+                zip_path = await run_in_threadpool(self.opendart_service.fetch_by_corp_code, corp_code)
             
             if not zip_path:
                 error_msg = f"OpenDART에서 기업코드 {corp_code}의 XBRL 파일 다운로드 실패"
@@ -85,8 +92,11 @@ class DsdAutoFetchService:
             logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 성공: %s", corp_code, zip_path)
             
             # b. XBRL 파일을 파싱하여 데이터프레임으로 변환하고 DB에 저장
+            check_deadline("parse")
             logger.info("기업코드 %s의 XBRL 파일 파싱 및 DB 저장 시도", corp_code)
-            df = await self.xbrl_parser_service.get_xbrl_to_dataframe(corp_code)
+            with tracer.span("dsd_auto_fetch.parse_and_store", corp_code=corp_code) as span:
+                df = await self.xbrl_parser_service.get_xbrl_to_dataframe(corp_code)
+                span.set_attribute("rows", len(df))
             
             if df.empty:
                 error_msg = f"기업코드 {corp_code}의 XBRL 파일 파싱 결과가 비어있습니다."
@@ -96,8 +106,10 @@ class DsdAutoFetchService:
             logger.info("기업코드 %s의 XBRL 파일 파싱 및 DB 저장 성공: %d 건", corp_code, len(df))
             
             # c. DB에 저장이 끝났으므로 다시 dsd_source 테이블에서 해당 기업 데이터를 조회하고 반환
+            check_deadline("reload")
             logger.info("기업코드 %s의 DSD 소스 데이터 재조회 시도", corp_code)
-            updated_sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
+            with tracer.span("dsd_auto_fetch.reload", corp_code=corp_code):
+                updated_sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
             
             if not updated_sources or len(updated_sources) == 0:
                 error_msg = f"기업코드 {corp_code}의 DSD 소스 데이터가 DB에 저장되지 않았습니다."
@@ -1,4 +1,5 @@
 from app.domain.repository.opendart_repository import OpenDartRepository
+from app.middleware.deadline_middleware import check_deadline
 from typing import Optional
 
 class OpenDartService:
@@ -45,6 +46,7 @@ class OpenDartService:
         print(f"[INFO] 접수번호 '{rcept_no}'로 XBRL 파일 다운로드 시작")
         
         # 2. 접수번호로 XBRL 파일 다운로드 (repository 직접 호출)
+        check_deadline("opendart.download_zip")
         # 보고서 코드는 파일명 형식을 위해 고정 값 "11011" 사용
         return self.repository.download_xbrl_zip(
             rcept_no=rcept_no,
@@ -1,6 +1,7 @@
 from app.foundation.xbrl_parser.xbrl_parser import XBRLParser
 import pandas as pd
 from app.domain.repository.xbrl_parser_repository import insert_dsd_source_bulk
+from app.middleware.deadline_middleware import check_deadline
 
 class XBRLParserService:
     def __init__(self):
@@ -32,6 +33,8 @@ class XBRLParserService:
             
             # 데이터프레임이 비어있지 않다면 DB에 저장
             if not df.empty:
+                check_deadline("db_insert")
+                
                 # DataFrame을 레코드 리스트로 변환
                 records = df.to_dict(orient="records")
                 
@@ -0,0 +1,28 @@
+"""
+기본 택사노미 라벨 표 생성 도구
+
+DART XBRL 택사노미 배포 파일의 한글 라벨 링크베이스들로 label_cache가 mmap으로 여는 라벨 표를 만듭니다.
+
+    python -m app.foundation.xbrl_parser.build_labels --output /app/app/dart_documents/taxonomy/base_labels.bin <lab-ko 파일>...
+"""
+
+import sys
+import argparse
+
+from app.foundation.xbrl_parser.label_cache import build_base_table
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기본 택사노미 라벨 표 생성")
+    parser.add_argument("--output", required=True, help="생성할 라벨 표 파일 경로 (XBRL_BASE_LABELS)")
+    parser.add_argument("--lang", default="ko", help="추출할 라벨 언어 (기본값: ko)")
+    parser.add_argument("label_files", nargs="+", help="택사노미 라벨 링크베이스 파일 (앞에 지정한 파일이 우선)")
+    args = parser.parse_args()
+
+    count = build_base_table(args.label_files, args.output, args.lang)
+    print(f"[INFO] 라벨 표를 만들었습니다: {args.output} (태그 {count}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
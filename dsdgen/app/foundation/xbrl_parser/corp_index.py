@@ -0,0 +1,262 @@
+"""
+압축 해제된 공시 디렉토리 인덱스
+
+extracted 디렉토리를 서비스 시작 시 한 번 스캔하여 기업 고유번호·보고서 키별로 디렉토리와 .xbrl/lab-ko.xml 경로를 보관하고,
+OpenDartRepository가 새 공시를 압축 해제할 때마다 갱신합니다. 조회는 딕셔너리 조회 한 번으로 끝납니다.
+
+디렉토리 이름 형식 (OpenDartRepository._extract_zip_file 참고):
+    {corp_code}_{rcept_no}_{reprt_code}   접수번호(rcept_no)는 앞 8자리가 접수일(YYYYMMDD)
+    {corp_code}_{bsns_year}_{reprt_code}
+    {rcept_no}_{reprt_code}               기업 고유번호는 XBRL 파일명(entity{corp_code}_...)에서 찾음
+"""
+
+import os
+import re
+import time
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+DEFAULT_EXTRACTED_DIR = "/app/app/dart_documents/extracted"
+
+_CORP_CODE = re.compile(r"^\d{8}$")
+_RCEPT_NO = re.compile(r"^(?:19|20)\d{12}$")
+_BSNS_YEAR = re.compile(r"^(?:19|20)\d{2}$")
+_ENTITY_FILE = re.compile(r"^entity(\d{8})_")
+
+# .xbrl 파일이 없는 공시 디렉토리를 다시 확인하는 기간(초). 이 시간 동안 바뀌지 않은 디렉토리는 압축 해제가 끝난 것으로 봄
+INCOMPLETE_RECHECK_SECONDS = 600
+
+
+@dataclass
+class FilingEntry:
+    """압축 해제된 공시 디렉토리 하나"""
+    name: str
+    directory: Path
+    corp_code: Optional[str]
+    report_key: str
+    rcept_no: Optional[str]
+    reprt_code: Optional[str]
+    xbrl_path: Optional[Path]
+    label_path: Optional[Path]
+    modified_ns: int
+
+    @property
+    def filed_on(self) -> Tuple[str, str, int]:
+        """
+        최신 공시를 고르기 위한 정렬 키 (접수일, 접수번호, 압축 해제 시각)
+
+        접수번호가 없는 디렉토리(사업연도 형식)는 압축 해제 시각의 날짜를 접수일로 사용합니다.
+        """
+        if self.rcept_no:
+            return self.rcept_no[:8], self.rcept_no, self.modified_ns
+        return _date_of(self.modified_ns), "", self.modified_ns
+
+
+def _date_of(timestamp_ns: int) -> str:
+    return time.strftime("%Y%m%d", time.localtime(timestamp_ns / 1e9))
+
+
+def parse_directory_name(name: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    디렉토리 이름에서 (기업 고유번호, 보고서 키, 접수번호, 보고서 코드)를 찾습니다.
+
+    보고서 키는 접수번호가 있으면 접수번호, 없으면 사업연도입니다.
+    """
+    parts = name.split("_")
+    corp_code = rcept_no = reprt_code = report_key = None
+
+    if parts and _CORP_CODE.match(parts[0]):
+        corp_code = parts.pop(0)
+    for part in parts:
+        if rcept_no is None and _RCEPT_NO.match(part):
+            rcept_no = report_key = part
+        elif report_key is None and _BSNS_YEAR.match(part):
+            report_key = part
+        elif reprt_code is None and part.isdigit() and len(part) == 5:
+            reprt_code = part
+    return corp_code, report_key, rcept_no, reprt_code
+
+
+class CorpDirectoryIndex:
+    """
+    기업 고유번호 → 보고서 키 → 공시 디렉토리 인덱스
+
+    다른 워커 프로세스가 새 디렉토리를 추가한 경우를 위해, 조회할 때 extracted 디렉토리의 수정 시각이 바뀌었으면
+    새로 생긴 디렉토리만 추가로 스캔합니다.
+    extracted 디렉토리의 수정 시각은 압축 해제가 끝나기 전(디렉토리 생성 시점)에 바뀌므로, .xbrl 파일이 없던
+    공시 디렉토리는 조회할 때마다 디렉토리 자체의 수정 시각을 다시 확인하여 바뀌었으면 다시 스캔합니다.
+    공시가 아닌 디렉토리(corpcode_YYYYMMDD 등 이름에 보고서 키가 없는 디렉토리)는 확인하지 않으며,
+    INCOMPLETE_RECHECK_SECONDS 동안 바뀌지 않은 디렉토리는 확인 대상에서 제외합니다.
+    """
+
+    def __init__(self, base_dir: Union[str, Path]):
+        self.base_dir = Path(base_dir)
+        self._by_name: Dict[str, FilingEntry] = {}
+        self._by_corp: Dict[str, Dict[str, FilingEntry]] = {}
+        self._by_report: Dict[str, FilingEntry] = {}
+        self._latest: Dict[str, FilingEntry] = {}
+        # .xbrl 파일이 아직 없던(압축 해제 중이었을 수 있는) 디렉토리 이름
+        self._incomplete: Set[str] = set()
+        self._scanned_mtime_ns: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def build(self):
+        """extracted 디렉토리 전체를 스캔하여 인덱스를 만듭니다."""
+        with self._lock:
+            self._by_name.clear()
+            self._by_corp.clear()
+            self._by_report.clear()
+            self._latest.clear()
+            self._incomplete.clear()
+            self._scanned_mtime_ns = None
+            self._sync()
+        print(f"[INFO] 공시 디렉토리 인덱스 생성: {self.base_dir} (디렉토리 {len(self._by_name)}개, 기업 {len(self._by_corp)}개)")
+
+    def _sync(self):
+        """extracted 디렉토리의 수정 시각이 바뀌었으면 추가·삭제된 디렉토리만 반영합니다."""
+        self._refresh_incomplete()
+        try:
+            mtime_ns = self.base_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime_ns == self._scanned_mtime_ns:
+            return
+
+        names = set()
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    names.add(entry.name)
+        for name in set(self._by_name) - names:
+            self._remove(name)
+        for name in names - set(self._by_name):
+            self._add(self.base_dir / name)
+        self._scanned_mtime_ns = mtime_ns
+
+    def _refresh_incomplete(self):
+        """.xbrl 파일이 없던 디렉토리 중 수정 시각이 바뀐 디렉토리를 다시 스캔합니다."""
+        for name in list(self._incomplete):
+            entry = self._by_name.get(name)
+            if entry is None:
+                self._incomplete.discard(name)
+                continue
+            try:
+                mtime_ns = entry.directory.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._remove(name)
+                continue
+            if mtime_ns != entry.modified_ns:
+                self._remove(name)
+                self._add(entry.directory)
+            elif time.time_ns() - mtime_ns > INCOMPLETE_RECHECK_SECONDS * 1_000_000_000:
+                # 오래 바뀌지 않은 디렉토리는 .xbrl 파일이 없는 공시로 보고 더 확인하지 않음
+                self._incomplete.discard(name)
+
+    def add(self, directory: Union[str, Path]) -> Optional[FilingEntry]:
+        """새로 압축 해제한(또는 다시 압축 해제한) 디렉토리를 인덱스에 추가합니다."""
+        with self._lock:
+            directory = Path(directory)
+            self._remove(directory.name)
+            return self._add(directory)
+
+    def _add(self, directory: Path) -> Optional[FilingEntry]:
+        try:
+            stat = directory.stat()
+            file_names = sorted(entry.name for entry in os.scandir(directory) if entry.is_file())
+        except FileNotFoundError:
+            return None
+
+        xbrl_files = [name for name in file_names if name.endswith(".xbrl")]
+        label_files = [name for name in file_names if "lab-ko.xml" in name]
+        corp_code, report_key, rcept_no, reprt_code = parse_directory_name(directory.name)
+        if corp_code is None and xbrl_files:
+            match = _ENTITY_FILE.match(xbrl_files[0])
+            corp_code = match.group(1) if match else None
+
+        entry = FilingEntry(
+            name=directory.name,
+            directory=directory,
+            corp_code=corp_code,
+            report_key=report_key or directory.name,
+            rcept_no=rcept_no,
+            reprt_code=reprt_code,
+            xbrl_path=directory / xbrl_files[0] if xbrl_files else None,
+            label_path=directory / label_files[0] if label_files else None,
+            modified_ns=stat.st_mtime_ns,
+        )
+        self._by_name[entry.name] = entry
+        if entry.xbrl_path is None and report_key is not None:
+            self._incomplete.add(entry.name)
+        if rcept_no:
+            self._by_report[rcept_no] = entry
+        if corp_code:
+            self._by_corp.setdefault(corp_code, {})[entry.report_key] = entry
+            latest = self._latest.get(corp_code)
+            if latest is None or entry.filed_on > latest.filed_on:
+                self._latest[corp_code] = entry
+        return entry
+
+    def _remove(self, name: str):
+        self._incomplete.discard(name)
+        entry = self._by_name.pop(name, None)
+        if entry is None:
+            return
+        if entry.rcept_no and self._by_report.get(entry.rcept_no) is entry:
+            del self._by_report[entry.rcept_no]
+        if entry.corp_code:
+            filings = self._by_corp.get(entry.corp_code, {})
+            if filings.get(entry.report_key) is entry:
+                del filings[entry.report_key]
+            if self._latest.get(entry.corp_code) is entry:
+                if filings:
+                    self._latest[entry.corp_code] = max(filings.values(), key=lambda filing: filing.filed_on)
+                else:
+                    self._latest.pop(entry.corp_code, None)
+                    self._by_corp.pop(entry.corp_code, None)
+
+    def find(self, key: str, report_key: Optional[str] = None) -> Optional[FilingEntry]:
+        """
+        공시 디렉토리를 찾습니다.
+
+        Args:
+            key: 디렉토리 이름, 기업 고유번호 또는 접수번호
+            report_key: 기업 고유번호로 찾을 때 보고서 키(접수번호 또는 사업연도). 없으면 접수일이 가장 최근인 공시
+
+        Returns:
+            FilingEntry 또는 찾지 못한 경우 None
+        """
+        with self._lock:
+            self._sync()
+            entry = self._by_name.get(key)
+            if entry is not None:
+                return entry
+            if report_key is not None:
+                return self._by_corp.get(key, {}).get(report_key)
+            return self._latest.get(key) or self._by_report.get(key)
+
+    def filings(self, corp_code: str) -> List[FilingEntry]:
+        """기업의 공시 디렉토리 목록 (최근 접수 순)"""
+        with self._lock:
+            self._sync()
+            return sorted(self._by_corp.get(corp_code, {}).values(), key=lambda filing: filing.filed_on, reverse=True)
+
+
+_indexes: Dict[Path, CorpDirectoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_corp_index(base_dir: Union[str, Path] = DEFAULT_EXTRACTED_DIR) -> CorpDirectoryIndex:
+    """extracted 디렉토리별 공유 인덱스를 반환합니다. (처음 요청할 때 전체를 스캔)"""
+    path = Path(base_dir).resolve()
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = CorpDirectoryIndex(path)
+            index.build()
+            _indexes[path] = index
+        return index
@@ -0,0 +1,159 @@
+"""
+XBRL 인스턴스 문서(.xbrl)를 스트리밍으로 한 번만 읽어 필요한 fact를 추출하는 모듈
+
+문서 전체를 트리로 올리지 않고 lxml iterparse로 요소가 닫힐 때마다 처리한 뒤 바로 비우므로,
+파일 크기와 관계없이 메모리 사용량이 일정합니다.
+같은 순회에서 xbrli:context 요소를 읽어 기간과 차원(dimension) 정보를 담은 컨텍스트 표도 만듭니다.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from lxml import etree
+
+XBRLI_NS = "http://www.xbrl.org/2003/instance"
+XBRLDI_NS = "http://xbrl.org/2006/xbrldi"
+
+_CONTEXT = f"{{{XBRLI_NS}}}context"
+_START_DATE = f"{{{XBRLI_NS}}}startDate"
+_END_DATE = f"{{{XBRLI_NS}}}endDate"
+_INSTANT = f"{{{XBRLI_NS}}}instant"
+_EXPLICIT_MEMBER = f"{{{XBRLDI_NS}}}explicitMember"
+_TYPED_MEMBER = f"{{{XBRLDI_NS}}}typedMember"
+
+# 연결/별도 재무제표 구분 축과 멤버 (축이 없으면 기본 멤버인 연결재무제표)
+CONSOLIDATION_AXIS = "ConsolidatedAndSeparateFinancialStatementsAxis"
+CONSOLIDATED_MEMBER = "ConsolidatedMember"
+SEPARATE_MEMBER = "SeparateMember"
+
+
+def _local_name(qname: str) -> str:
+    """"ifrs-full:SeparateMember" → "SeparateMember" """
+    return qname.strip().rpartition(":")[2]
+
+
+@dataclass
+class XbrlContext:
+    """
+    xbrli:context 하나의 기간과 차원 정보
+
+    dimensions는 축 로컬 이름 → 멤버 로컬 이름(typed member는 값)입니다.
+    """
+    id: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    instant: Optional[str] = None
+    dimensions: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def period_end(self) -> Optional[str]:
+        """시점(instant)이면 그 날짜, 기간이면 종료일 (YYYY-MM-DD)"""
+        return self.instant or self.end_date
+
+    @property
+    def year(self) -> Optional[str]:
+        """기간 종료일(또는 시점)이 속한 연도"""
+        period_end = self.period_end
+        return period_end[:4] if period_end else None
+
+    @property
+    def statement_scope(self) -> str:
+        """연결/별도 구분 멤버 ("ConsolidatedMember", "SeparateMember" 등)"""
+        return self.dimensions.get(CONSOLIDATION_AXIS, CONSOLIDATED_MEMBER)
+
+    @property
+    def other_dimensions(self) -> Dict[str, str]:
+        """연결/별도 구분 축을 제외한 차원 (부문, 자본 구성요소 등)"""
+        return {axis: member for axis, member in self.dimensions.items() if axis != CONSOLIDATION_AXIS}
+
+
+def parse_context(elem) -> XbrlContext:
+    """xbrli:context 요소에서 기간과 차원을 읽습니다."""
+    dimensions = {}
+    for member in elem.iter(_EXPLICIT_MEMBER, _TYPED_MEMBER):
+        axis = _local_name(member.get("dimension", ""))
+        if member.tag == _EXPLICIT_MEMBER:
+            dimensions[axis] = _local_name(member.text or "")
+        else:
+            dimensions[axis] = "".join(member.itertext()).strip()
+
+    def date(tag: str) -> Optional[str]:
+        text = elem.findtext(f".//{tag}")
+        return text.strip()[:10] if text else None
+
+    return XbrlContext(
+        id=elem.get("id", ""),
+        start_date=date(_START_DATE),
+        end_date=date(_END_DATE),
+        instant=date(_INSTANT),
+        dimensions=dimensions,
+    )
+
+
+def _group_by_prefix(qnames: Iterable[str]) -> Dict[str, List[str]]:
+    """"ifrs-full:Assets" 형식의 태그 목록을 네임스페이스 접두사별 로컬 이름 목록으로 묶습니다."""
+    by_prefix: Dict[str, List[str]] = {}
+    for qname in qnames:
+        prefix, _, local_name = qname.rpartition(":")
+        by_prefix.setdefault(prefix, []).append(local_name)
+    return by_prefix
+
+
+def _release(elem):
+    """
+    처리가 끝난 최상위 요소(루트의 자식)를 비우고 앞선 형제 요소를 트리에서 제거합니다.
+
+    context, unit, fact는 모두 루트 바로 아래에 있으므로 이 단위로 정리하면 하위 요소는 부모와 함께 해제됩니다.
+    """
+    parent = elem.getparent()
+    if parent is None or parent.getparent() is not None:
+        return
+    elem.clear(keep_tail=False)
+    while elem.getprevious() is not None:
+        del parent[0]
+
+
+def iter_facts(xbrl_path: Union[str, Path], qnames: Iterable[str],
+               contexts: Optional[Dict[str, XbrlContext]] = None) -> Iterator[Dict[str, str]]:
+    """
+    인스턴스 문서에서 지정한 태그의 fact를 문서 순서대로 반환합니다.
+
+    태그는 "접두사:로컬이름" 형식으로 지정하며, 문서에 선언된 네임스페이스 접두사로 실제 네임스페이스를 찾아
+    {namespace}local 형식의 집합을 만든 뒤 요소마다 집합 조회 한 번으로 대상 여부를 판단합니다.
+
+    Args:
+        xbrl_path: .xbrl 파일 경로
+        qnames: 추출할 태그 이름 목록 (예: "ifrs-full:CurrentAssets")
+        contexts: 지정하면 같은 순회에서 읽은 컨텍스트를 context id → XbrlContext로 채웁니다.
+                  context가 fact보다 뒤에 나올 수도 있으므로 순회가 끝난 뒤 조회해야 합니다.
+
+    Yields:
+        dict: 항목명(로컬 이름), 값, contextRef, 단위(unitRef), 소수점(decimals)
+
+    Raises:
+        lxml.etree.XMLSyntaxError: 복구할 수 없을 정도로 문서가 손상된 경우
+    """
+    by_prefix = _group_by_prefix(qnames)
+    wanted: Set[str] = set()
+
+    for event, item in etree.iterparse(str(xbrl_path), events=("start-ns", "end"), huge_tree=True, recover=True):
+        if event == "start-ns":
+            prefix, uri = item
+            for local_name in by_prefix.get(prefix, ()):
+                wanted.add(f"{{{uri}}}{local_name}")
+            continue
+
+        if item.tag == _CONTEXT:
+            if contexts is not None:
+                context = parse_context(item)
+                contexts[context.id] = context
+        elif item.tag in wanted:
+            yield {
+                "항목명": etree.QName(item).localname,
+                "값": (item.text or "").strip(),
+                "contextRef": item.get("contextRef", ""),
+                "단위": item.get("unitRef", ""),
+                "소수점": item.get("decimals", ""),
+            }
+        _release(item)
@@ -0,0 +1,336 @@
+"""
+공시 간에 공유하는 한글 라벨 캐시
+
+대부분의 DART 공시에 포함된 lab-ko.xml은 K-IFRS/DART 표준 택사노미 라벨이 대부분이고 회사 확장 라벨은 일부입니다.
+표준 택사노미 라벨은 미리 만든 라벨 표 파일(XBRL_BASE_LABELS)을 시작 시점에 mmap으로 열어 두고 필요한 항목만 찾아 읽으며,
+공시별 라벨 파일에서는 표에 없는 확장 개념의 라벨만 모아 파일 내용 해시를 키로 메모리와 디스크에 캐시합니다.
+
+라벨 표 만들기 (DART XBRL 택사노미의 한글 라벨 링크베이스 파일들로부터):
+    python -m app.foundation.xbrl_parser.build_labels --output base_labels.bin <lab-ko 파일>...
+"""
+
+import os
+import io
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from app.foundation.xbrl_parser.label_reader import LabelLinkbase, local_concept_name, pick_label, read_label_linkbase
+
+# 라벨 표 파일 형식 (리틀 엔디언)
+#   헤더: 매직, 태그 수, 역할 수, 라벨 수
+#   역할: (문자열 오프셋, 길이) × 역할 수
+#   태그: (문자열 오프셋, 길이, 첫 라벨 번호, 라벨 수) × 태그 수  ← 태그명(UTF-8 바이트) 순으로 정렬
+#   라벨: (역할 번호, 문자열 오프셋, 길이) × 라벨 수
+#   문자열: UTF-8 문자열을 이어 붙인 영역 (오프셋은 이 영역의 시작 기준)
+TABLE_MAGIC = b"XBRLLBL1"
+_HEADER = struct.Struct("<8sIII")
+_ROLE = struct.Struct("<II")
+_KEY = struct.Struct("<IIII")
+_RECORD = struct.Struct("<III")
+
+
+def write_label_table(path: Union[str, Path], labels: Dict[str, Dict[str, str]]):
+    """
+    태그명 → 역할 → 라벨 딕셔너리를 라벨 표 파일로 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        labels: 접두사를 제거한 태그명(예: CurrentAssets) → role URI → 라벨
+    """
+    blob = io.BytesIO()
+
+    def put(text: str):
+        data = text.encode("utf-8")
+        offset = blob.tell()
+        blob.write(data)
+        return offset, len(data)
+
+    role_index: Dict[str, int] = {}
+    role_entries: List[bytes] = []
+    key_entries: List[bytes] = []
+    record_entries: List[bytes] = []
+
+    for name in sorted(labels, key=lambda key: key.encode("utf-8")):
+        first_record = len(record_entries)
+        for role, text in labels[name].items():
+            if role not in role_index:
+                role_index[role] = len(role_entries)
+                role_entries.append(_ROLE.pack(*put(role)))
+            record_entries.append(_RECORD.pack(role_index[role], *put(text)))
+        key_entries.append(_KEY.pack(*put(name), first_record, len(record_entries) - first_record))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as file:
+        file.write(_HEADER.pack(TABLE_MAGIC, len(key_entries), len(role_entries), len(record_entries)))
+        file.write(b"".join(role_entries))
+        file.write(b"".join(key_entries))
+        file.write(b"".join(record_entries))
+        file.write(blob.getvalue())
+    os.replace(temp_path, path)
+
+
+class LabelTable:
+    """
+    mmap으로 연 라벨 표 (읽기 전용)
+
+    파일 전체를 메모리로 읽지 않고 조회할 때 필요한 부분만 이진 탐색으로 읽으므로,
+    여러 워커 프로세스가 같은 파일을 열어도 운영체제 페이지 캐시 하나를 공유합니다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.key_count, role_count, record_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != TABLE_MAGIC:
+            self._mm.close()
+            raise ValueError(f"라벨 표 파일 형식이 아닙니다: {self.path}")
+        self._keys_at = _HEADER.size + role_count * _ROLE.size
+        self._records_at = self._keys_at + self.key_count * _KEY.size
+        self._blob_at = self._records_at + record_count * _RECORD.size
+
+        self.roles = [self._text(*_ROLE.unpack_from(self._mm, _HEADER.size + i * _ROLE.size)) for i in range(role_count)]
+        # 공시별 캐시 키에 포함하여 표가 바뀌면 캐시를 다시 만들도록 함
+        self.fingerprint = hashlib.sha256(self._mm).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def close(self):
+        self._mm.close()
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        start = self._blob_at + offset
+        return self._mm[start:start + length]
+
+    def _text(self, offset: int, length: int) -> str:
+        return self._bytes(offset, length).decode("utf-8")
+
+    def _key(self, index: int):
+        return _KEY.unpack_from(self._mm, self._keys_at + index * _KEY.size)
+
+    def _find(self, name: str) -> int:
+        """태그의 번호를 이진 탐색으로 찾습니다. 없으면 -1을 반환합니다."""
+        target = name.encode("utf-8")
+        low, high = 0, self.key_count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, _, _ = self._key(middle)
+            if self._bytes(offset, length) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.key_count:
+            offset, length, _, _ = self._key(low)
+            if self._bytes(offset, length) == target:
+                return low
+        return -1
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) >= 0
+
+    def names(self) -> Iterator[str]:
+        for index in range(self.key_count):
+            offset, length, _, _ = self._key(index)
+            yield self._text(offset, length)
+
+    def get(self, name: str) -> Dict[str, str]:
+        """태그의 role URI → 라벨 (없으면 빈 딕셔너리)"""
+        index = self._find(name)
+        if index < 0:
+            return {}
+        _, _, first_record, record_count = self._key(index)
+        by_role = {}
+        for record in range(first_record, first_record + record_count):
+            role_index, offset, length = _RECORD.unpack_from(self._mm, self._records_at + record * _RECORD.size)
+            by_role[self.roles[role_index]] = self._text(offset, length)
+        return by_role
+
+    def label(self, name: str, role: str = "standard", fallback: bool = True) -> Optional[str]:
+        return pick_label(self.get(name), role, fallback)
+
+
+def build_base_table(label_paths: Iterable[Union[str, Path]], output: Union[str, Path], lang: str = "ko") -> int:
+    """
+    택사노미 라벨 링크베이스 파일들을 합쳐 라벨 표 파일을 만듭니다.
+
+    같은 태그·역할의 라벨이 여러 파일에 있으면 먼저 지정한 파일의 라벨을 사용합니다.
+
+    Returns:
+        int: 표에 저장한 태그 수
+    """
+    merged: Dict[str, Dict[str, str]] = {}
+    for label_path in label_paths:
+        linkbase = read_label_linkbase(label_path, lang)
+        for concept_id, by_role in linkbase.labels.items():
+            target = merged.setdefault(local_concept_name(concept_id), {})
+            for role, text in by_role.items():
+                target.setdefault(role, text)
+        print(f"[INFO] 택사노미 라벨 파일 읽음: {label_path} (개념 {len(linkbase)}개)")
+    write_label_table(output, merged)
+    return len(merged)
+
+
+class LabelCache:
+    """
+    라벨 파일 내용 해시 → 공시 라벨(LabelLinkbase) 캐시
+
+    - 기본 택사노미 표가 있으면 표에 있는 개념은 건너뛰고 확장 개념의 라벨만 파싱하여 보관합니다.
+    - 메모리에는 최근 사용한 max_entries개를 보관하고, cache_dir에 JSON으로 저장하여
+      재시작 후나 다른 워커 프로세스에서도 같은 라벨 파일을 다시 파싱하지 않습니다.
+    - run_in_threadpool 워커 스레드에서 동시에 호출되므로 메모리 캐시와 통계는 잠금으로 보호합니다.
+      (파싱과 디스크 입출력은 잠금 밖에서 수행)
+    """
+
+    def __init__(self, base_path: Optional[str] = None, cache_dir: Optional[str] = None, max_entries: int = 256):
+        self.base_path = base_path
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.base: Optional[LabelTable] = None
+        self._entries: "OrderedDict[str, LabelLinkbase]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def configure(self):
+        """
+        환경변수에서 설정을 읽고 기본 택사노미 라벨 표를 엽니다.
+
+        서비스가 .env를 읽은 뒤 적용되도록 임포트 시점이 아니라 앱 시작(lifespan) 시점에 호출합니다.
+        """
+        self.base_path = os.getenv("XBRL_BASE_LABELS", "/app/app/dart_documents/taxonomy/base_labels.bin")
+        cache_dir = os.getenv("XBRL_LABEL_CACHE_DIR", "/app/app/dart_documents/label_cache")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = int(os.getenv("XBRL_LABEL_CACHE_SIZE", "256"))
+        self.load_base()
+
+    def load_base(self):
+        """기본 택사노미 라벨 표를 mmap으로 엽니다. 파일이 없으면 공시 라벨 파일 전체를 파싱합니다."""
+        if self.base is not None or not self.base_path:
+            return
+        if not os.path.exists(self.base_path):
+            print(f"[INFO] 기본 택사노미 라벨 표가 없어 공시 라벨 파일 전체를 파싱합니다: {self.base_path}")
+            return
+        try:
+            self.base = LabelTable(self.base_path)
+            print(f"[INFO] 기본 택사노미 라벨 표를 열었습니다: {self.base_path} (태그 {len(self.base)}개)")
+        except Exception as e:
+            print(f"[ERROR] 기본 택사노미 라벨 표 로드 실패: {e}")
+
+    def _in_base(self, concept_id: str) -> bool:
+        return local_concept_name(concept_id) in self.base
+
+    def linkbase(self, label_path: Union[str, Path], lang: str = "ko") -> LabelLinkbase:
+        """
+        공시 라벨 파일의 라벨을 반환합니다. (기본 택사노미 표가 있으면 확장 개념의 라벨만 포함)
+
+        Raises:
+            lxml.etree.XMLSyntaxError: 라벨 파일을 XML로 읽을 수 없는 경우
+        """
+        data = Path(label_path).read_bytes()
+        key = f"{lang}-{hashlib.sha256(data).hexdigest()[:32]}-{self.base.fingerprint if self.base else 'full'}"
+
+        with self._lock:
+            linkbase = self._entries.get(key)
+            if linkbase is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return linkbase
+
+        linkbase = self._read_disk(key)
+        if linkbase is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            skip = self._in_base if self.base is not None else None
+            linkbase = read_label_linkbase(io.BytesIO(data), lang, skip=skip)
+            self._write_disk(key, linkbase)
+
+        with self._lock:
+            self._entries[key] = linkbase
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return linkbase
+
+    def _read_disk(self, key: str) -> Optional[LabelLinkbase]:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return LabelLinkbase(json.load(file))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[WARN] 라벨 캐시 파일을 읽을 수 없습니다: {path} ({e})")
+            return None
+
+    def _write_disk(self, key: str, linkbase: LabelLinkbase):
+        if self.cache_dir is None:
+            return
+        path = self.cache_dir / f"{key}.json"
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 같은 키를 동시에 저장하는 스레드·프로세스가 서로 다른 임시 파일을 쓰도록 mkstemp 사용
+            fd, temp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.cache_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(linkbase.labels, file, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"[WARN] 라벨 캐시 파일을 저장할 수 없습니다: {path} ({e})")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def mapping(self, linkbase: LabelLinkbase, role: str = "standard",
+                names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        태그명 → 라벨 딕셔너리를 만듭니다. 공시 라벨(확장)에 없는 태그는 기본 택사노미 표에서 찾습니다.
+
+        Args:
+            names: 필요한 태그명 목록. 지정하면 해당 태그만 반환하고, 없으면 기본 표의 모든 태그를 포함합니다.
+        """
+        extension = linkbase.mapping(role)
+        if names is None:
+            if self.base is not None:
+                for name in self.base.names():
+                    if name not in extension:
+                        extension[name] = self.base.label(name, role)
+            return extension
+
+        result = {}
+        for name in names:
+            text = extension.get(name)
+            if text is None and self.base is not None:
+                text = self.base.label(name, role)
+            if text is not None:
+                result[name] = text
+        return result
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "base_labels": len(self.base) if self.base is not None else 0,
+            }
+
+
+# 서비스 전역 라벨 캐시 (앱 시작 시 configure로 설정을 읽고 기본 택사노미 표를 엶)
+label_cache = LabelCache()
+
@@ -0,0 +1,159 @@
+"""
+XBRL 라벨 링크베이스(lab-ko.xml 등)를 스트리밍으로 한 번 읽어 개념(concept)별 라벨을 만드는 모듈
+
+labelLink마다 loc(라벨 → 개념), labelArc(from → to), label(라벨 → 역할/언어/텍스트)을 딕셔너리로 모은 뒤
+해시 조인으로 연결하므로 라벨 수와 arc 수의 곱이 아니라 합에 비례하는 시간으로 처리됩니다.
+라벨은 역할(role)별로 보관하여 표준/간략/합계 라벨을 다시 파싱하지 않고 선택할 수 있습니다.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from lxml import etree
+
+LINK_NS = "http://www.xbrl.org/2003/linkbase"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+_XLINK_LABEL = f"{{{XLINK_NS}}}label"
+_XLINK_HREF = f"{{{XLINK_NS}}}href"
+_XLINK_FROM = f"{{{XLINK_NS}}}from"
+_XLINK_TO = f"{{{XLINK_NS}}}to"
+_XLINK_ROLE = f"{{{XLINK_NS}}}role"
+
+_LOC = f"{{{LINK_NS}}}loc"
+_LABEL_ARC = f"{{{LINK_NS}}}labelArc"
+_LABEL = f"{{{LINK_NS}}}label"
+_LABEL_LINK = f"{{{LINK_NS}}}labelLink"
+
+# 자주 사용하는 라벨 역할 (짧은 이름 → role URI)
+LABEL_ROLES = {
+    "standard": "http://www.xbrl.org/2003/role/label",
+    "terse": "http://www.xbrl.org/2003/role/terseLabel",
+    "verbose": "http://www.xbrl.org/2003/role/verboseLabel",
+    "total": "http://www.xbrl.org/2003/role/totalLabel",
+    "period_start": "http://www.xbrl.org/2003/role/periodStartLabel",
+    "period_end": "http://www.xbrl.org/2003/role/periodEndLabel",
+    "negated": "http://www.xbrl.org/2009/role/negatedLabel",
+    "documentation": "http://www.xbrl.org/2003/role/documentation",
+}
+
+
+def local_concept_name(concept_id: str) -> str:
+    """개념 ID에서 네임스페이스 접두사를 제거합니다. (ifrs-full_CurrentAssets → CurrentAssets)"""
+    if '_' in concept_id:
+        return concept_id.split('_', 1)[1]
+    return concept_id
+
+
+def pick_label(by_role: Dict[str, str], role: str = "standard", fallback: bool = True) -> Optional[str]:
+    """
+    역할별 라벨 중 하나를 고릅니다.
+
+    Args:
+        role: LABEL_ROLES의 짧은 이름 또는 role URI
+        fallback: 해당 역할의 라벨이 없으면 표준 라벨, 그다음 처음 정의된 라벨을 사용
+    """
+    if not by_role:
+        return None
+    text = by_role.get(LABEL_ROLES.get(role, role))
+    if text is None and fallback:
+        text = by_role.get(LABEL_ROLES["standard"]) or next(iter(by_role.values()))
+    return text
+
+
+class LabelLinkbase:
+    """
+    개념 ID(예: ifrs-full_CurrentAssets)별 역할 → 라벨 텍스트
+
+    labels[concept_id][role_uri] = 라벨 텍스트
+    """
+
+    def __init__(self, labels: Optional[Dict[str, Dict[str, str]]] = None):
+        self.labels: Dict[str, Dict[str, str]] = labels or {}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def roles(self) -> List[str]:
+        """링크베이스에 있는 라벨 역할 목록"""
+        return sorted({role for by_role in self.labels.values() for role in by_role})
+
+    def label(self, concept_id: str, role: str = "standard", fallback: bool = True) -> Optional[str]:
+        """개념의 라벨을 반환합니다. (역할 선택은 pick_label 참고)"""
+        return pick_label(self.labels.get(concept_id, {}), role, fallback)
+
+    def mapping(self, role: str = "standard", fallback: bool = True) -> Dict[str, str]:
+        """접두사를 제거한 태그명 → 라벨 딕셔너리 (get_xbrl_tags의 항목명과 같은 형식)"""
+        result = {}
+        for concept_id in self.labels:
+            text = self.label(concept_id, role, fallback)
+            if text is not None:
+                result[local_concept_name(concept_id)] = text
+        return result
+
+
+def _join_link(locs: Dict[str, str], arcs: Iterable[Tuple[str, str]],
+               resources: Dict[str, List[Tuple[str, str]]], labels: Dict[str, Dict[str, str]]):
+    """labelLink 하나의 loc, arc, label을 해시 조인으로 연결합니다."""
+    for from_ref, to_ref in arcs:
+        concept_id = locs.get(from_ref)
+        if concept_id is None:
+            continue
+        for role, text in resources.get(to_ref, ()):
+            labels.setdefault(concept_id, {}).setdefault(role, text)
+
+
+def read_label_linkbase(label_path: Union[str, Path, BinaryIO], lang: str = "ko",
+                        skip: Optional[Callable[[str], bool]] = None) -> LabelLinkbase:
+    """
+    라벨 링크베이스 파일을 읽어 지정한 언어의 라벨을 반환합니다.
+
+    xlink:label은 labelLink 안에서만 유효하므로 labelLink가 닫힐 때마다 조인하고 요소를 해제합니다.
+
+    Args:
+        label_path: 라벨 링크베이스 파일 경로 또는 바이너리 파일 객체
+        lang: 추출할 언어 (xml:lang이 이 값이거나 "ko-KR"처럼 이 값으로 시작하는 라벨)
+        skip: 개념 ID를 받아 True를 반환하면 그 개념의 라벨은 건너뜀 (기본 택사노미 표에 이미 있는 개념 등)
+
+    Raises:
+        lxml.etree.XMLSyntaxError: 파일을 XML로 읽을 수 없는 경우
+    """
+    labels: Dict[str, Dict[str, str]] = {}
+    locs: Dict[str, str] = {}
+    arcs: List[Tuple[str, str]] = []
+    resources: Dict[str, List[Tuple[str, str]]] = {}
+
+    source = label_path if hasattr(label_path, "read") else str(label_path)
+    for _, elem in etree.iterparse(source, events=("end",), huge_tree=True):
+        tag = elem.tag
+
+        if tag == _LOC:
+            href = elem.get(_XLINK_HREF, "")
+            if "#" in href:
+                concept_id = href.rsplit("#", 1)[1]
+                if skip is None or not skip(concept_id):
+                    locs[elem.get(_XLINK_LABEL, "")] = concept_id
+        elif tag == _LABEL_ARC:
+            arcs.append((elem.get(_XLINK_FROM, ""), elem.get(_XLINK_TO, "")))
+        elif tag == _LABEL:
+            elem_lang = elem.get(XML_LANG, "")
+            if elem_lang == lang or elem_lang.startswith(lang + "-"):
+                role = elem.get(_XLINK_ROLE, LABEL_ROLES["standard"])
+                text = "".join(elem.itertext()).strip()
+                resources.setdefault(elem.get(_XLINK_LABEL, ""), []).append((role, text))
+        elif tag == _LABEL_LINK:
+            _join_link(locs, arcs, resources, labels)
+            locs, arcs, resources = {}, [], {}
+            elem.clear(keep_tail=False)
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+            continue
+        else:
+            continue
+
+        # loc, arc, label은 딕셔너리에 옮겼으므로 내용을 비움 (요소 자체는 labelLink가 닫힐 때 해제)
+        elem.clear(keep_tail=False)
+
+    return LabelLinkbase(labels)
@@ -1,9 +1,19 @@
 import re
 import os
 from pathlib import Path
-from typing import Tuple, Dict, List, Optional, Any, Union
-from bs4 import BeautifulSoup
+from typing import Tuple, Dict, Iterable, List, Optional, Any, Union
 import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+
+from app.foundation.xbrl_parser.corp_index import get_corp_index
+from app.foundation.xbrl_parser.instance_reader import SEPARATE_MEMBER, XbrlContext, iter_facts
+from app.foundation.xbrl_parser.label_cache import label_cache
+from app.foundation.xbrl_parser.label_reader import LabelLinkbase
+from app.middleware.deadline_middleware import check_deadline
+from app.platform.tracing import tracer
+
+# contextRef 이름의 회계연도 (FY2023, PFY2023, BPFY2023, CFY2023)
+_FISCAL_YEAR = re.compile(r'FY(\d{4})')
 
 
 class XBRLParser:
@@ -12,7 +22,7 @@ class XBRLParser:
     
     이 클래스는 다음과 같은 기능을 제공합니다:
     1. 파일 시스템에서 XBRL 파일을 찾고
-    2. BeautifulSoup를 사용하여 XBRL 파일을 파싱하고
+    2. XBRL 인스턴스 문서를 스트리밍으로 읽어 필요한 fact를 추출하고
     3. 파싱된 데이터를 분석하여 DataFrame으로 변환
     """
 
@@ -28,188 +38,101 @@ class XBRLParser:
         os.makedirs(self.extracted_dir, exist_ok=True)
         print(f"[INFO] XBRL 파일 경로 기본 디렉토리: {self.extracted_dir}")
 
-    async def find_xbrl_files(self, corp_code: str) -> Tuple[Optional[Path], Optional[Path], Optional[BeautifulSoup], Optional[BeautifulSoup]]:
+    @tracer.traced("xbrl.load_files")
+    async def find_xbrl_files(self, corp_code: str, report_key: Optional[str] = None) -> Tuple[Path, Optional[Path]]:
         """
-        기업 고유번호로 디렉토리를 찾고, .xbrl 파일과 lab-ko.xml 파일을 함께 찾아 파싱합니다.
+        기업 고유번호로 디렉토리를 찾고, .xbrl 파일과 lab-ko.xml 파일을 함께 찾습니다.
+        (두 파일 모두 get_xbrl_tags, get_label_linkbase에서 스트리밍으로 읽으므로 여기서는 경로만 반환합니다.)
+        
+        디렉토리는 공시 디렉토리 인덱스(corp_index)에서 찾으므로 extracted 디렉토리를 매번 스캔하지 않으며,
+        같은 기업의 공시가 여러 개이면 접수일이 가장 최근인 공시를 사용합니다.
         
         Args:
-            corp_code: 기업 고유번호
+            corp_code: 기업 고유번호 (디렉토리 이름이나 접수번호도 가능)
+            report_key: 특정 공시의 보고서 키 (접수번호 또는 사업연도, 없으면 최신 공시)
             
         Returns:
-            tuple: (xbrl_path, label_path, xbrl_soup, label_soup)
+            tuple: (xbrl_path, label_path)
             
         Raises:
             FileNotFoundError: 디렉토리나 XBRL 파일을 찾을 수 없는 경우
-            ValueError: XBRL 파일 파싱에 실패한 경우
         """
-        # 기업 고유번호로 디렉토리 찾기
-        corp_dir = None
+        filing = get_corp_index(self.extracted_dir).find(corp_code, report_key)
+        if filing is None:
+            message = f"기업 고유번호 {corp_code}에 해당하는 디렉토리를 찾을 수 없습니다: {self.extracted_dir}"
+            print(f"[ERROR] XBRL 파일 검색 실패: {message}")
+            raise FileNotFoundError(message)
+        print(f"[INFO] 기업 고유번호 {corp_code}의 디렉토리를 찾았습니다: {filing.name}")
         
-        try:
-            available_dirs = [d for d in os.listdir(self.extracted_dir) 
-                            if os.path.isdir(self.extracted_dir / d)]
-            
-            print(f"[INFO] 사용 가능한 디렉토리: {available_dirs}")
-            
-            # 기업 고유번호로 시작하는 디렉토리 찾기
-            for dir_name in available_dirs:
-                if dir_name.startswith(corp_code):
-                    corp_dir = self.extracted_dir / dir_name
-                    print(f"[INFO] 기업 고유번호 {corp_code}로 시작하는 디렉토리를 찾았습니다: {dir_name}")
-                    break
-            
-            # 정확한 디렉토리를 찾지 못한 경우
-            if corp_dir is None:
-                # 유사한 디렉토리 찾기 시도
-                for dir_name in available_dirs:
-                    if corp_code in dir_name:
-                        corp_dir = self.extracted_dir / dir_name
-                        print(f"[INFO] 기업 고유번호 {corp_code}가 포함된 디렉토리를 찾았습니다: {dir_name}")
-                        break
-                
-                # 그래도 찾지 못한 경우 가장 최근 디렉토리 사용
-                if corp_dir is None and available_dirs:
-                    dir_name = available_dirs[-1]
-                    corp_dir = self.extracted_dir / dir_name
-                    print(f"[INFO] 기업 고유번호에 맞는 디렉토리를 찾지 못해 가장 최근 디렉토리를 사용합니다: {dir_name}")
-            
-            # 디렉토리를 찾지 못한 경우
-            if corp_dir is None:
-                raise FileNotFoundError(f"추출된 디렉토리가 비어 있거나 기업 고유번호에 해당하는 디렉토리를 찾을 수 없습니다: {self.extracted_dir}")
-            
-            # 디렉토리 내의 모든 파일 목록 가져오기
-            available_files = os.listdir(corp_dir)
-            print(f"[INFO] 디렉토리 {corp_dir.name}에 있는 파일: {len(available_files)}개")
-            
-            # .xbrl 파일 찾기
-            xbrl_files = [f for f in available_files if f.endswith('.xbrl')]
-            if not xbrl_files:
-                raise FileNotFoundError(f"XBRL 파일을 찾을 수 없습니다: {corp_dir}")
-            
-            # lab-ko.xml 파일 찾기
-            label_files = [f for f in available_files if 'lab-ko.xml' in f]
-            if not label_files:
-                print(f"[WARN] lab-ko.xml 파일을 찾을 수 없습니다: {corp_dir}")
-                label_path = None
-                label_soup = None
-            else:
-                label_path = corp_dir / label_files[0]
-                print(f"[INFO] 라벨 파일을 찾았습니다: {label_path}")
-                try:
-                    with open(label_path, "r", encoding="utf-8") as file:
-                        label_content = file.read()
-                    label_soup = BeautifulSoup(label_content, 'xml')
-                    print(f"[INFO] 라벨 파일 파싱 성공")
-                except Exception as e:
-                    print(f"[ERROR] 라벨 파일 파싱 실패: {e}")
-                    label_soup = None
-                    label_path = None
-            
-            # .xbrl 파일 파싱
-            xbrl_path = corp_dir / xbrl_files[0]
-            print(f"[INFO] XBRL 파일을 찾았습니다: {xbrl_path}")
-            
-            try:
-                with open(xbrl_path, "r", encoding="utf-8") as file:
-                    xbrl_content = file.read()
-                
-                # BeautifulSoup으로 XML 파싱
-                try:
-                    xbrl_soup = BeautifulSoup(xbrl_content, 'xml')
-                    parser = 'xml'
-                except:
-                    print("[WARN] XML 파서로 파싱 실패, lxml로 재시도합니다.")
-                    xbrl_soup = BeautifulSoup(xbrl_content, 'lxml')
-                    parser = 'lxml'
-                
-                print(f"[INFO] XBRL 파일을 {parser} 파서로 파싱했습니다.")
-            except Exception as e:
-                raise ValueError(f"XBRL 파일 파싱 실패: {e}")
-            
-            return xbrl_path, label_path, xbrl_soup, label_soup
+        if filing.xbrl_path is None:
+            raise FileNotFoundError(f"XBRL 파일을 찾을 수 없습니다: {filing.directory}")
+        print(f"[INFO] XBRL 파일을 찾았습니다: {filing.xbrl_path}")
+        
+        if filing.label_path is None:
+            print(f"[WARN] lab-ko.xml 파일을 찾을 수 없습니다: {filing.directory}")
+        else:
+            print(f"[INFO] 라벨 파일을 찾았습니다: {filing.label_path}")
+        
+        return filing.xbrl_path, filing.label_path
+
+    @tracer.traced("xbrl.label_linkbase")
+    def get_label_linkbase(self, label_path: Optional[Path]) -> LabelLinkbase:
+        """
+        lab-ko.xml 파일을 읽어 개념별·역할별 한글 라벨을 반환합니다.
+        
+        같은 내용의 라벨 파일은 다시 파싱하지 않고 캐시를 사용하며, 기본 택사노미 라벨 표가 있으면
+        표에 없는 회사 확장 개념의 라벨만 포함합니다. (label_cache 참고)
+        
+        Args:
+            label_path: 라벨 파일 경로 (없으면 빈 링크베이스 반환)
             
+        Returns:
+            LabelLinkbase: 개념 ID → 역할 → 한글 라벨
+        """
+        if label_path is None:
+            return LabelLinkbase()
+        
+        try:
+            linkbase = label_cache.linkbase(label_path, lang="ko")
+            print(f"[INFO] 라벨 파일 로드 성공: 개념 {len(linkbase)}개")
+            return linkbase
         except Exception as e:
-            print(f"[ERROR] XBRL 파일 검색 및 파싱 실패: {e}")
-            raise
+            print(f"[ERROR] 라벨 파일 파싱 실패: {e}")
+            return LabelLinkbase()
 
-    def get_label_ko_mapping(self, label_soup: Optional[BeautifulSoup]) -> Dict[str, str]:
+    @tracer.traced("xbrl.label_mapping")
+    def get_label_ko_mapping(self, label_path: Optional[Path], role: str = "standard",
+                             names: Optional[Iterable[str]] = None) -> Dict[str, str]:
         """
         lab-ko.xml 파일에서 태그명과 한글 라벨 간의 매핑을 추출합니다.
         
         Args:
-            label_soup: 파싱된 라벨 파일의 BeautifulSoup 객체
+            label_path: 라벨 파일 경로
+            role: 사용할 라벨 역할 ("standard", "terse", "total" 등 또는 role URI).
+                  해당 역할의 라벨이 없는 태그는 표준 라벨을 사용합니다.
+            names: 라벨이 필요한 태그명 목록. 기본 택사노미 라벨 표에서는 이 태그만 찾습니다.
             
         Returns:
             dict: 태그명을 키로, 한글 라벨을 값으로 하는 딕셔너리
         """
-        if label_soup is None:
+        if label_path is None and label_cache.base is None:
             print("[WARN] 라벨 파일이 없어 한글 라벨 매핑을 생성할 수 없습니다.")
             return {}
         
-        try:
-            # 태그명 → 한글 라벨 매핑
-            label_mapping = {}
-            
-            # labelLink 요소 찾기
-            label_links = label_soup.find_all('labelLink')
-            if not label_links:
-                print("[WARN] labelLink 요소를 찾을 수 없습니다.")
-                return {}
-            
-            # loc 요소와 label 요소 처리
-            for label_link in label_links:
-                # loc 요소에서 xlink:href와 xlink:label 추출
-                loc_elements = label_link.find_all('loc')
-                loc_dict = {}
-                
-                for loc in loc_elements:
-                    href = loc.get('xlink:href', '')
-                    label = loc.get('xlink:label', '')
-                    
-                    # href에서 태그 이름 추출 (예: #ifrs-full_CurrentAssets)
-                    if href.startswith('#'):
-                        tag_name = href[1:]  # '#' 제거
-                        loc_dict[label] = tag_name
-                
-                # label 요소에서 xlink:label과 텍스트 추출
-                label_elements = label_link.find_all('label')
-                
-                for label_elem in label_elements:
-                    label_ref = label_elem.get('xlink:label', '')
-                    lang = label_elem.get('xml:lang', '')
-                    role = label_elem.get('xlink:role', '')
-                    
-                    # 한국어 라벨만 추출 (표준 라벨 역할 고려)
-                    if lang == 'ko' and ('label' in role or 'standard' in role.lower()):
-                        label_text = label_elem.text.strip()
-                        
-                        # labelArc 요소를 통해 loc와 label 연결
-                        label_arcs = label_link.find_all('labelArc', {'xlink:to': label_ref})
-                        
-                        for arc in label_arcs:
-                            from_ref = arc.get('xlink:from', '')
-                            if from_ref in loc_dict:
-                                tag_name = loc_dict[from_ref]
-                                
-                                # 네임스페이스 처리 (ifrs-full_CurrentAssets → CurrentAssets)
-                                if '_' in tag_name:
-                                    _, tag_name = tag_name.split('_', 1)
-                                
-                                label_mapping[tag_name] = label_text
-            
-            print(f"[INFO] 한글 라벨 매핑 {len(label_mapping)}개 생성됨")
-            return label_mapping
-            
-        except Exception as e:
-            print(f"[ERROR] 한글 라벨 매핑 추출 실패: {e}")
-            return {}
+        label_mapping = label_cache.mapping(self.get_label_linkbase(label_path), role, names)
+        print(f"[INFO] 한글 라벨 매핑 {len(label_mapping)}개 생성됨")
+        return label_mapping
 
-    def get_xbrl_tags(self, xbrl_soup: BeautifulSoup) -> List[Dict[str, str]]:
+    @tracer.traced("xbrl.extract_facts")
+    def get_xbrl_tags(self, xbrl_path: Path) -> List[Dict[str, str]]:
         """
         XBRL 파일에서 관련 태그를 추출합니다.
         
+        파일을 한 번만 순회하면서 태그 이름을 집합으로 조회하므로 태그 수와 관계없이 한 번의 파싱으로 끝나고,
+        처리한 요소는 바로 해제하여 큰 파일도 일정한 메모리로 처리합니다.
+        
         Args:
-            xbrl_soup: 파싱된 XBRL 파일의 BeautifulSoup 객체
+            xbrl_path: .xbrl 파일 경로
             
         Returns:
             list[dict]: 추출된 태그 정보 목록 (항목명, 값, contextRef, 단위, 소수점 포함)
@@ -261,51 +184,27 @@ class XBRLParser:
         try:
             print(f"[INFO] 추출할 태그 목록: {len(allowed_tags)} 개")
             
-            # 태그 이름을 정확히 매칭하여 추출
-            extracted_tags = []
-            processed_count = 0
-            filtered_count = 0
+            # 태그 이름을 정확히 매칭하여 추출 (같은 순회에서 컨텍스트 표도 생성)
+            contexts: Dict[str, XbrlContext] = {}
+            facts = list(iter_facts(xbrl_path, allowed_tags, contexts))
+            processed_count = len(facts)
             
-            for tag_name in allowed_tags:
-                # 해당 태그 이름을 가진 모든 요소 찾기
-                matching_tags = xbrl_soup.find_all(tag_name)
+            extracted_tags = []
+            for fact in facts:
+                context = contexts.get(fact["contextRef"])
+                
+                # 데이터가 모두 있는 경우만 추가
+                if context is None or not fact["값"]:
+                    continue
                 
-                if matching_tags:
-                    for tag in matching_tags:
-                        # 네임스페이스(콜론) 처리
-                        if ':' in tag.name:
-                            namespace, local_name = tag.name.split(':', 1)
-                        else:
-                            local_name = tag.name
-                        
-                        # 값 (텍스트 내용)
-                        value = tag.text.strip() if tag.text else ""
-                        
-                        # contextRef 속성
-                        context_ref = tag.get('contextRef', '')
-                        
-                        # 별도재무제표(SeparateMember)가 포함된 항목만 필터링
-                        if 'SeparateMember' not in context_ref:
-                            continue
-                        
-                        # 단위 (unitRef 속성)
-                        unit_ref = tag.get('unitRef', '')
-                        
-                        # 수치 정보에 포함된 소수점 정보 (decimals 속성)
-                        decimals = tag.get('decimals', '')
-                        
-                        # 데이터가 모두 있는 경우만 추가
-                        if value and context_ref:
-                            extracted_tags.append({
-                                "항목명": local_name,
-                                "값": value,
-                                "contextRef": context_ref,
-                                "단위": unit_ref,
-                                "소수점": decimals
-                            })
-                            processed_count += 1
-                            filtered_count += 1
+                # 별도재무제표(SeparateMember)이면서 부문 등 다른 차원이 없는 항목만 필터링
+                if context.statement_scope != SEPARATE_MEMBER or context.other_dimensions:
+                    continue
+                
+                fact["연도"] = context.year
+                extracted_tags.append(fact)
             
+            filtered_count = len(extracted_tags)
             print(f"[INFO] 추출된 총 항목 수: {processed_count}")
             print(f"[INFO] 별도재무제표(SeparateMember) 항목 수: {filtered_count}")
             return extracted_tags
@@ -316,7 +215,9 @@ class XBRLParser:
     
     def extract_year_from_context(self, context_ref: str) -> str:
         """
-        contextRef에서 회계연도를 추출합니다.
+        contextRef 이름에서 회계연도를 추출합니다.
+        
+        컨텍스트 표에서 연도를 찾지 못한 경우에만 사용합니다. (get_xbrl_tags의 "연도" 참고)
         
         Args:
             context_ref: contextRef 값 (예: "PFY2023eFY_ifrs-full_ConsolidatedAndSeparateFinancialStatementsAxis_ifrs-full_SeparateMember")
@@ -325,19 +226,10 @@ class XBRLParser:
             str: 추출된 회계연도 (예: "2023")
         """
         try:
-            # 회계연도 패턴 정규식
-            year_patterns = [
-                r'FY(\d{4})',         # FY2023
-                r'PFY(\d{4})',        # PFY2023
-                r'BPFY(\d{4})',       # BPFY2023
-                r'CFY(\d{4})',        # CFY2023
-                r'(\d{4})(?:Q[1-4])?'  # 2023 또는 2023Q1, 2023Q2 등
-            ]
-            
-            for pattern in year_patterns:
-                match = re.search(pattern, context_ref)
-                if match:
-                    return match.group(1)
+            # FY2023, PFY2023, BPFY2023, CFY2023
+            match = _FISCAL_YEAR.search(context_ref)
+            if match:
+                return match.group(1)
             
             # 일치하는 패턴이 없는 경우
             print(f"[WARN] contextRef에서 회계연도를 추출할 수 없습니다: {context_ref}")
@@ -418,13 +310,15 @@ class XBRLParser:
             print(f"[WARN] 숫자 값으로 변환할 수 없습니다: {value}")
             return "0"
         
-    async def extract_xbrl_to_dataframe(self, corp_code: str) -> pd.DataFrame:
+    @tracer.traced("xbrl.to_dataframe")
+    async def extract_xbrl_to_dataframe(self, corp_code: str, label_role: str = "standard") -> pd.DataFrame:
         """
         기업 고유번호로 디렉토리를 찾아 XBRL 파일과 lab-ko.xml 파일을 파싱하고,
         XBRL 데이터를 추출하여 정제된 DataFrame으로 변환합니다.
         
         Args:
             corp_code: 기업 고유번호 (예: 20250331002860_11011)
+            label_role: 항목명에 사용할 한글 라벨 역할 (기본값: 표준 라벨)
             
         Returns:
             pandas.DataFrame: XBRL 데이터 기업코드, 항목명, 값, 연도, 단위 정보
@@ -435,17 +329,20 @@ class XBRLParser:
         """
         try:
             # XBRL 파일과 라벨 파일 찾아서 파싱
-            _, _, xbrl_soup, label_soup = await self.find_xbrl_files(corp_code)
+            xbrl_path, label_path = await self.find_xbrl_files(corp_code)
             
-            # 태그 정보 추출
-            extracted_tags = self.get_xbrl_tags(xbrl_soup)
+            # 태그 정보 추출 (파일을 읽는 동기 작업이므로 스레드풀에서 실행)
+            check_deadline("xbrl.extract_facts")
+            extracted_tags = await run_in_threadpool(self.get_xbrl_tags, xbrl_path)
             
             if not extracted_tags:
                 print("[WARN] 추출된 태그가 없습니다.")
                 return pd.DataFrame()
             
             # 태그명 → 한글 라벨 매핑 가져오기
-            label_mapping = self.get_label_ko_mapping(label_soup)
+            item_names = {tag["항목명"] for tag in extracted_tags}
+            check_deadline("xbrl.label_mapping")
+            label_mapping = await run_in_threadpool(self.get_label_ko_mapping, label_path, label_role, item_names)
             
             # 정제된 데이터 준비
             refined_data = []
@@ -460,9 +357,8 @@ class XBRLParser:
                 decimals = tag["소수점"]
                 formatted_value = self.format_number_with_decimals(raw_value, decimals)
                 
-                # 연도 추출
-                context_ref = tag["contextRef"]
-                year = self.extract_year_from_context(context_ref)
+                # 연도 추출 (컨텍스트의 기간 종료일 기준, 없으면 contextRef 이름에서 추출)
+                year = tag.get("연도") or self.extract_year_from_context(tag["contextRef"])
                 
                 # 단위 변환 (decimals 값에 따라)
                 unit_ref = tag["단위"]
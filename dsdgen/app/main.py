@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -6,9 +7,24 @@ from .api.opendart_router import router as opendart_router
 from .api.dsdgen_router import router as dsdgen_router
 from .api.dsd_auto_fetch_router import router as dsd_auto_fetch_router
 from .api.xsldsd_router import router as xsldsd_router
+from .middleware.deadline_middleware import DeadlineMiddleware
+from .middleware.tracing_middleware import TracingMiddleware
+from .foundation.xbrl_parser.corp_index import get_corp_index
+from .foundation.xbrl_parser.label_cache import label_cache
 
 load_dotenv()
-app = FastAPI()
+
+
+# 앱 시작 시 기본 택사노미 라벨 표를 mmap으로 열어 두고 (워커 간 페이지 캐시 공유)
+# 압축 해제된 공시 디렉토리 인덱스를 만듦
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    label_cache.configure()
+    get_corp_index()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS 설정###
 app.add_middleware(
@@ -19,6 +35,12 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="dsdgen")
+
 # 라우터에 이미 prefix가 설정되어 있으므로 추가 prefix 없이 등록
 app.include_router(xbrl_parser_router)
 app.include_router(opendart_router)
@@ -30,3 +52,9 @@ app.include_router(xsldsd_router, prefix="/dsdgen")
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
+
+
+# 직접 실행 시 운영 모드로 실행 (SERVER_MODE=development이면 --reload)
+if __name__ == "__main__":
+    from app.launcher import run
+    run("app.main:app", port=8085)
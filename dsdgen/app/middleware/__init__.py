@@ -0,0 +1,3 @@
+"""
+Middleware layer - Request/response processing before reaching handlers
+""" 
\ No newline at end of file
@@ -0,0 +1,48 @@
+# tracing_middleware.py
+from starlette.datastructures import MutableHeaders
+
+from app.platform.tracing import TRACEPARENT_HEADER, parse_traceparent, tracer
+
+# 클라이언트가 로그나 span 파일에서 요청을 찾을 수 있도록 응답에 추가하는 헤더
+TRACE_ID_HEADER = "x-trace-id"
+
+
+class TracingMiddleware:
+    """
+    요청마다 server span을 만들고 현재 span으로 설정하는 ASGI 미들웨어
+
+    traceparent 헤더가 있으면 같은 trace의 하위 span으로 이어서 기록하고,
+    응답에 X-Trace-Id 헤더를 추가합니다. 5xx 응답은 오류 span으로 기록합니다.
+    """
+
+    def __init__(self, app, service_name: str):
+        self.app = app
+        tracer.configure(service_name)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope.get("headers", []):
+            if name == TRACEPARENT_HEADER.encode():
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        method = scope.get("method", "")
+        with tracer.span(f"{method} {scope['path']}", kind="server", parent=parent) as span:
+            span.set_attribute("http.method", method)
+            span.set_attribute("http.target", scope["path"])
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.status_code", status)
+                    if status >= 500:
+                        span.error = f"HTTP {status}"
+                    headers = MutableHeaders(scope=message)
+                    headers[TRACE_ID_HEADER] = span.context.trace_id
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
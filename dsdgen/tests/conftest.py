@@ -0,0 +1,6 @@
+# conftest.py
+import os
+import sys
+
+# dsdgen 디렉토리에서 `python -m pytest tests`로 실행하지 않아도 app 패키지를 임포트할 수 있도록 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,119 @@
+# test_corp_index.py
+import os
+import time
+import shutil
+
+import pytest
+
+from app.foundation.xbrl_parser.corp_index import INCOMPLETE_RECHECK_SECONDS, CorpDirectoryIndex, parse_directory_name
+
+SECOND_NS = 1_000_000_000
+
+
+def make_filing(base_dir, name, *files, mtime=None):
+    directory = base_dir / name
+    directory.mkdir()
+    for file_name in files:
+        (directory / file_name).write_text("<xbrl/>", encoding="utf-8")
+    if mtime is not None:
+        set_mtime(directory, mtime)
+    return directory
+
+
+def set_mtime(path, seconds):
+    # 파일 시스템의 시각 단위가 거칠어도 변경이 드러나도록 수정 시각을 직접 지정
+    os.utime(path, ns=(int(seconds * SECOND_NS), int(seconds * SECOND_NS)))
+
+
+def test_parse_directory_name():
+    assert parse_directory_name("00126380_20240314000123_11011") == ("00126380", "20240314000123", "20240314000123", "11011")
+    assert parse_directory_name("00126380_2023_11011") == ("00126380", "2023", None, "11011")
+    assert parse_directory_name("20240314000123_11011") == (None, "20240314000123", "20240314000123", "11011")
+    assert parse_directory_name("corpcode_20240314") == (None, None, None, None)
+
+
+@pytest.fixture
+def extracted(tmp_path):
+    base_dir = tmp_path / "extracted"
+    base_dir.mkdir()
+    now = time.time()
+    make_filing(base_dir, "00126380_20240314000123_11011", "entity00126380_2023-12-31.xbrl", "entity00126380_lab-ko.xml")
+    # 사업연도 형식은 압축 해제 시각의 날짜가 접수일이 됨
+    make_filing(base_dir, "00126380_2022_11011", "entity00126380_2022-12-31.xbrl", mtime=time.mktime((2023, 3, 10, 0, 0, 0, 0, 0, -1)))
+    make_filing(base_dir, "20230315000456_11011", "entity00164779_2022-12-31.xbrl")
+    set_mtime(base_dir, now - 60)
+    return base_dir
+
+
+def test_find_by_name_corp_code_and_rcept_no(extracted):
+    index = CorpDirectoryIndex(extracted)
+    index.build()
+    assert len(index) == 3
+
+    latest = index.find("00126380")
+    assert latest.name == "00126380_20240314000123_11011"
+    assert latest.label_path == extracted / latest.name / "entity00126380_lab-ko.xml"
+    assert index.find("00126380", "2022").name == "00126380_2022_11011"
+    assert index.find("00126380", "2021") is None
+    assert [filing.report_key for filing in index.filings("00126380")] == ["20240314000123", "2022"]
+
+    # 디렉토리 이름에 기업 고유번호가 없으면 XBRL 파일명에서 찾음
+    entry = index.find("20230315000456")
+    assert entry.corp_code == "00164779"
+    assert index.find("00164779") is entry
+    assert index.find("20230315000456_11011") is entry
+    assert index.find("99999999") is None
+
+
+def test_new_and_removed_directories_are_synced(extracted):
+    index = CorpDirectoryIndex(extracted)
+    index.build()
+
+    make_filing(extracted, "00126380_20250310000789_11011", "entity00126380_2024-12-31.xbrl")
+    shutil.rmtree(extracted / "20230315000456_11011")
+    set_mtime(extracted, time.time())
+
+    assert index.find("00126380").name == "00126380_20250310000789_11011"
+    assert index.find("00164779") is None
+    assert index.find("20230315000456") is None
+
+    shutil.rmtree(extracted / "00126380_20250310000789_11011")
+    set_mtime(extracted, time.time() + 1)
+    # 최신 공시가 삭제되면 남은 공시 중 최신 공시로 바뀜
+    assert index.find("00126380").name == "00126380_20240314000123_11011"
+
+
+def test_late_xbrl_is_picked_up_by_incomplete_rescan(extracted):
+    now = time.time()
+    directory = make_filing(extracted, "00164779_20250311000111_11011", mtime=now - 30)
+    set_mtime(extracted, now - 20)
+    index = CorpDirectoryIndex(extracted)
+    index.build()
+    assert index.find("00164779", "20250311000111").xbrl_path is None
+
+    # 압축 해제가 끝나 .xbrl 파일이 생김 (extracted 디렉토리의 수정 시각은 그대로)
+    (directory / "entity00164779_2024-12-31.xbrl").write_text("<xbrl/>", encoding="utf-8")
+    set_mtime(directory, now - 10)
+    set_mtime(extracted, now - 20)
+
+    entry = index.find("00164779", "20250311000111")
+    assert entry.xbrl_path == directory / "entity00164779_2024-12-31.xbrl"
+    assert "00164779_20250311000111_11011" not in index._incomplete
+
+
+def test_non_filing_and_stale_directories_are_not_rechecked(extracted):
+    now = time.time()
+    make_filing(extracted, "corpcode_20240314", "CORPCODE.xml")
+    make_filing(extracted, "00164779_20200311000111_11011", mtime=now - INCOMPLETE_RECHECK_SECONDS - 60)
+    make_filing(extracted, "00164779_20250311000111_11011", mtime=now - 30)
+    set_mtime(extracted, now - 20)
+
+    index = CorpDirectoryIndex(extracted)
+    index.build()
+    # 공시가 아닌 디렉토리는 처음부터 확인 대상이 아님
+    assert index._incomplete == {"00164779_20200311000111_11011", "00164779_20250311000111_11011"}
+
+    # 다음 조회에서 오래 바뀌지 않은 디렉토리는 확인 대상에서 빠짐
+    index.find("00164779")
+    assert index._incomplete == {"00164779_20250311000111_11011"}
+    assert index.find("00164779", "20200311000111") is not None
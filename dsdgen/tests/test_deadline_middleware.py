@@ -0,0 +1,126 @@
+# test_deadline_middleware.py
+import time
+import asyncio
+import threading
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware.deadline_middleware import DeadlineMiddleware, check_deadline, remaining_budget
+
+calls = []
+stage_two_started = threading.Event()
+
+
+async def fast(request):
+    calls.append("fast")
+    return JSONResponse({"ok": True})
+
+
+async def slow(request):
+    try:
+        await asyncio.sleep(5)
+    except asyncio.CancelledError:
+        calls.append("slow cancelled")
+        raise
+    return JSONResponse({"ok": True})
+
+
+def staged_work():
+    """단계 사이에서 마감 시각을 확인하는 동기 작업 (서비스의 다운로드 → 파싱 흐름과 같은 형태)"""
+    budget = remaining_budget()
+    time.sleep(0.3)
+    check_deadline("parse")
+    stage_two_started.set()
+    return budget
+
+
+async def staged(request):
+    budget = await run_in_threadpool(staged_work)
+    return JSONResponse({"budget": budget})
+
+
+async def blocking(request):
+    # 이벤트 루프를 막은 뒤 마감 시각을 확인하는 핸들러 (타이머가 먼저 실행될 수 없는 경우)
+    time.sleep(0.3)
+    check_deadline("save")
+    calls.append("saved")
+    return JSONResponse({"ok": True})
+
+
+async def stream(request):
+    async def chunks():
+        for index in range(3):
+            yield f"data: {index}\n\n".encode()
+            await asyncio.sleep(0.15)
+
+    return StreamingResponse(chunks(), media_type="text/event-stream")
+
+
+app = DeadlineMiddleware(Starlette(routes=[
+    Route("/fast", fast),
+    Route("/slow", slow),
+    Route("/staged", staged),
+    Route("/blocking", blocking),
+    Route("/stream", stream),
+]))
+client = TestClient(app)
+
+
+def deadline_in(seconds: float) -> dict:
+    return {"x-request-deadline": f"{time.time() + seconds:.3f}"}
+
+
+def setup_function():
+    calls.clear()
+    stage_two_started.clear()
+
+
+def test_request_without_deadline_passes_through():
+    response = client.get("/fast")
+    assert response.status_code == 200
+    assert calls == ["fast"]
+
+
+def test_expired_deadline_is_rejected_before_handler():
+    response = client.get("/fast", headers=deadline_in(-1))
+    assert response.status_code == 504
+    assert calls == []
+
+
+def test_slow_handler_is_cancelled_at_deadline():
+    started = time.monotonic()
+    response = client.get("/slow", headers=deadline_in(0.2))
+    assert response.status_code == 504
+    assert time.monotonic() - started < 2
+    assert calls == ["slow cancelled"]
+
+
+def test_threadpool_work_stops_at_next_stage():
+    response = client.get("/staged", headers=deadline_in(0.1))
+    assert response.status_code == 504
+    # 504를 보낸 뒤에도 스레드는 다음 단계 확인에서 멈춤
+    time.sleep(0.4)
+    assert not stage_two_started.is_set()
+
+
+def test_remaining_budget_is_visible_in_threadpool():
+    response = client.get("/staged", headers=deadline_in(5))
+    assert response.status_code == 200
+    assert 4 < response.json()["budget"] <= 5
+    assert client.get("/staged").json()["budget"] is None
+
+
+def test_check_deadline_after_blocking_returns_504():
+    response = client.get("/blocking", headers=deadline_in(0.1))
+    assert response.status_code == 504
+    assert calls == []
+
+
+def test_stream_started_before_deadline_is_not_cut():
+    response = client.get("/stream", headers=deadline_in(0.1))
+    assert response.status_code == 200
+    assert response.text.count("data:") == 3
@@ -0,0 +1,230 @@
+# test_label_cache.py
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.foundation.xbrl_parser.label_cache import LabelCache, LabelTable, build_base_table, write_label_table
+from app.foundation.xbrl_parser.label_reader import LABEL_ROLES, pick_label, read_label_linkbase
+
+STANDARD = LABEL_ROLES["standard"]
+TERSE = LABEL_ROLES["terse"]
+TOTAL = LABEL_ROLES["total"]
+
+
+def label_link(concepts, lang="ko"):
+    """(개념 ID, 역할, 텍스트) 목록으로 labelLink 하나를 만듭니다. xlink:label 이름은 링크마다 같은 값을 재사용합니다."""
+    parts = ['<link:labelLink xlink:type="extended" xlink:role="http://www.xbrl.org/2003/role/link">']
+    for index, (concept_id, role, text) in enumerate(concepts):
+        parts.append(f'<link:loc xlink:type="locator" xlink:href="x.xsd#{concept_id}" xlink:label="loc{index}"/>')
+        parts.append(
+            f'<link:label xlink:type="resource" xlink:label="lab{index}" xlink:role="{role}" xml:lang="{lang}">{text}</link:label>'
+        )
+        parts.append(
+            f'<link:labelArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/concept-label" '
+            f'xlink:from="loc{index}" xlink:to="lab{index}"/>'
+        )
+    parts.append("</link:labelLink>")
+    return "".join(parts)
+
+
+def write_linkbase(path: Path, *links: str) -> Path:
+    path.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">'
+        + "".join(links) + "</link:linkbase>",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_hash_join_scopes_xlink_labels_per_link(tmp_path):
+    # 두 링크가 같은 xlink:label 이름(loc0, lab0)을 쓰지만 링크마다 따로 연결되어야 함
+    path = write_linkbase(
+        tmp_path / "lab-ko.xml",
+        label_link([("ifrs-full_Assets", STANDARD, "자산총계"), ("ifrs-full_Assets", TOTAL, "자산 합계")]),
+        label_link([("ifrs-full_Liabilities", STANDARD, "부채총계")]),
+        label_link([("ifrs-full_Equity", STANDARD, "Equity")], lang="en"),
+        label_link([("dart_Extra", TERSE, "추가 항목")], lang="ko-KR"),
+    )
+    linkbase = read_label_linkbase(path, "ko")
+
+    assert linkbase.labels == {
+        "ifrs-full_Assets": {STANDARD: "자산총계", TOTAL: "자산 합계"},
+        "ifrs-full_Liabilities": {STANDARD: "부채총계"},
+        "dart_Extra": {TERSE: "추가 항목"},
+    }
+    assert linkbase.mapping("total") == {"Assets": "자산 합계", "Liabilities": "부채총계", "Extra": "추가 항목"}
+
+
+def test_skip_excludes_concepts(tmp_path):
+    path = write_linkbase(
+        tmp_path / "lab-ko.xml",
+        label_link([("ifrs-full_Assets", STANDARD, "자산총계"), ("entity001_Custom", STANDARD, "회사 항목")]),
+    )
+    linkbase = read_label_linkbase(path, "ko", skip=lambda concept_id: concept_id.startswith("ifrs-full_"))
+    assert list(linkbase.labels) == ["entity001_Custom"]
+
+
+def test_pick_label_fallback():
+    by_role = {TERSE: "간략", STANDARD: "표준"}
+    assert pick_label(by_role, "terse") == "간략"
+    assert pick_label(by_role, "total") == "표준"
+    assert pick_label(by_role, "total", fallback=False) is None
+    assert pick_label({TERSE: "간략"}, "total") == "간략"
+    assert pick_label({}, "standard") is None
+
+
+def test_label_table_round_trip(tmp_path):
+    labels = {
+        "Revenue": {STANDARD: "수익(매출액)"},
+        "Assets": {STANDARD: "자산총계", TOTAL: "자산 합계"},
+        "자체항목": {TERSE: "회사 고유"},
+        "CurrentAssets": {STANDARD: "유동자산"},
+    }
+    path = tmp_path / "base_labels.bin"
+    write_label_table(path, labels)
+    table = LabelTable(path)
+    try:
+        assert len(table) == 4
+        # 태그명 UTF-8 바이트 순으로 저장되어 이진 탐색이 가능해야 함
+        names = list(table.names())
+        assert names == sorted(labels, key=lambda name: name.encode("utf-8"))
+        for name, by_role in labels.items():
+            assert name in table
+            assert table.get(name) == by_role
+        assert "Liabilities" not in table
+        assert table.get("Liabilities") == {}
+        assert table.label("Assets", "total") == "자산 합계"
+        assert table.label("자체항목") == "회사 고유"
+    finally:
+        table.close()
+
+
+def test_label_table_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_table.bin"
+    path.write_bytes(b"NOTLABEL" + bytes(12))
+    with pytest.raises(ValueError):
+        LabelTable(path)
+
+
+def test_build_base_table_prefers_earlier_files(tmp_path):
+    first = write_linkbase(tmp_path / "a.xml", label_link([("ifrs-full_Assets", STANDARD, "자산총계")]))
+    second = write_linkbase(
+        tmp_path / "b.xml",
+        label_link([("ifrs-full_Assets", STANDARD, "자산"), ("dart_Goodwill", STANDARD, "영업권")]),
+    )
+    output = tmp_path / "base_labels.bin"
+    assert build_base_table([first, second], output) == 2
+    table = LabelTable(output)
+    try:
+        assert table.label("Assets") == "자산총계"
+        assert table.label("Goodwill") == "영업권"
+    finally:
+        table.close()
+
+
+@pytest.fixture
+def base_table(tmp_path):
+    path = tmp_path / "base_labels.bin"
+    write_label_table(path, {"Assets": {STANDARD: "자산총계"}, "Liabilities": {STANDARD: "부채총계"}})
+    return path
+
+
+@pytest.fixture
+def filing_labels(tmp_path):
+    return write_linkbase(
+        tmp_path / "entity001_lab-ko.xml",
+        label_link([
+            ("ifrs-full_Assets", STANDARD, "자산 (공시)"),
+            ("entity001_CustomRevenue", STANDARD, "회사 매출"),
+        ]),
+    )
+
+
+def test_cache_parses_only_extension_labels_and_joins_base(tmp_path, base_table, filing_labels):
+    cache = LabelCache(base_path=str(base_table), cache_dir=str(tmp_path / "cache"))
+    cache.load_base()
+    linkbase = cache.linkbase(filing_labels)
+
+    assert list(linkbase.labels) == ["entity001_CustomRevenue"]
+    assert cache.mapping(linkbase, names=["CustomRevenue", "Assets", "Unknown"]) == {
+        "CustomRevenue": "회사 매출",
+        "Assets": "자산총계",
+    }
+    assert cache.mapping(linkbase) == {"CustomRevenue": "회사 매출", "Assets": "자산총계", "Liabilities": "부채총계"}
+
+
+def test_cache_hits_memory_then_disk(tmp_path, base_table, filing_labels):
+    cache_dir = tmp_path / "cache"
+    cache = LabelCache(base_path=str(base_table), cache_dir=str(cache_dir))
+    cache.load_base()
+    first = cache.linkbase(filing_labels)
+    assert cache.linkbase(filing_labels) is first
+    assert (cache.stats()["misses"], cache.stats()["hits"]) == (1, 1)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+    assert not list(cache_dir.glob("*.tmp"))
+
+    # 다른 프로세스(새 인스턴스)는 디스크 캐시를 사용
+    other = LabelCache(base_path=str(base_table), cache_dir=str(cache_dir))
+    other.load_base()
+    assert other.linkbase(filing_labels).labels == first.labels
+    assert other.stats()["disk_hits"] == 1 and other.stats()["misses"] == 0
+
+
+def test_cache_key_includes_base_table(tmp_path, base_table, filing_labels):
+    cache_dir = tmp_path / "cache"
+    with_base = LabelCache(base_path=str(base_table), cache_dir=str(cache_dir))
+    with_base.load_base()
+    with_base.linkbase(filing_labels)
+
+    # 기본 표 없이 읽으면 전체 라벨이 필요하므로 기본 표가 있을 때의 캐시를 쓰지 않음
+    without_base = LabelCache(cache_dir=str(cache_dir))
+    linkbase = without_base.linkbase(filing_labels)
+    assert without_base.stats()["misses"] == 1
+    assert set(linkbase.labels) == {"ifrs-full_Assets", "entity001_CustomRevenue"}
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    paths = [
+        write_linkbase(tmp_path / f"{index}_lab-ko.xml", label_link([(f"entity_{index}", STANDARD, f"항목 {index}")]))
+        for index in range(3)
+    ]
+    cache = LabelCache(max_entries=2)
+    cache.linkbase(paths[0])
+    cache.linkbase(paths[1])
+    cache.linkbase(paths[0])  # 0을 최근 사용으로 갱신
+    cache.linkbase(paths[2])  # 1이 제거됨
+    cache.linkbase(paths[0])
+    cache.linkbase(paths[1])
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"]) == (2, 4)
+
+
+def test_cache_is_safe_across_threads(tmp_path):
+    paths = [
+        write_linkbase(tmp_path / f"{index}_lab-ko.xml", label_link([(f"entity_{index}", STANDARD, f"항목 {index}")]))
+        for index in range(8)
+    ]
+    cache = LabelCache(cache_dir=str(tmp_path / "cache"), max_entries=2)
+    errors = []
+
+    def work():
+        try:
+            for _ in range(20):
+                for path in paths:
+                    cache.linkbase(path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    stats = cache.stats()
+    assert stats["hits"] + stats["disk_hits"] + stats["misses"] == 6 * 20 * len(paths)
+    assert not list((tmp_path / "cache").glob("*.tmp"))
@@ -6,6 +6,7 @@ import os
 import openai
 from dotenv import load_dotenv
 from fastapi.concurrency import run_in_threadpool
+from app.middleware.deadline_middleware import check_deadline
 from openai import OpenAI
 
 router = APIRouter()
@@ -39,6 +40,7 @@ async def extract_text(
 async def chat_with_openai(req: ChatRequest):
     try:
         def sync_chat():
+            check_deadline("openai.chat")
             response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from app.domain.service.esgdsd_service import ESGDSDService
 from app.foundation.pdf_storage import save_temp_pdf_file, delete_temp_file
 
@@ -20,7 +21,8 @@ class ESGDSDController:
         """
         pdf_path = await save_temp_pdf_file(file)
         try:
-            result = self.service.extract_text_from_pdf(pdf_path, page_num)
+            # PDF 변환과 OCR은 동기 작업이므로 스레드풀에서 실행
+            result = await run_in_threadpool(self.service.extract_text_from_pdf, pdf_path, page_num)
             return {
                 "status": "success",
                 "data": result
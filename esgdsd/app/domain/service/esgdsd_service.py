@@ -2,6 +2,8 @@ from typing import Dict, Any
 from app.foundation.pdf_loader import convert_pdf_to_image
 from app.foundation.ocr_engine import extract_text_from_image
 from app.foundation.text_cleaner import clean_text
+from app.middleware.deadline_middleware import check_deadline
+from app.platform.tracing import tracer
 
 class ESGDSDService:
     def __init__(self):
@@ -26,15 +28,22 @@ class ESGDSDService:
                 }
         """
         # PDF를 이미지로 변환
-        image = convert_pdf_to_image(pdf_path, page_num)
+        check_deadline("pdf_to_image")
+        with tracer.span("esgdsd.pdf_to_image", page=page_num):
+            image = convert_pdf_to_image(pdf_path, page_num)
         
         # 이미지에서 텍스트 추출
-        raw_text = extract_text_from_image(image)
+        check_deadline("ocr")
+        with tracer.span("esgdsd.ocr", page=page_num) as span:
+            raw_text = extract_text_from_image(image)
+            span.set_attribute("chars", len(raw_text))
         print(f"\n=== 원본 텍스트 (페이지 {page_num}) ===")
         print(raw_text)
         
         # 텍스트 정리
-        cleaned_text = clean_text(raw_text)
+        check_deadline("clean_text")
+        with tracer.span("esgdsd.clean_text"):
+            cleaned_text = clean_text(raw_text)
         print(f"\n=== 정리된 텍스트 (페이지 {page_num}) ===")
         print(cleaned_text)
         
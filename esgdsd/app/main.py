@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.esgdsd_router import router as esgdsd_router
+from app.middleware.deadline_middleware import DeadlineMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
 
 app = FastAPI(
     title="ESG DSD Service",
@@ -17,6 +19,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="esgdsd")
+
 # 라우터 등록
 app.include_router(esgdsd_router, tags=["ESG DSD"])
 
+
+# 직접 실행 시 운영 모드로 실행 (SERVER_MODE=development이면 --reload)
+if __name__ == "__main__":
+    from app.launcher import run
+    run("app.main:app", port=8084)
@@ -0,0 +1,92 @@
+# app/api/admin_router.py
+import os
+import hmac
+import ipaddress
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.domain.service.discovery_service import service_discovery
+from app.platform.rate_limit import rate_limiter
+from app.platform.resilience import service_guards
+from app.platform.response_cache import response_cache
+from app.platform.retry import retry_budget, retry_policies
+from app.platform.singleflight import singleflight
+from app.platform.streaming import stream_limiter
+
+# 관리 API 토큰. 설정하지 않으면 게이트웨이와 같은 호스트(loopback)에서 온 요청만 허용
+ADMIN_TOKEN = os.getenv("GATEWAY_ADMIN_TOKEN", "")
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+
+def presented_admin_token(request: Request) -> Optional[str]:
+    """X-Admin-Token 또는 Authorization: Bearer 헤더의 토큰"""
+    token = request.headers.get(ADMIN_TOKEN_HEADER)
+    if token:
+        return token
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        return credentials.strip()
+    return None
+
+
+def is_loopback(host: Optional[str]) -> bool:
+    try:
+        return host is not None and ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def require_admin(request: Request):
+    """관리 API 접근 권한 확인 (토큰이 설정되어 있으면 토큰, 없으면 loopback 클라이언트만 허용)"""
+    if ADMIN_TOKEN:
+        token = presented_admin_token(request)
+        if token is None or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+            raise HTTPException(status_code=401, detail="관리 API 토큰이 없거나 올바르지 않습니다.", headers={"www-authenticate": "Bearer"})
+        return
+    if not is_loopback(request.client.host if request.client else None):
+        raise HTTPException(status_code=403, detail="관리 API는 GATEWAY_ADMIN_TOKEN을 설정하거나 게이트웨이 호스트에서만 호출할 수 있습니다.")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/cache", summary="응답 캐시 통계 조회")
+async def get_cache_stats():
+    return response_cache.stats()
+
+
+@router.delete("/cache", summary="응답 캐시 비우기")
+async def clear_cache():
+    response_cache.clear()
+    return {"message": "캐시를 비웠습니다.", "stats": response_cache.stats()}
+
+
+@router.get("/coalesce", summary="동일 GET 요청 합치기 통계 조회")
+async def get_coalesce_stats():
+    return singleflight.stats()
+
+
+@router.get("/replicas", summary="서비스별 레플리카 상태 조회")
+async def get_replica_stats():
+    return service_discovery.stats()
+
+
+@router.get("/guards", summary="서비스별 동시 실행 한도 및 서킷 브레이커 상태 조회")
+async def get_guard_stats():
+    return service_guards.stats()
+
+
+@router.get("/retries", summary="재시도 예산 및 서비스별 재시도/헤지 통계 조회")
+async def get_retry_stats():
+    return {"budget": retry_budget.stats(), "services": retry_policies.stats()}
+
+
+@router.get("/streams", summary="서비스별 SSE/WebSocket 동시 스트림 수 조회")
+async def get_stream_stats():
+    return stream_limiter.stats()
+
+
+@router.get("/rate-limits", summary="요청 한도 설정 및 거절 통계 조회")
+async def get_rate_limit_stats():
+    return rate_limiter.stats()
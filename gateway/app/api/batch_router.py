@@ -0,0 +1,26 @@
+# app/api/batch_router.py
+from fastapi import APIRouter, HTTPException, Request
+
+from app.domain.model.batch_schema import BatchRequest, BatchResponse
+from app.domain.service.batch_service import BatchService
+from app.platform.rate_limit import rate_limiter
+
+router = APIRouter(prefix="/api", tags=["gateway"])
+batch_service = BatchService()
+
+
+@router.post("/_batch", response_model=BatchResponse, summary="여러 서비스 요청을 동시에 실행")
+async def execute_batch(batch: BatchRequest, request: Request):
+    """
+    하위 요청 목록을 서비스 프록시로 동시에 실행하고 결과를 요청 순서대로 반환합니다.
+
+    - **requests**: `{method, service, path, query, body}` 목록
+    - **timeout**: 배치 전체 마감 시간(초). 마감 시각이 지난 하위 요청은 504로 기록됩니다.
+    - 요청 한도를 넘은 하위 요청은 429로 기록됩니다.
+    """
+    try:
+        batch_service.validate(batch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    client = rate_limiter.identify(request.headers.raw, request.client.host if request.client else None)
+    return await batch_service.execute(batch, request.headers.raw, client)
@@ -0,0 +1,19 @@
+# app/api/health_router.py
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.domain.service.health_service import health_prober
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health", summary="게이트웨이 생존 확인")
+async def get_health():
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="게이트웨이 및 백엔드 서비스 준비 상태 조회")
+async def get_readiness():
+    # 준비된 레플리카가 없는 서비스가 하나라도 있으면 503
+    readiness = health_prober.readiness()
+    return JSONResponse(content=readiness, status_code=200 if readiness["ready"] else 503)
@@ -0,0 +1,177 @@
+# app/api/job_router.py
+import json
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from app.domain.model.job_schema import JobStatusResponse, JobSubmitRequest
+from app.domain.model.service_type import ServiceType
+from app.domain.service.job_service import Job, JobBody, JobQueueFullError, job_manager
+from app.middleware.rate_limit_middleware import retry_after_header
+from app.platform.rate_limit import RateLimitExceeded, rate_limiter
+from app.platform.upload_stream import LimitedRequestStream, UploadTooLargeError
+
+router = APIRouter(prefix="/api", tags=["jobs"])
+
+# long-poll 최대 대기 시간(초)
+MAX_WAIT_SECONDS = 60
+
+
+def job_status(job: Job, deduplicated: bool = False) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.job_id,
+        status=job.status,
+        service=job.service,
+        method=job.method,
+        path=job.path,
+        deduplicated=deduplicated,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        expires_at=job.expires_at,
+        status_code=job.status_code,
+        error=job.error,
+        status_url=f"/api/_jobs/{job.job_id}",
+        result_url=f"/api/_jobs/{job.job_id}/result",
+    )
+
+
+def accepted_response(job: Job, deduplicated: bool) -> JSONResponse:
+    status = job_status(job, deduplicated)
+    return JSONResponse(
+        content=status.model_dump(mode="json"),
+        status_code=202,
+        headers={"location": status.status_url}
+    )
+
+
+def submit_or_raise(service: ServiceType, method: str, path: str, query, raw_headers, body, owner: str) -> JSONResponse:
+    try:
+        job, deduplicated = job_manager.submit(service, method, path, query, raw_headers, body, owner=owner)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFullError as e:
+        return queue_full_response(e)
+    return accepted_response(job, deduplicated)
+
+
+def queue_full_response(e: JobQueueFullError) -> JSONResponse:
+    return JSONResponse(content={"detail": str(e)}, status_code=503, headers={"retry-after": "5"})
+
+
+def get_job_or_404(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없거나 보관 기간이 지났습니다.")
+    return job
+
+
+@router.post("/_jobs", status_code=202, response_model=JobStatusResponse, summary="JSON 작업 제출")
+async def submit_job(job_request: JobSubmitRequest, request: Request):
+    """
+    백엔드 요청을 비동기 작업으로 제출하고 작업 ID를 즉시 반환합니다.
+
+    - **method / service / path / query / body**: 배치 요청의 하위 요청과 같은 형식
+    - 같은 요청이 진행 중이거나 성공 결과가 남아 있으면 기존 작업을 반환합니다. (`deduplicated: true`)
+    """
+    client = rate_limiter.identify(request.headers.raw, request.client.host if request.client else None)
+    try:
+        await rate_limiter.check(client, job_request.service, job_request.path)
+    except RateLimitExceeded as e:
+        return JSONResponse(content={"detail": str(e)}, status_code=429, headers={"retry-after": retry_after_header(e.retry_after)})
+
+    body = None
+    headers = [(name, value) for name, value in request.headers.raw if name.lower() != b"content-type"]
+    if job_request.body is not None:
+        body = JobBody.from_bytes(json.dumps(job_request.body, ensure_ascii=False).encode())
+        headers.append((b"content-type", b"application/json"))
+    query = [(key, str(value)) for key, value in (job_request.query or {}).items()]
+    return submit_or_raise(job_request.service, job_request.method, job_request.path, query, headers, body, client)
+
+
+@router.post("/_jobs/{service}/{path:path}", status_code=202, response_model=JobStatusResponse, summary="POST 작업 제출 (원본 본문 전달)")
+async def submit_post_job(service: ServiceType, path: str, request: Request):
+    """
+    `POST /api/{service}/{path}`와 같은 요청을 비동기 작업으로 제출합니다.
+
+    요청 본문(JSON, multipart 파일 업로드 등)과 쿼리 문자열을 그대로 보관했다가 워커가 백엔드로 전달합니다.
+    본문은 받는 즉시 크기를 확인하며, 큰 본문은 임시 파일에 보관합니다.
+    """
+    upload_stream = LimitedRequestStream(request, max_bytes=job_manager.max_body_bytes)
+    body = job_manager.new_body()
+    try:
+        upload_stream.check_declared_length()
+        # 본문을 받기 전에 대기열 여유를 확인 (Content-Length가 없으면 0으로 보고 제출 시 다시 확인)
+        declared = request.headers.get("content-length")
+        job_manager.ensure_capacity(service, int(declared) if declared and declared.isdigit() else 0)
+        async for chunk in upload_stream:
+            await body.write(chunk)
+    except UploadTooLargeError as e:
+        body.close()
+        return JSONResponse(content={"detail": str(e)}, status_code=413)
+    except JobQueueFullError as e:
+        body.close()
+        return queue_full_response(e)
+    except BaseException:
+        body.close()
+        raise
+    client = rate_limiter.identify(request.headers.raw, request.client.host if request.client else None)
+    return submit_or_raise(service, "POST", path, request.query_params.multi_items(), request.headers.raw, body if body.size else None, client)
+
+
+@router.get("/_jobs/{job_id}", response_model=JobStatusResponse, summary="작업 상태 조회")
+async def get_job(job_id: str, wait: float = Query(0, ge=0, le=MAX_WAIT_SECONDS, description="상태가 바뀔 때까지 기다릴 최대 시간(초)")):
+    job = get_job_or_404(job_id)
+    await job_manager.wait(job, wait)
+    return job_status(job)
+
+
+@router.get("/_jobs/{job_id}/result", summary="작업 결과 조회")
+async def get_job_result(job_id: str):
+    """작업이 끝났으면 백엔드 응답(상태 코드, Content-Type, 본문)을 그대로 반환하고, 끝나지 않았으면 202를 반환합니다."""
+    job = get_job_or_404(job_id)
+    if not job.finished:
+        return JSONResponse(
+            content=job_status(job).model_dump(mode="json"),
+            status_code=202,
+            headers={"retry-after": "2"}
+        )
+    if job.status_code is None:
+        return JSONResponse(content={"detail": job.error}, status_code=409 if job.status == "cancelled" else 500)
+    return Response(content=job.result_body or b"", status_code=job.status_code, headers=job.result_headers)
+
+
+@router.get("/_jobs/{job_id}/events", summary="작업 상태 변경 구독 (SSE)")
+async def stream_job_events(job_id: str, request: Request):
+    """상태가 바뀔 때마다 `status` 이벤트를 보내고, 작업이 끝나면 스트림을 닫습니다."""
+    job = get_job_or_404(job_id)
+
+    async def events():
+        last_status = None
+        while True:
+            changed = job.changed
+            status = job_status(job).model_dump_json()
+            if status != last_status:
+                yield f"event: status\ndata: {status}\n\n"
+                last_status = status
+            if job.finished or await request.is_disconnected():
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=15)
+            except asyncio.TimeoutError:
+                # 프록시 유휴 타임아웃 방지용 주석 이벤트
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"cache-control": "no-cache"})
+
+
+@router.delete("/_jobs/{job_id}", response_model=JobStatusResponse, summary="작업 취소")
+async def cancel_job(job_id: str):
+    get_job_or_404(job_id)
+    return job_status(job_manager.cancel(job_id))
+
+
+@router.get("/_jobs", summary="작업 대기열 통계 조회")
+async def get_job_stats():
+    return job_manager.stats()
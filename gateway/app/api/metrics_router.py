@@ -0,0 +1,82 @@
+# app/api/metrics_router.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.domain.service.discovery_service import service_discovery
+from app.platform.metrics import Counter, Gauge, metrics_registry
+from app.platform.resilience import CircuitBreaker, service_guards
+from app.platform.response_cache import response_cache
+from app.platform.streaming import stream_limiter
+
+router = APIRouter(tags=["admin"])
+
+# 서킷 브레이커 상태를 숫자로 표현 (0: closed, 1: half_open, 2: open)
+BREAKER_STATE_VALUES = {
+    CircuitBreaker.CLOSED: 0,
+    CircuitBreaker.HALF_OPEN: 1,
+    CircuitBreaker.OPEN: 2,
+}
+
+bulkhead_active = metrics_registry.register(Gauge(
+    "gateway_bulkhead_active_requests", "Requests holding a bulkhead slot", ("service",)))
+bulkhead_waiting = metrics_registry.register(Gauge(
+    "gateway_bulkhead_queue_depth", "Requests waiting in the bulkhead queue", ("service",)))
+bulkhead_class_active = metrics_registry.register(Gauge(
+    "gateway_bulkhead_class_active_requests", "Requests holding a bulkhead slot per priority class", ("service", "priority")))
+bulkhead_class_waiting = metrics_registry.register(Gauge(
+    "gateway_bulkhead_class_queue_depth", "Requests waiting in the bulkhead queue per priority class", ("service", "priority")))
+bulkhead_rejected = metrics_registry.register(Counter(
+    "gateway_bulkhead_rejected_total", "Requests rejected because the bulkhead queue was full or timed out", ("service",)))
+breaker_state = metrics_registry.register(Gauge(
+    "gateway_circuit_breaker_state", "Circuit breaker state (0=closed, 1=half_open, 2=open)", ("service",)))
+replica_in_flight = metrics_registry.register(Gauge(
+    "gateway_replica_in_flight_requests", "In-flight requests per replica", ("service", "replica")))
+replica_ready = metrics_registry.register(Gauge(
+    "gateway_replica_ready", "Whether the replica passed its latest health checks (1) or not (0)", ("service", "replica")))
+replica_ejected = metrics_registry.register(Gauge(
+    "gateway_replica_ejected", "Whether the replica is currently ejected (1) or not (0)", ("service", "replica")))
+active_streams = metrics_registry.register(Gauge(
+    "gateway_active_streams", "Open SSE responses and WebSocket tunnels", ("service", "kind")))
+cache_events = metrics_registry.register(Counter(
+    "gateway_cache_events_total", "Response cache events", ("event",)))
+cache_bytes = metrics_registry.register(Gauge(
+    "gateway_cache_bytes", "Bytes currently held by the response cache"))
+
+
+def collect_component_metrics():
+    """bulkhead, 서킷 브레이커, 레플리카, 캐시 상태를 게이지에 반영합니다."""
+    for service, stats in service_guards.stats().items():
+        bulkhead = stats["bulkhead"]
+        bulkhead_active.set((service,), bulkhead["active"])
+        bulkhead_waiting.set((service,), bulkhead["waiting"])
+        bulkhead_rejected.set((service,), bulkhead["rejected"] + bulkhead["timed_out"])
+        for priority, class_stats in bulkhead["classes"].items():
+            bulkhead_class_active.set((service, priority), class_stats["active"])
+            bulkhead_class_waiting.set((service, priority), class_stats["waiting"])
+        breaker_state.set((service,), BREAKER_STATE_VALUES[stats["breaker"]["state"]])
+
+    for service, replicas in service_discovery.stats().items():
+        for replica in replicas:
+            replica_in_flight.set((service, replica["url"]), replica["in_flight"])
+            replica_ejected.set((service, replica["url"]), 1 if replica["ejected"] else 0)
+            replica_ready.set((service, replica["url"]), 1 if replica["ready"] else 0)
+
+    for service, stats in stream_limiter.stats().items():
+        for kind in ("sse", "websocket"):
+            active_streams.set((service, kind), stats.get(kind, 0))
+
+    cache_stats = response_cache.stats()
+    for event in ("hits", "misses", "not_modified", "stores", "evictions", "expirations"):
+        cache_events.set((event,), cache_stats[event])
+    cache_bytes.set((), cache_stats["bytes"])
+
+
+metrics_registry.add_collector(collect_component_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus 메트릭")
+async def get_metrics():
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,44 @@
+"""
+게이트웨이 배치 요청을 위한 Pydantic 스키마 모델
+"""
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.domain.model.service_type import ServiceType
+
+
+class BatchItem(BaseModel):
+    """
+    배치에 포함되는 하위 요청
+    """
+    method: str = Field("GET", description="HTTP 메서드 (GET, POST, PUT, DELETE, PATCH)")
+    service: ServiceType = Field(..., description="대상 서비스")
+    path: str = Field(..., description="서비스 내 경로 (예: dsdgen/dsd-source)")
+    query: Optional[Dict[str, Any]] = Field(None, description="쿼리 파라미터")
+    body: Optional[Any] = Field(None, description="JSON 요청 본문")
+
+
+class BatchRequest(BaseModel):
+    """
+    배치 요청
+    """
+    requests: List[BatchItem] = Field(..., description="동시에 실행할 하위 요청 목록")
+    timeout: Optional[float] = Field(None, gt=0, description="배치 전체 마감 시간(초)")
+
+
+class BatchItemResult(BaseModel):
+    """
+    하위 요청 하나의 결과
+    """
+    index: int = Field(..., description="요청 목록에서의 순서")
+    status_code: int = Field(..., description="HTTP 상태 코드")
+    body: Any = Field(None, description="응답 본문 (JSON이면 파싱된 값, 아니면 문자열)")
+    elapsed_ms: float = Field(..., description="처리 시간(ms)")
+
+
+class BatchResponse(BaseModel):
+    """
+    배치 응답
+    """
+    responses: List[BatchItemResult] = Field(default_factory=list, description="요청 순서대로 정렬된 하위 요청 결과")
+    elapsed_ms: float = Field(..., description="배치 전체 처리 시간(ms)")
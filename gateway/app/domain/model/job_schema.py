@@ -0,0 +1,38 @@
+"""
+게이트웨이 비동기 작업(Job)을 위한 Pydantic 스키마 모델
+"""
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+from app.domain.model.service_type import ServiceType
+
+
+class JobSubmitRequest(BaseModel):
+    """
+    JSON으로 제출하는 작업 요청
+    """
+    method: str = Field("GET", description="HTTP 메서드 (GET, POST, PUT, DELETE, PATCH)")
+    service: ServiceType = Field(..., description="대상 서비스")
+    path: str = Field(..., description="서비스 내 경로 (예: dsdgen/dsd-auto-fetch)")
+    query: Optional[Dict[str, Any]] = Field(None, description="쿼리 파라미터")
+    body: Optional[Any] = Field(None, description="JSON 요청 본문")
+
+
+class JobStatusResponse(BaseModel):
+    """
+    작업 상태
+    """
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="queued, running, succeeded, failed, cancelled 중 하나")
+    service: ServiceType = Field(..., description="대상 서비스")
+    method: str = Field(..., description="HTTP 메서드")
+    path: str = Field(..., description="서비스 내 경로")
+    deduplicated: bool = Field(False, description="동일한 요청의 기존 작업을 반환한 경우 true")
+    created_at: float = Field(..., description="제출 시각 (Unix epoch 초)")
+    started_at: Optional[float] = Field(None, description="실행 시작 시각")
+    finished_at: Optional[float] = Field(None, description="실행 종료 시각")
+    expires_at: Optional[float] = Field(None, description="결과 보관 만료 시각")
+    status_code: Optional[int] = Field(None, description="백엔드 응답 상태 코드")
+    error: Optional[str] = Field(None, description="실패 사유")
+    status_url: str = Field(..., description="상태 조회 URL")
+    result_url: str = Field(..., description="결과 조회 URL")
@@ -1,42 +1,290 @@
+import json
+import math
+import time
+import asyncio
+import logging
 import httpx
-from app.domain.model.service_type import ServiceType, SERVICE_URLS
+from app.domain.model.service_type import ServiceType
+from app.domain.service.discovery_service import service_discovery, REPLICA_FAILURE_STATUS
+from app.platform.deadline import DEADLINE_HEADER, route_timeouts, parse_deadline, format_deadline
+from app.platform.http_client import CountingStream, client_registry
+from app.platform.metrics import (
+    status_class, upstream_hedges, upstream_in_flight, upstream_latency,
+    upstream_request_size, upstream_response_size, upstream_retries,
+)
+from app.platform.priority import API_KEY_HEADER, PRIORITY_HEADER, priority_classifier
+from app.platform.resilience import service_guards, BulkheadFullError, CircuitOpenError
+from app.platform.retry import IDEMPOTENT_METHODS, retry_budget, retry_policies
+from app.platform.tracing import TRACEPARENT_HEADER, tracer
+from app.platform.upload_stream import UploadTooLargeError
+
+logger = logging.getLogger("gateway-api")
 
 class ServiceProxyFactory:
     """서비스 프록시 팩토리 클래스"""
     
     def __init__(self, service_type: ServiceType):
         self.service_type = service_type
-        self.base_url = SERVICE_URLS.get(service_type)
-        if not self.base_url:
+        if not service_discovery.has_replicas(service_type):
             raise ValueError(f"서비스 {service_type}에 대한 기본 URL이 구성되지 않았습니다.")
     
-    async def request(self, method: str, path: str, headers=None, body=None, files=None, params=None, data=None, timeout=30):
-        """지정된 서비스에 요청을 전달합니다."""
-        url = f"{self.base_url}/{path}"
-        
+    async def request(self, method: str, path: str, headers=None, body=None, files=None, params=None, data=None, timeout=None, stream=False, stream_idle_timeout=None):
+        """
+        지정된 서비스에 요청을 전달합니다.
+
+        timeout을 지정하지 않으면 라우트별 타임아웃(GATEWAY_ROUTE_TIMEOUTS)을 사용하고,
+        마감 시각을 X-Request-Deadline 헤더로 백엔드에 전달합니다.
+        stream=True이면 응답 본문을 읽지 않은 상태로 반환합니다.
+        호출자는 본문을 모두 소비한 뒤 response.aclose()로 커넥션을 반환해야 합니다.
+        stream_idle_timeout을 지정하면 응답 헤더 이후에는 마감 시각 대신 청크 사이의 유휴 시간만 제한합니다. (SSE 등)
+        """
         # 헤더 처리
         clean_headers = {}
+        incoming_deadline = None
+        declared_length = None
+        priority_value = api_key = None
         if headers:
             for name, value in headers:
-                if name.decode().lower() not in ['host', 'content-length']:
+                lower_name = name.decode().lower()
+                # 게이트웨이 자격 증명(X-API-Key)과 우선순위 헤더는 게이트웨이에서만 사용하고 백엔드에 전달하지 않음
+                if lower_name == PRIORITY_HEADER:
+                    priority_value = value.decode()
+                elif lower_name == API_KEY_HEADER:
+                    api_key = value.decode()
+                elif lower_name == DEADLINE_HEADER:
+                    incoming_deadline = parse_deadline(value.decode())
+                elif lower_name == 'content-length' and value.isdigit():
+                    declared_length = int(value)
+                elif lower_name not in ['host', 'content-length', TRACEPARENT_HEADER]:
                     clean_headers[name.decode()] = value.decode()
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=clean_headers,
-                    content=body,
-                    files=files,
-                    params=params,
-                    data=data
+        # 요청 마감 시각 계산 (대기열에서 기다린 시간도 마감 시각에 포함)
+        if timeout is None:
+            deadline = route_timeouts.deadline_for(self.service_type, path, incoming_deadline)
+        else:
+            deadline = time.time() + timeout
+            if incoming_deadline is not None:
+                deadline = min(deadline, incoming_deadline)
+        
+        # 서비스별 동시 실행 한도 및 서킷 브레이커 확인 (초과 시 즉시 503)
+        # 대기열에서는 우선순위 등급별 가중치에 따라 순서가 정해짐
+        priority = priority_classifier.classify(priority_value, api_key)
+        guard = service_guards.get(self.service_type)
+        try:
+            with tracer.span("admission", service=self.service_type.value, priority=priority):
+                await guard.enter(priority)
+        except (BulkheadFullError, CircuitOpenError) as e:
+            return self._unavailable_response(e)
+        
+        # 대기 중에 마감 시각이 지난 경우 백엔드로 보내지 않음
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            guard.exit(None, 0.0, priority)
+            return self._timeout_response()
+        clean_headers[DEADLINE_HEADER] = format_deadline(deadline)
+        
+        # 서비스별 공유 클라이언트 사용 (keep-alive 커넥션 재사용)
+        client = client_registry.get(self.service_type)
+        policy = retry_policies.get(self.service_type)
+        retry_budget.record_request()
+        # 스트림 본문(업로드)은 다시 보낼 수 없으므로 재시도/헤지 대상에서 제외
+        replayable = files is None and (body is None or isinstance(body, (bytes, bytearray, str)))
+
+        response = None
+        success = None
+        started = time.monotonic()
+        try:
+            replica = None
+            retry_number = 0
+            while True:
+                # 진행 중인 요청이 가장 적은 레플리카 선택 (재시도는 직전 레플리카 제외)
+                replica = service_discovery.pick(self.service_type, exclude=replica)
+                response, success, error = await self._send(
+                    client, policy, replica, method, path, clean_headers,
+                    body, files, params, data, deadline, stream, stream_idle_timeout, replayable
                 )
-                return response
-            except Exception as e:
-                # 예외 발생 시 에러 응답 반환
-                error_response = httpx.Response(
-                    status_code=500,
-                    content=f"서비스 요청 중 오류 발생: {str(e)}".encode()
+                if success or not replayable or retry_number >= policy.max_retries:
+                    break
+                if not policy.should_retry(method, error, None if error else response.status_code):
+                    break
+                delay = policy.backoff(retry_number)
+                if deadline - time.time() <= delay or not retry_budget.try_withdraw():
+                    break
+
+                await response.aclose()
+                retry_number += 1
+                policy.retries += 1
+                upstream_retries.inc((self.service_type.value,))
+                reason = type(error).__name__ if error else f"HTTP {response.status_code}"
+                logger.info(
+                    f"🔁 재시도 {retry_number}/{policy.max_retries}: 서비스={self.service_type.value}, "
+                    f"경로={path}, 원인={reason}, 대기={delay:.3f}초"
                 )
-                return error_response
+                await asyncio.sleep(delay)
+        finally:
+            # 취소된 요청은 서킷 브레이커에 성공/실패로 기록하지 않음
+            guard.exit(success, time.monotonic() - started, priority)
+
+        self._record_metrics(method, response, time.monotonic() - started, body, declared_length)
+        return response
+
+    async def _send(self, client, policy, replica, method, path, headers, body, files, params, data, deadline, stream, stream_idle_timeout, replayable):
+        """
+        요청을 한 번 보냅니다. 헤지가 켜져 있으면 p95 지연 시간이 지나도 응답이 없을 때 다른 레플리카로 한 번 더 보내고
+        먼저 성공한 응답을 사용합니다.
+
+        Returns:
+            (응답, 성공 여부, 예외) 튜플
+        """
+        send_args = (client, policy, method, path, headers, body, files, params, data, deadline, stream, stream_idle_timeout)
+        hedge_delay = policy.hedge_delay() if replayable and method.upper() in IDEMPOTENT_METHODS else None
+        if hedge_delay is None or len(service_discovery.replicas(self.service_type)) < 2:
+            return await self._send_once(replica, *send_args)
+
+        tasks = [asyncio.ensure_future(self._send_once(replica, *send_args))]
+        result = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done or not retry_budget.try_withdraw():
+                result = await tasks[0]
+                return result
+
+            hedge_replica = service_discovery.pick(self.service_type, exclude=replica)
+            policy.hedges += 1
+            upstream_hedges.inc((self.service_type.value,))
+            tasks.append(asyncio.ensure_future(self._send_once(hedge_replica, *send_args)))
+
+            pending = set(tasks)
+            winner = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    candidate = task.result()
+                    if result is None or (candidate[1] and not result[1]):
+                        if result is not None:
+                            await result[0].aclose()
+                        result, winner = candidate, task
+                    else:
+                        await candidate[0].aclose()
+                if result[1]:
+                    break
+            if winner is tasks[1]:
+                policy.hedge_wins += 1
+            return result
+        finally:
+            # 늦게 끝난 요청은 취소하고, 취소 직전에 받은 응답이 있으면 커넥션을 반환
+            late = [task for task in tasks if not task.done()]
+            for task in late:
+                task.cancel()
+            for outcome in await asyncio.gather(*late, return_exceptions=True):
+                if isinstance(outcome, tuple) and (result is None or outcome[0] is not result[0]):
+                    await outcome[0].aclose()
+
+    async def _send_once(self, replica, client, policy, method, path, headers, body, files, params, data, deadline, stream, stream_idle_timeout=None):
+        """선택한 레플리카로 요청을 한 번 보내고 (응답, 성공 여부, 예외)를 반환합니다."""
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return self._timeout_response(), False, None
+
+        # 업스트림 호출 한 번(재시도/헤지 포함 각각)을 client span으로 기록하고 백엔드에 traceparent로 전달
+        with tracer.span(
+            f"{method} {self.service_type.value}",
+            kind="client",
+            **{"http.method": method, "http.target": f"/{path}", "replica": replica.url},
+        ) as span:
+            headers = {**headers, TRACEPARENT_HEADER: span.context.traceparent()}
+            response, success, error = await self._send_upstream(replica, client, policy, method, path, headers, body, files, params, data, remaining, stream, stream_idle_timeout)
+            span.set_attribute("http.status_code", response.status_code)
+            if error is not None:
+                span.record_error(error)
+            elif not success:
+                span.error = f"HTTP {response.status_code}"
+            return response, success, error
+
+    async def _send_upstream(self, replica, client, policy, method, path, headers, body, files, params, data, remaining, stream, stream_idle_timeout):
+        """레플리카의 진행 중 요청 수와 지연 시간을 기록하며 요청을 보냅니다."""
+        service_discovery.acquire(replica)
+        upstream_in_flight.inc((self.service_type.value,))
+        success = None
+        started = time.monotonic()
+        try:
+            upstream_request = client.build_request(
+                method=method,
+                url=f"{replica.url}/{path}",
+                headers=headers,
+                content=body,
+                files=files,
+                params=params,
+                data=data,
+                timeout=remaining if stream_idle_timeout is None else httpx.Timeout(remaining, read=stream_idle_timeout)
+            )
+            # httpx 타임아웃은 단계별(연결/읽기)로 적용되므로 전체 마감 시각은 wait_for로 보장
+            response = await asyncio.wait_for(client.send(upstream_request, stream=stream), timeout=remaining)
+            success = response.status_code not in REPLICA_FAILURE_STATUS
+            if success:
+                policy.latency.observe(time.monotonic() - started)
+            return response, success, None
+        except (asyncio.TimeoutError, httpx.TimeoutException) as e:
+            success = False
+            return self._timeout_response(), False, e
+        except UploadTooLargeError:
+            # 클라이언트 업로드가 한도를 넘은 경우 레플리카/서킷 브레이커 실패가 아님 (호출자가 413 반환)
+            raise
+        except Exception as e:
+            success = False
+            # 예외 발생 시 에러 응답 반환
+            return httpx.Response(
+                status_code=500,
+                content=f"서비스 요청 중 오류 발생: {str(e)}".encode()
+            ), False, e
+        finally:
+            # 스트리밍 응답은 헤더 수신 시점까지를 진행 중으로 계산 (취소된 요청은 성공/실패로 기록하지 않음)
+            service_discovery.release(replica, success)
+            upstream_in_flight.dec((self.service_type.value,))
+
+    def _record_metrics(self, method: str, response: httpx.Response, elapsed: float, body, declared_length):
+        """지연 시간과 요청/응답 크기를 기록합니다. 스트리밍 응답의 크기는 본문을 모두 읽은 뒤 기록됩니다."""
+        service = self.service_type.value
+        status = status_class(response.status_code)
+        upstream_latency.observe((service, method, status), elapsed)
+
+        if isinstance(body, (bytes, bytearray)):
+            request_size = len(body)
+        elif hasattr(body, "received"):
+            request_size = body.received
+        else:
+            request_size = declared_length
+        if request_size is not None:
+            upstream_request_size.observe((service, method), request_size)
+
+        labels = (service, method, status)
+        if response.is_stream_consumed:
+            upstream_response_size.observe(labels, len(response.content))
+        else:
+            response.stream = CountingStream(
+                response.stream,
+                lambda size: upstream_response_size.observe(labels, size)
+            )
+
+    def _unavailable_response(self, error: Exception) -> httpx.Response:
+        """bulkhead 또는 서킷 브레이커가 요청을 거절한 경우의 503 응답을 생성합니다."""
+        retry_after = getattr(error, "retry_after", 1)
+        return httpx.Response(
+            status_code=503,
+            headers={
+                "content-type": "application/json",
+                "retry-after": str(max(1, math.ceil(retry_after))),
+            },
+            content=json.dumps({"detail": str(error)}, ensure_ascii=False).encode()
+        )
+
+    def _timeout_response(self) -> httpx.Response:
+        """요청 마감 시각이 지난 경우의 504 응답을 생성합니다."""
+        return httpx.Response(
+            status_code=504,
+            headers={"content-type": "application/json"},
+            content=json.dumps(
+                {"detail": f"서비스 {self.service_type.value}의 응답 시간이 초과되었습니다."},
+                ensure_ascii=False
+            ).encode()
+        )
@@ -1,6 +1,7 @@
 # service_type.py
 import os
 from enum import Enum
+from typing import Dict, List
 
 class ServiceType(str, Enum):
     STOCKTREND = "stocktrend"
@@ -10,6 +11,8 @@ class ServiceType(str, Enum):
     XBRLGEN = "xbrlgen"
     ESGDSD = "esgdsd"
     CHATBOT = "chatbot"
+    IRSUMMARY = "irsummary"
+    DSDCHECK = "dsdcheck"
 
 SERVICE_URLS = {
     ServiceType.STOCKTREND: os.getenv("STOCKTREND_SERVICE_URL"),
@@ -19,4 +22,19 @@ SERVICE_URLS = {
     ServiceType.XBRLGEN: os.getenv("XBRLGEN_SERVICE_URL"),
     ServiceType.ESGDSD: os.getenv("ESGDSD_SERVICE_URL"),
     ServiceType.CHATBOT: os.getenv("CHATBOT_SERVICE_URL"),
+    ServiceType.IRSUMMARY: os.getenv("IRSUMMARY_SERVICE_URL"),
+    ServiceType.DSDCHECK: os.getenv("DSDCHECK_SERVICE_URL"),
+}
+
+
+def parse_replica_urls(value) -> List[str]:
+    """쉼표로 구분된 서비스 URL 목록을 파싱합니다. (예: "http://dsdgen-1:8085,http://dsdgen-2:8085")"""
+    if not value:
+        return []
+    return [url.strip().rstrip("/") for url in value.split(",") if url.strip()]
+
+# 서비스별 레플리카 URL 목록 (*_SERVICE_URL에 여러 URL을 쉼표로 지정)
+SERVICE_REPLICAS: Dict[ServiceType, List[str]] = {
+    service_type: parse_replica_urls(url)
+    for service_type, url in SERVICE_URLS.items()
 }
@@ -0,0 +1,133 @@
+# batch_service.py
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+
+from app.domain.model.batch_schema import BatchItem, BatchItemResult, BatchRequest, BatchResponse
+from app.domain.model.service_factory import ServiceProxyFactory
+from app.platform.deadline import DEADLINE_HEADER, format_deadline, parse_deadline
+from app.platform.rate_limit import RateLimitExceeded, rate_limiter
+
+logger = logging.getLogger("gateway-api")
+
+ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH"}
+
+# 하위 요청에 전달하지 않는 원본 요청 헤더 (본문 관련 헤더는 하위 요청마다 다시 설정)
+EXCLUDED_FORWARD_HEADERS = {b"host", b"content-length", b"content-type", b"accept-encoding", DEADLINE_HEADER.encode()}
+
+
+class BatchService:
+    """
+    여러 하위 요청을 서비스 프록시로 동시에 실행하고 결과를 하나의 응답으로 묶는 서비스
+
+    전체 마감 시각이 지나면 끝나지 않은 하위 요청을 취소하고 504로 기록합니다.
+    """
+
+    def __init__(self):
+        self.max_items = int(os.getenv("GATEWAY_BATCH_MAX_ITEMS", "20"))
+        self.default_timeout = float(os.getenv("GATEWAY_BATCH_TIMEOUT", "30"))
+
+    def validate(self, batch: BatchRequest):
+        """
+        배치 요청을 검증합니다.
+
+        Raises:
+            ValueError: 하위 요청 수가 한도를 넘거나 지원하지 않는 메서드가 있는 경우
+        """
+        if not batch.requests:
+            raise ValueError("하위 요청이 비어 있습니다.")
+        if len(batch.requests) > self.max_items:
+            raise ValueError(f"하위 요청은 최대 {self.max_items}개까지 가능합니다.")
+        for item in batch.requests:
+            if item.method.upper() not in ALLOWED_METHODS:
+                raise ValueError(f"지원하지 않는 메서드입니다: {item.method}")
+
+    async def execute(self, batch: BatchRequest, raw_headers: List[Tuple[bytes, bytes]], client: Optional[str] = None) -> BatchResponse:
+        """배치의 모든 하위 요청을 동시에 실행합니다. client를 지정하면 하위 요청마다 요청 한도를 확인합니다."""
+        started = time.monotonic()
+
+        # 전체 마감 시각: 배치 timeout 또는 기본값, 클라이언트 X-Request-Deadline 중 가장 이른 시각
+        deadline = time.time() + (batch.timeout or self.default_timeout)
+        forward_headers = []
+        for name, value in raw_headers:
+            lower_name = name.lower()
+            if lower_name == DEADLINE_HEADER.encode():
+                incoming = parse_deadline(value.decode())
+                if incoming is not None:
+                    deadline = min(deadline, incoming)
+            elif lower_name not in EXCLUDED_FORWARD_HEADERS:
+                forward_headers.append((name, value))
+        forward_headers.append((DEADLINE_HEADER.encode(), format_deadline(deadline).encode()))
+
+        tasks = [
+            asyncio.ensure_future(self._execute_item(index, item, forward_headers, client))
+            for index, item in enumerate(batch.requests)
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.time()))
+        for task in pending:
+            task.cancel()
+
+        results = []
+        for index, task in enumerate(tasks):
+            if task in done and not task.cancelled() and task.exception() is None:
+                results.append(task.result())
+            elif task in done and not task.cancelled():
+                logger.error(f"배치 하위 요청 {index} 실패: {task.exception()}")
+                results.append(self._error_result(index, 500, f"Gateway error: {task.exception()}", started))
+            else:
+                results.append(self._error_result(index, 504, "배치 마감 시간이 초과되었습니다.", started))
+
+        return BatchResponse(
+            responses=results,
+            elapsed_ms=round((time.monotonic() - started) * 1000, 2)
+        )
+
+    async def _execute_item(self, index: int, item: BatchItem, forward_headers: List[Tuple[bytes, bytes]], client: Optional[str]) -> BatchItemResult:
+        started = time.monotonic()
+        if client is not None:
+            try:
+                await rate_limiter.check(client, item.service, item.path)
+            except RateLimitExceeded as e:
+                return self._error_result(index, 429, str(e), started)
+        headers = list(forward_headers)
+        body = None
+        if item.body is not None:
+            body = json.dumps(item.body, ensure_ascii=False).encode()
+            headers.append((b"content-type", b"application/json"))
+
+        factory = ServiceProxyFactory(service_type=item.service)
+        response = await factory.request(
+            method=item.method.upper(),
+            path=item.path.lstrip("/"),
+            headers=headers,
+            body=body,
+            params=item.query
+        )
+        return BatchItemResult(
+            index=index,
+            status_code=response.status_code,
+            body=self._decode_body(response),
+            elapsed_ms=round((time.monotonic() - started) * 1000, 2)
+        )
+
+    @staticmethod
+    def _decode_body(response) -> Any:
+        """응답 본문이 JSON이면 파싱하고, 아니면 문자열로 반환합니다."""
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    @staticmethod
+    def _error_result(index: int, status_code: int, detail: str, started: float) -> BatchItemResult:
+        return BatchItemResult(
+            index=index,
+            status_code=status_code,
+            body={"detail": detail},
+            elapsed_ms=round((time.monotonic() - started) * 1000, 2)
+        )
@@ -0,0 +1,178 @@
+# discovery_service.py
+import os
+import time
+import random
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.domain.model.service_type import ServiceType, SERVICE_REPLICAS
+
+logger = logging.getLogger("gateway-api")
+
+# 레플리카 장애로 간주하는 업스트림 상태 코드 (애플리케이션 오류인 500은 제외)
+REPLICA_FAILURE_STATUS = {502, 503, 504}
+
+
+@dataclass
+class Replica:
+    """서비스 레플리카 하나의 상태"""
+    url: str
+    in_flight: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejections: int = 0
+    # 헬스 체크 결과 (프로브 전에는 준비된 것으로 간주)
+    ready: bool = True
+    probe_failures: int = 0
+    probe_successes: int = 0
+    last_probe_error: Optional[str] = None
+
+    def is_ejected(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.monotonic()) < self.ejected_until
+
+    def to_dict(self, now: float) -> Dict[str, object]:
+        return {
+            "url": self.url,
+            "in_flight": self.in_flight,
+            "total_requests": self.total_requests,
+            "total_failures": self.total_failures,
+            "consecutive_failures": self.consecutive_failures,
+            "ejected": self.is_ejected(now),
+            "ejected_for": round(max(0.0, self.ejected_until - now), 3),
+            "ejections": self.ejections,
+            "ready": self.ready,
+            "last_probe_error": self.last_probe_error,
+        }
+
+
+class ServiceDiscovery:
+    """
+    서비스별 레플리카 선택기
+
+    power-of-two-choices 방식으로 두 레플리카를 무작위로 골라 진행 중인 요청 수가 적은 쪽을 선택합니다.
+    연속으로 실패(연결 오류, 타임아웃, 502/503/504)한 레플리카는 일정 시간 동안 선택에서 제외(passive ejection)되고,
+    헬스 체크에서 준비되지 않은 것으로 확인된 레플리카도 선택하지 않습니다.
+    선택할 수 있는 레플리카가 없으면 준비된 레플리카, 그다음 전체 레플리카 순서로 범위를 넓혀 가장 여유 있는 레플리카를 사용합니다.
+    """
+
+    def __init__(self, replicas: Dict[ServiceType, List[str]], eject_after: int = 3, eject_seconds: float = 30.0):
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self._replicas: Dict[ServiceType, List[Replica]] = {
+            service_type: [Replica(url=url) for url in urls]
+            for service_type, urls in replicas.items()
+        }
+
+    @classmethod
+    def from_env(cls) -> "ServiceDiscovery":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            replicas=SERVICE_REPLICAS,
+            eject_after=int(os.getenv("GATEWAY_LB_EJECT_AFTER", "3")),
+            eject_seconds=float(os.getenv("GATEWAY_LB_EJECT_SECONDS", "30")),
+        )
+
+    def has_replicas(self, service_type: ServiceType) -> bool:
+        return bool(self._replicas.get(service_type))
+
+    def replicas(self, service_type: ServiceType) -> List[Replica]:
+        return self._replicas.get(service_type, [])
+
+    def pick(self, service_type: ServiceType, exclude: Optional[Replica] = None) -> Replica:
+        """
+        요청을 보낼 레플리카를 선택합니다.
+
+        Args:
+            service_type: 대상 서비스
+            exclude: 선택에서 제외할 레플리카 (다른 레플리카가 있을 때만 적용)
+
+        Raises:
+            ValueError: 서비스에 레플리카가 구성되지 않은 경우
+        """
+        replicas = self._replicas.get(service_type)
+        if not replicas:
+            raise ValueError(f"서비스 {service_type}에 대한 기본 URL이 구성되지 않았습니다.")
+
+        now = time.monotonic()
+        candidates = [r for r in replicas if r is not exclude] or replicas
+        ready = [r for r in candidates if r.ready] or candidates
+        available = [r for r in ready if not r.is_ejected(now)] or ready
+
+        if len(available) == 1:
+            return available[0]
+        first, second = random.sample(available, 2)
+        return first if first.in_flight <= second.in_flight else second
+
+    def acquire(self, replica: Replica):
+        """레플리카로 요청을 보내기 직전에 호출합니다."""
+        replica.in_flight += 1
+        replica.total_requests += 1
+
+    def release(self, replica: Replica, success: Optional[bool]):
+        """
+        요청이 끝난 뒤 호출하여 진행 중 카운트를 줄이고 성공/실패를 기록합니다.
+
+        연속 실패가 eject_after에 도달하면 eject_seconds 동안 선택에서 제외합니다.
+        success가 None이면(요청 취소 등) 진행 중 카운트만 줄입니다.
+        """
+        replica.in_flight = max(0, replica.in_flight - 1)
+        if success is None:
+            return
+        if success:
+            replica.consecutive_failures = 0
+            return
+
+        replica.total_failures += 1
+        replica.consecutive_failures += 1
+        if replica.consecutive_failures >= self.eject_after and not replica.is_ejected():
+            replica.ejected_until = time.monotonic() + self.eject_seconds
+            replica.ejections += 1
+            logger.warning(
+                f"⛔ 레플리카 제외: {replica.url} "
+                f"(연속 실패 {replica.consecutive_failures}회, {self.eject_seconds}초)"
+            )
+
+    def mark_probe(self, replica: Replica, healthy: bool, error: Optional[str], unhealthy_after: int, healthy_after: int):
+        """
+        헬스 체크 결과를 기록합니다.
+
+        연속 실패가 unhealthy_after에 도달하면 준비되지 않음으로, 연속 성공이 healthy_after에 도달하면 다시 준비됨으로 바꿉니다.
+        """
+        if healthy:
+            replica.probe_failures = 0
+            replica.probe_successes += 1
+            replica.last_probe_error = None
+            if not replica.ready and replica.probe_successes >= healthy_after:
+                replica.ready = True
+                # 복구된 레플리카는 passive ejection도 해제
+                replica.ejected_until = 0.0
+                replica.consecutive_failures = 0
+                logger.info(f"✅ 레플리카 준비됨: {replica.url}")
+            return
+
+        replica.probe_successes = 0
+        replica.probe_failures += 1
+        replica.last_probe_error = error
+        if replica.ready and replica.probe_failures >= unhealthy_after:
+            replica.ready = False
+            logger.warning(f"⚠️ 레플리카 준비되지 않음: {replica.url} ({error})")
+
+    def is_ready(self, service_type: ServiceType) -> bool:
+        """서비스에 준비된 레플리카가 하나 이상 있는지 확인합니다."""
+        return any(replica.ready for replica in self._replicas.get(service_type, []))
+
+    def stats(self) -> Dict[str, List[Dict[str, object]]]:
+        """서비스별 레플리카 상태를 반환합니다."""
+        now = time.monotonic()
+        return {
+            service_type.value: [replica.to_dict(now) for replica in replicas]
+            for service_type, replicas in self._replicas.items()
+            if replicas
+        }
+
+
+# 게이트웨이 전역 서비스 디스커버리
+service_discovery = ServiceDiscovery.from_env()
@@ -0,0 +1,135 @@
+# health_service.py
+import os
+import time
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.domain.service.discovery_service import Replica, ServiceDiscovery, service_discovery
+from app.foundation.settings import service_env_float, service_env_int
+from app.platform.http_client import client_registry
+
+logger = logging.getLogger("gateway-api")
+
+# 서비스별 헬스 체크 경로 (백엔드마다 제공하는 엔드포인트가 달라 서비스별로 지정)
+DEFAULT_HEALTH_PATHS = "chatbot:hello,esgdsd:hello,dsdcheck:health,irsummary:health,dsdgen:/,stocktrend:docs"
+
+
+def parse_health_paths(spec: str) -> Dict[str, str]:
+    """
+    "서비스:경로" 목록 문자열을 파싱합니다.
+
+    예: "chatbot:hello,dsdgen:/" → {"chatbot": "hello", "dsdgen": ""}
+    """
+    paths = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item or ":" not in item:
+            continue
+        service, path = item.split(":", 1)
+        paths[service.strip()] = path.strip().strip("/")
+    return paths
+
+
+class HealthProber:
+    """
+    백엔드 레플리카 능동 헬스 체크
+
+    서비스마다 백그라운드 태스크가 interval초 간격으로 모든 레플리카의 헬스 경로를 호출합니다.
+    2xx/3xx 응답이 아니거나 연결에 실패한 횟수가 연속 unhealthy_threshold회가 되면 레플리카를 준비되지 않음으로 표시해
+    ServiceDiscovery가 선택하지 않도록 하고, 다시 연속 healthy_threshold회 성공하면 준비됨으로 되돌립니다.
+    모델을 로딩 중이어서 아직 포트를 열지 않은 백엔드(chatbot 등)도 연결 실패로 감지됩니다.
+    """
+
+    def __init__(self, discovery: ServiceDiscovery, health_paths: Dict[str, str], enabled: bool = True):
+        self.discovery = discovery
+        self.health_paths = health_paths
+        self.enabled = enabled
+        self._tasks: List[asyncio.Task] = []
+        self.last_probe_at: Dict[ServiceType, float] = {}
+
+    @classmethod
+    def from_env(cls, discovery: ServiceDiscovery) -> "HealthProber":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            discovery=discovery,
+            health_paths=parse_health_paths(os.getenv("GATEWAY_HEALTH_PATHS", DEFAULT_HEALTH_PATHS)),
+            enabled=os.getenv("GATEWAY_HEALTH_ENABLED", "true").lower() == "true",
+        )
+
+    def health_path(self, service_type: ServiceType) -> Optional[str]:
+        return self.health_paths.get(service_type.value)
+
+    async def start(self):
+        """헬스 경로가 설정된 서비스마다 프로브 태스크를 시작합니다."""
+        if not self.enabled:
+            return
+        for service_type in ServiceType:
+            if self.discovery.has_replicas(service_type) and self.health_path(service_type) is not None:
+                self._tasks.append(asyncio.create_task(self._run(service_type)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, service_type: ServiceType):
+        interval = service_env_float(service_type, "HEALTH_INTERVAL", 10.0)
+        while True:
+            try:
+                await self.probe_service(service_type)
+            except Exception as e:
+                logger.warning(f"{service_type.value} 헬스 체크 실패: {str(e)}")
+            await asyncio.sleep(interval)
+
+    async def probe_service(self, service_type: ServiceType):
+        """서비스의 모든 레플리카를 동시에 한 번씩 확인합니다."""
+        replicas = self.discovery.replicas(service_type)
+        await asyncio.gather(*(self._probe(service_type, replica) for replica in replicas))
+        self.last_probe_at[service_type] = time.time()
+
+    async def _probe(self, service_type: ServiceType, replica: Replica):
+        timeout = service_env_float(service_type, "HEALTH_TIMEOUT", 2.0)
+        client = client_registry.get(service_type)
+        url = f"{replica.url}/{self.health_path(service_type)}"
+        try:
+            response = await client.get(url, timeout=timeout)
+            healthy = response.status_code < 400
+            error = None if healthy else f"HTTP {response.status_code}"
+        except httpx.HTTPError as e:
+            healthy = False
+            error = f"{type(e).__name__}: {str(e)}" if str(e) else type(e).__name__
+        self.discovery.mark_probe(
+            replica,
+            healthy,
+            error,
+            unhealthy_after=service_env_int(service_type, "HEALTH_UNHEALTHY_THRESHOLD", 2),
+            healthy_after=service_env_int(service_type, "HEALTH_HEALTHY_THRESHOLD", 1),
+        )
+
+    def readiness(self) -> Dict[str, object]:
+        """설정된 서비스별 준비 상태와 게이트웨이 전체 준비 여부를 반환합니다."""
+        services = {}
+        for service_type in ServiceType:
+            replicas = self.discovery.replicas(service_type)
+            if not replicas:
+                continue
+            services[service_type.value] = {
+                "ready": self.discovery.is_ready(service_type),
+                "ready_replicas": sum(1 for replica in replicas if replica.ready),
+                "replicas": len(replicas),
+                "probed": self.enabled and self.health_path(service_type) is not None,
+                "last_probe_at": self.last_probe_at.get(service_type),
+            }
+        return {
+            "ready": all(service["ready"] for service in services.values()),
+            "services": services,
+        }
+
+
+# 게이트웨이 전역 헬스 프로버
+health_prober = HealthProber.from_env(service_discovery)
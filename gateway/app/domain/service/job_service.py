@@ -0,0 +1,511 @@
+# job_service.py
+import os
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from starlette.concurrency import run_in_threadpool
+
+from app.domain.model.service_type import ServiceType
+from app.domain.model.service_factory import ServiceProxyFactory
+from app.foundation.settings import service_env_float, service_env_int
+from app.platform.deadline import DEADLINE_HEADER
+from app.platform.priority import PRIORITY_HEADER
+from app.platform.tracing import TRACEPARENT_HEADER, SpanContext, tracer
+
+logger = logging.getLogger("gateway-api")
+
+ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH"}
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = {SUCCEEDED, FAILED, CANCELLED}
+
+# 작업 실행 시 백엔드로 전달하지 않는 제출 요청 헤더
+EXCLUDED_JOB_HEADERS = {
+    b"host", b"content-length", b"connection", b"accept-encoding",
+    b"if-none-match", b"if-modified-since", DEADLINE_HEADER.encode(), TRACEPARENT_HEADER.encode(),
+}
+
+# 우선순위를 지정하지 않은 작업의 우선순위 등급 (작업은 기다릴 수 있으므로 기본적으로 batch)
+JOB_PRIORITY = os.getenv("GATEWAY_JOB_PRIORITY", "batch")
+
+# 중복 제출 판단에 포함하는 헤더 (자격 증명이 다르면 다른 작업으로 취급)
+DEDUP_HEADERS = (b"authorization", b"cookie", b"x-api-key", b"content-type")
+
+# 작업 본문을 임시 파일에서 읽어 보낼 때의 청크 크기
+SPOOL_CHUNK_BYTES = 64 * 1024
+
+
+class JobQueueFullError(Exception):
+    """서비스의 작업 대기열이 가득 찬 경우 발생하는 예외"""
+
+    def __init__(self, service_type: ServiceType):
+        self.service_type = service_type
+        super().__init__(f"서비스 {service_type.value}의 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.")
+
+
+class JobBody:
+    """
+    작업 요청 본문
+
+    spool_bytes까지는 메모리에 보관하고, 넘으면 임시 파일로 옮겨 보관합니다.
+    본문을 받는 동안 중복 제출 판단용 해시를 함께 계산하며, 작업 실행이 끝나면 close()로 정리합니다.
+    """
+
+    def __init__(self, spool_bytes: int, spool_dir: Optional[str] = None):
+        self.spool_bytes = spool_bytes
+        self.spool_dir = spool_dir
+        self.size = 0
+        self._buffer = bytearray()
+        self._file = None
+        self._digest = hashlib.sha256()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "JobBody":
+        body = cls(spool_bytes=len(data))
+        body._buffer.extend(data)
+        body.size = len(data)
+        body._digest.update(data)
+        return body
+
+    @property
+    def spooled(self) -> bool:
+        """임시 파일에 보관 중인지 여부"""
+        return self._file is not None
+
+    @property
+    def digest(self) -> bytes:
+        return self._digest.digest()
+
+    async def write(self, chunk: bytes):
+        self.size += len(chunk)
+        self._digest.update(chunk)
+        if self._file is None and len(self._buffer) + len(chunk) <= self.spool_bytes:
+            self._buffer.extend(chunk)
+            return
+        if self._file is None:
+            self._file = await run_in_threadpool(tempfile.TemporaryFile, prefix="gateway-job-", dir=self.spool_dir)
+            await run_in_threadpool(self._file.write, bytes(self._buffer))
+            self._buffer = bytearray()
+        await run_in_threadpool(self._file.write, chunk)
+
+    def content(self) -> Union[bytes, AsyncIterator[bytes]]:
+        """백엔드로 보낼 본문. 메모리에 있으면 bytes(재시도 가능), 임시 파일이면 청크 단위 비동기 이터레이터"""
+        if self._file is None:
+            return bytes(self._buffer)
+        return self._iterate_file()
+
+    async def _iterate_file(self) -> AsyncIterator[bytes]:
+        await run_in_threadpool(self._file.seek, 0)
+        while True:
+            chunk = await run_in_threadpool(self._file.read, SPOOL_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer = bytearray()
+
+
+@dataclass
+class Job:
+    """게이트웨이가 대신 실행하는 백엔드 요청 하나"""
+    job_id: str
+    service: ServiceType
+    method: str
+    path: str
+    query: List[Tuple[str, str]]
+    headers: List[Tuple[bytes, bytes]]
+    body: Optional[JobBody]
+    dedup_key: str
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    expires_at: Optional[float] = None
+    status_code: Optional[int] = None
+    result_headers: Dict[str, str] = field(default_factory=dict)
+    result_body: Optional[bytes] = None
+    error: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+    # 제출 요청의 span (작업 실행 span을 같은 trace에 이어서 기록)
+    trace_context: Optional[SpanContext] = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def update(self, status: str):
+        """상태를 바꾸고 상태 변경을 기다리는 구독자를 깨웁니다."""
+        self.status = status
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class JobManager:
+    """
+    오래 걸리는 백엔드 요청을 비동기 작업으로 실행하는 관리자
+
+    - 제출: 서비스별 제한된 대기열(queue_size)에 넣고 작업 ID를 즉시 반환
+    - 실행: 서비스별 워커(concurrency개)가 서비스 프록시로 백엔드를 호출하고 응답을 보관
+    - 조회: 클라이언트는 상태를 폴링(long-poll 가능)하거나 이벤트 스트림으로 구독
+    - 보관: 끝난 작업은 result_ttl초 뒤 제거하며, 전체 보관 수는 max_jobs, 보관 중인 결과 크기 합계는
+      max_stored_result_bytes를 넘지 않음 (넘으면 오래된 완료 작업부터 제거)
+    - 본문: 제출 본문은 spool_bytes를 넘으면 임시 파일에 보관하고, 대기 중인 작업 본문 크기 합계가
+      max_queued_bytes를 넘는 제출은 거절
+    - 중복 제거: 같은 요청(메서드, 서비스, 경로, 쿼리, 본문, 인증 헤더)이 진행 중이거나 성공 결과가 남아 있으면 기존 작업을 반환
+    """
+
+    def __init__(
+        self,
+        result_ttl: float = 600.0,
+        max_jobs: int = 1000,
+        max_body_bytes: int = 50 * 1024 * 1024,
+        max_queued_bytes: int = 200 * 1024 * 1024,
+        spool_bytes: int = 1024 * 1024,
+        spool_dir: Optional[str] = None,
+        max_result_bytes: int = 20 * 1024 * 1024,
+        max_stored_result_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.result_ttl = result_ttl
+        self.max_jobs = max_jobs
+        self.max_body_bytes = max_body_bytes
+        self.max_queued_bytes = max_queued_bytes
+        self.spool_bytes = spool_bytes
+        self.spool_dir = spool_dir
+        self.max_result_bytes = max_result_bytes
+        self.max_stored_result_bytes = max_stored_result_bytes
+        # 실행이 끝나지 않은 작업이 보관 중인 본문 크기 합계, 보관 중인 결과 크기 합계
+        self.queued_bytes = 0
+        self.stored_result_bytes = 0
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._dedup: Dict[str, str] = {}
+        self._queues: Dict[ServiceType, asyncio.Queue] = {}
+        self._workers: Dict[ServiceType, List[asyncio.Task]] = {}
+
+        # 통계 카운터
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "JobManager":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            result_ttl=float(os.getenv("GATEWAY_JOB_RESULT_TTL", "600")),
+            max_jobs=int(os.getenv("GATEWAY_JOB_MAX_STORED", "1000")),
+            max_body_bytes=int(os.getenv("GATEWAY_JOB_MAX_BODY_BYTES", str(50 * 1024 * 1024))),
+            max_queued_bytes=int(os.getenv("GATEWAY_JOB_MAX_QUEUED_BYTES", str(200 * 1024 * 1024))),
+            spool_bytes=int(os.getenv("GATEWAY_JOB_SPOOL_BYTES", str(1024 * 1024))),
+            spool_dir=os.getenv("GATEWAY_JOB_SPOOL_DIR") or None,
+            max_result_bytes=int(os.getenv("GATEWAY_JOB_MAX_RESULT_BYTES", str(20 * 1024 * 1024))),
+            max_stored_result_bytes=int(os.getenv("GATEWAY_JOB_MAX_STORED_RESULT_BYTES", str(256 * 1024 * 1024))),
+        )
+
+    def new_body(self) -> JobBody:
+        """제출 요청 본문을 받을 JobBody를 생성합니다."""
+        return JobBody(spool_bytes=self.spool_bytes, spool_dir=self.spool_dir)
+
+    def ensure_capacity(self, service: ServiceType, body_bytes: int = 0):
+        """
+        본문을 받기 전에 대기열에 자리가 있는지 확인합니다.
+
+        Raises:
+            ValueError: 본문이 max_body_bytes보다 큰 경우
+            JobQueueFullError: 대기열이 가득 찼거나 대기 중인 본문 크기 합계가 한도를 넘는 경우
+        """
+        if body_bytes > self.max_body_bytes:
+            raise ValueError(f"작업 본문은 최대 {self.max_body_bytes} 바이트까지 가능합니다.")
+        if self._queue(service).full() or self.queued_bytes + body_bytes > self.max_queued_bytes:
+            self.rejected += 1
+            raise JobQueueFullError(service)
+
+    def submit(
+        self,
+        service: ServiceType,
+        method: str,
+        path: str,
+        query: List[Tuple[str, str]],
+        raw_headers: List[Tuple[bytes, bytes]],
+        body: Optional[JobBody],
+        owner: Optional[str] = None,
+    ) -> Tuple[Job, bool]:
+        """
+        작업을 제출합니다. 작업으로 등록되지 않은 본문(중복, 거절)은 여기서 정리합니다.
+
+        중복 제출은 같은 제출자(owner, 요청 한도의 클라이언트 식별자)의 요청끼리만 합칩니다.
+
+        Returns:
+            (작업, 중복 여부) 튜플. 중복이면 기존 작업을 반환합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 메서드이거나 본문이 너무 큰 경우
+            JobQueueFullError: 서비스의 작업 대기열이 가득 찼거나 대기 중인 본문 크기 합계가 한도를 넘는 경우
+        """
+        try:
+            return self._submit(service, method, path, query, raw_headers, body, owner)
+        except BaseException:
+            if body is not None:
+                body.close()
+            raise
+
+    def _submit(self, service, method, path, query, raw_headers, body: Optional[JobBody], owner: Optional[str]) -> Tuple[Job, bool]:
+        method = method.upper()
+        if method not in ALLOWED_METHODS:
+            raise ValueError(f"지원하지 않는 메서드입니다: {method}")
+        body_bytes = body.size if body is not None else 0
+
+        self._expire()
+        path = path.strip("/")
+        headers = [(name, value) for name, value in raw_headers if name.lower() not in EXCLUDED_JOB_HEADERS]
+        if not any(name.lower() == PRIORITY_HEADER.encode() for name, _ in headers):
+            headers.append((PRIORITY_HEADER.encode(), JOB_PRIORITY.encode()))
+        dedup_key = self._dedup_key(service, method, path, query, headers, body, owner)
+
+        existing = self._jobs.get(self._dedup.get(dedup_key, ""))
+        if existing is not None and existing.status in (QUEUED, RUNNING, SUCCEEDED):
+            self.deduplicated += 1
+            if body is not None:
+                body.close()
+            return existing, True
+
+        self.ensure_capacity(service, body_bytes)
+        queue = self._queue(service)
+
+        submit_span = tracer.current_span()
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            service=service,
+            method=method,
+            path=path,
+            query=list(query),
+            headers=headers,
+            body=body,
+            dedup_key=dedup_key,
+            trace_context=submit_span.context if submit_span else None,
+        )
+        self._jobs[job.job_id] = job
+        self._dedup[dedup_key] = job.job_id
+        self.queued_bytes += body_bytes
+        queue.put_nowait(job)
+        self.submitted += 1
+        self._ensure_workers(service)
+        logger.info(f"📥 작업 제출: id={job.job_id}, 서비스={service.value}, 경로={path}")
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """대기 중이거나 실행 중인 작업을 취소합니다."""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        if job.task is not None:
+            job.task.cancel()
+        else:
+            # 대기 중인 작업은 워커가 꺼내기 전에 본문을 정리
+            self._release_body(job)
+        self._finish(job, CANCELLED, error="사용자가 작업을 취소했습니다.")
+        return job
+
+    async def wait(self, job: Job, timeout: float) -> Job:
+        """작업 상태가 바뀌거나 timeout초가 지날 때까지 기다립니다."""
+        if job.finished or timeout <= 0:
+            return job
+        try:
+            await asyncio.wait_for(job.changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    async def stop(self):
+        """모든 워커를 종료합니다."""
+        workers = [task for tasks in self._workers.values() for task in tasks]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+
+    def _queue(self, service: ServiceType) -> asyncio.Queue:
+        queue = self._queues.get(service)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=service_env_int(service, "JOB_QUEUE_SIZE", 100))
+            self._queues[service] = queue
+        return queue
+
+    def _ensure_workers(self, service: ServiceType):
+        """서비스의 워커를 처음 제출될 때 시작합니다."""
+        if service in self._workers:
+            return
+        concurrency = service_env_int(service, "JOB_CONCURRENCY", 2)
+        self._workers[service] = [
+            asyncio.create_task(self._worker(service)) for _ in range(concurrency)
+        ]
+
+    async def _worker(self, service: ServiceType):
+        queue = self._queue(service)
+        while True:
+            job = await queue.get()
+            try:
+                if job.status != QUEUED:
+                    self._release_body(job)
+                    continue
+                job.task = asyncio.ensure_future(self._execute(job))
+                # 작업만 취소된 경우에도 워커는 계속 동작하도록 wait로 기다림
+                await asyncio.wait({job.task})
+            finally:
+                queue.task_done()
+
+    async def _execute(self, job: Job):
+        job.started_at = time.time()
+        job.update(RUNNING)
+        try:
+            factory = ServiceProxyFactory(service_type=job.service)
+            with tracer.span("job", parent=job.trace_context, job_id=job.job_id, service=job.service.value):
+                response = await factory.request(
+                    method=job.method,
+                    path=job.path,
+                    headers=job.headers,
+                    body=job.body.content() if job.body is not None else None,
+                    params=job.query,
+                    timeout=service_env_float(job.service, "JOB_TIMEOUT", 600.0),
+                    stream=True,
+                )
+                result_body = await self._read_result(response)
+            if result_body is None:
+                self._finish(job, FAILED, error=f"백엔드 응답이 결과 최대 크기({self.max_result_bytes} bytes)를 초과했습니다.")
+                return
+            job.status_code = response.status_code
+            job.result_body = result_body
+            self.stored_result_bytes += len(result_body)
+            content_type = response.headers.get("content-type")
+            job.result_headers = {"content-type": content_type} if content_type else {}
+            if response.status_code < 400:
+                self._finish(job, SUCCEEDED)
+            else:
+                self._finish(job, FAILED, error=f"백엔드 응답 상태 코드 {response.status_code}")
+        except asyncio.CancelledError:
+            if not job.finished:
+                self._finish(job, CANCELLED, error="작업이 취소되었습니다.")
+            raise
+        except Exception as e:
+            logger.error(f"작업 실행 실패: id={job.job_id}, 오류={str(e)}")
+            self._finish(job, FAILED, error=f"Gateway error: {str(e)}")
+        finally:
+            # 실행이 끝나면 요청 본문은 더 이상 필요 없음
+            self._release_body(job)
+            job.task = None
+
+    async def _read_result(self, response) -> Optional[bytes]:
+        """백엔드 응답 본문을 읽습니다. max_result_bytes를 넘으면 읽기를 멈추고 None을 반환합니다."""
+        try:
+            if response.is_stream_consumed:
+                body = response.content
+                return body if len(body) <= self.max_result_bytes else None
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > self.max_result_bytes:
+                    return None
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            await response.aclose()
+
+    def _release_body(self, job: Job):
+        if job.body is not None:
+            self.queued_bytes -= job.body.size
+            job.body.close()
+            job.body = None
+
+    def _finish(self, job: Job, status: str, error: Optional[str] = None):
+        job.finished_at = time.time()
+        job.expires_at = job.finished_at + self.result_ttl
+        job.error = error
+        job.update(status)
+        logger.info(f"📤 작업 종료: id={job.job_id}, 상태={status}, 상태 코드={job.status_code}")
+
+    def _expire(self):
+        """보관 기간이 지난 작업과 보관 한도를 넘은 오래된 완료 작업을 제거합니다."""
+        now = time.time()
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.expires_at and job.expires_at <= now]:
+            self._remove(job_id)
+        if len(self._jobs) > self.max_jobs:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:len(self._jobs) - self.max_jobs]:
+                self._remove(job_id)
+        if self.stored_result_bytes > self.max_stored_result_bytes:
+            for job_id in [job_id for job_id, job in self._jobs.items() if job.result_body]:
+                if self.stored_result_bytes <= self.max_stored_result_bytes:
+                    break
+                self._remove(job_id)
+
+    def _remove(self, job_id: str):
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        if job.result_body:
+            self.stored_result_bytes -= len(job.result_body)
+            job.result_body = None
+        if self._dedup.get(job.dedup_key) == job_id:
+            del self._dedup[job.dedup_key]
+
+    @staticmethod
+    def _dedup_key(service, method, path, query, headers, body, owner=None) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{owner or ''}\n{service.value}\n{method}\n{path}\n{urlencode(sorted(query))}\n".encode())
+        for name, value in headers:
+            if name.lower() in DEDUP_HEADERS:
+                digest.update(name.lower() + b":" + value + b"\n")
+        if body is not None:
+            digest.update(body.digest)
+        return digest.hexdigest()
+
+    def stats(self) -> Dict[str, object]:
+        self._expire()
+        by_status: Dict[str, int] = {}
+        for job in self._jobs.values():
+            by_status[job.status] = by_status.get(job.status, 0) + 1
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+            "stored": len(self._jobs),
+            "queued_bytes": self.queued_bytes,
+            "max_queued_bytes": self.max_queued_bytes,
+            "stored_result_bytes": self.stored_result_bytes,
+            "max_stored_result_bytes": self.max_stored_result_bytes,
+            "by_status": by_status,
+            "queues": {
+                service.value: {
+                    "depth": queue.qsize(),
+                    "max_size": queue.maxsize,
+                    "workers": len(self._workers.get(service, [])),
+                }
+                for service, queue in self._queues.items()
+            },
+        }
+
+
+# 게이트웨이 전역 작업 관리자
+job_manager = JobManager.from_env()
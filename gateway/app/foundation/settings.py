@@ -0,0 +1,69 @@
+# settings.py
+import os
+import logging
+from fnmatch import fnmatchcase
+from typing import List, Optional, Tuple
+
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway-api")
+
+
+def env_int(name: str, default: Optional[int]) -> Optional[int]:
+    """환경변수를 정수로 읽습니다. 값이 없으면 기본값을 반환합니다."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: Optional[float]) -> Optional[float]:
+    """환경변수를 실수로 읽습니다. 값이 없으면 기본값을 반환합니다."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return float(value)
+
+
+def service_env_int(service_type: ServiceType, name: str, default: Optional[int]) -> Optional[int]:
+    """
+    서비스별 정수 설정을 읽습니다.
+
+    {SERVICE}_{name} → GATEWAY_{name} → 기본값 순서로 찾습니다. (예: DSDGEN_POOL_MAX_CONNECTIONS)
+    """
+    return env_int(f"{service_type.name}_{name}", env_int(f"GATEWAY_{name}", default))
+
+
+def service_env_float(service_type: ServiceType, name: str, default: Optional[float]) -> Optional[float]:
+    """서비스별 실수 설정을 읽습니다. 찾는 순서는 service_env_int와 같습니다."""
+    return env_float(f"{service_type.name}_{name}", env_float(f"GATEWAY_{name}", default))
+
+
+def parse_route_values(spec: str) -> List[Tuple[str, str, float]]:
+    """
+    "서비스:경로패턴=값" 목록 문자열을 파싱합니다.
+
+    예: "stocktrend:*stocks=30,dsdgen:dsdgen/dsd-source=60"
+    경로 패턴은 fnmatch 형식이며 게이트웨이에서 받은 {path} 부분과 비교합니다.
+    """
+    routes = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            target, value = item.rsplit("=", 1)
+            service, pattern = target.split(":", 1)
+            routes.append((service.strip(), pattern.strip().strip("/"), float(value)))
+        except ValueError:
+            logger.warning(f"잘못된 라우트 설정을 무시합니다: {item}")
+    return routes
+
+
+def match_route_value(routes: List[Tuple[str, str, float]], service_type: ServiceType, path: str) -> Optional[float]:
+    """서비스와 경로에 처음으로 일치하는 라우트 설정값을 반환합니다. 없으면 None을 반환합니다."""
+    path = path.strip("/")
+    for service, pattern, value in routes:
+        if fnmatchcase(service_type.value, service) and fnmatchcase(path, pattern):
+            return value
+    return None
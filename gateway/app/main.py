@@ -3,14 +3,33 @@ import json
 import os
 import logging
 import sys
-from fastapi import APIRouter, FastAPI, Request, UploadFile, File, Query, HTTPException, Form, Depends
+import httpx
+from fastapi import APIRouter, FastAPI, Request, Query, HTTPException, Form, Depends, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse, Response
+from starlette.background import BackgroundTask
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from app.domain.model.service_type import ServiceType
 from app.domain.model.service_factory import ServiceProxyFactory
+from app.platform.http_client import client_registry
+from app.platform.upload_stream import LimitedRequestStream, UploadTooLargeError
+from app.platform.response_cache import CachedResponse, response_cache, etag_matches
+from app.platform.response_headers import HeaderList, apply_raw_headers, get_header, has_header, without_header
+from app.platform.singleflight import SharedResponse, singleflight
+from app.platform.streaming import EventStreamResponse, StreamLimitError, stream_limiter, tunnel_websocket
+from app.api.admin_router import router as admin_router
+from app.api.batch_router import router as batch_router
+from app.api.metrics_router import router as metrics_router
+from app.api.health_router import router as health_router
+from app.api.job_router import router as job_router
+from app.domain.service.health_service import health_prober
+from app.domain.service.job_service import job_manager
+from app.middleware.compression_middleware import CompressionMiddleware
+from app.middleware.rate_limit_middleware import RateLimitMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
+from app.platform.rate_limit import rate_limiter
 
 # ✅ 로깅 설정
 logging.basicConfig(
@@ -27,7 +46,12 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Gateway API 서비스 시작")
+    await client_registry.start()
+    await health_prober.start()
     yield
+    await job_manager.stop()
+    await health_prober.stop()
+    await client_registry.close()
     logger.info("🛑 Gateway API 서비스 종료")
 
 # ✅ FastAPI 앱 생성 
@@ -38,6 +62,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# ✅ 클라이언트·라우트별 요청 한도 (429 응답에도 CORS 헤더가 붙도록 CORS 안쪽에 배치)
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # ✅ CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -47,15 +74,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 응답 압축 설정 (Accept-Encoding에 따라 gzip/brotli, 이미 압축된 업스트림 응답은 그대로 전달)
+app.add_middleware(CompressionMiddleware, **CompressionMiddleware.options_from_env())
+
+# ✅ 요청 추적 (traceparent 헤더로 받은 trace를 이어서 기록하고 백엔드로 전달)
+app.add_middleware(TracingMiddleware, service_name="gateway")
+
 # ✅ 메인 라우터 생성
 gateway_router = APIRouter(prefix="/api", tags=["gateway"])
 
 # ✅ 파일이 필요한 서비스 목록
 FILE_REQUIRED_SERVICES = {ServiceType.DSDGEN, ServiceType.XBRLGEN}
 
+# ✅ 업로드 최대 크기 (기본값: 100MB, 0이면 제한 없음)
+MAX_UPLOAD_BYTES = int(os.getenv("GATEWAY_MAX_UPLOAD_BYTES", str(100 * 1024 * 1024)))
+
+# ✅ 응답 패스스루 모드 (기본값: 사용)
+# 사용 시 백엔드 응답 본문을 파싱하지 않고 바이트 그대로 스트리밍합니다.
+RESPONSE_PASSTHROUGH = os.getenv("GATEWAY_RESPONSE_PASSTHROUGH", "true").lower() == "true"
+
+# ✅ 클라이언트로 전달하지 않는 응답 헤더 (hop-by-hop 및 게이트웨이가 직접 설정하는 헤더)
+EXCLUDED_RESPONSE_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "date",
+    "server",
+}
+
+# ✅ 유틸리티 함수: 클라이언트로 전달할 응답 헤더 선택
+def filter_response_headers(headers) -> HeaderList:
+    """
+    hop-by-hop 헤더와 CORS 헤더(게이트웨이 미들웨어가 설정)를 제외한 응답 헤더 목록을 반환합니다.
+
+    같은 이름이 반복되는 헤더(Set-Cookie 등)는 합치지 않고 각각 전달합니다.
+    """
+    return [
+        (name, value)
+        for name, value in headers.multi_items()
+        if name.lower() not in EXCLUDED_RESPONSE_HEADERS
+        and not name.lower().startswith("access-control-")
+    ]
+
+# ✅ 유틸리티 함수: 백엔드 응답 바이트를 그대로 전달
+def create_passthrough_response(response):
+    """
+    백엔드 응답의 상태 코드, 헤더, 본문 바이트를 변환 없이 스트리밍합니다.
+
+    본문은 aiter_raw()로 읽으므로 압축된 응답도 디코딩하지 않고 그대로 전달되며,
+    스트리밍이 끝나면 백그라운드 태스크에서 업스트림 커넥션을 풀에 반환합니다.
+    """
+    # 이미 본문을 읽은 응답(게이트웨이가 생성한 오류 응답 등)은 그대로 반환
+    if response.is_stream_consumed:
+        return apply_raw_headers(
+            Response(content=response.content, status_code=response.status_code),
+            filter_response_headers(response.headers)
+        )
+    return apply_raw_headers(
+        StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            background=BackgroundTask(response.aclose)
+        ),
+        filter_response_headers(response.headers)
+    )
+
 # ✅ 유틸리티 함수: 요청 처리 결과 반환
 def create_response(response):
     """서비스 응답에 대한 일관된 응답 생성"""
+    if RESPONSE_PASSTHROUGH:
+        return create_passthrough_response(response)
     try:
         if response.status_code == 200:
             return JSONResponse(
@@ -79,6 +173,188 @@ def create_response(response):
             status_code=500
         )
 
+# ✅ 유틸리티 함수: 캐시된 응답 반환
+def create_cached_response(entry: CachedResponse, request: Request, cache_status: str):
+    """캐시 항목으로 응답을 생성합니다. If-None-Match가 ETag와 일치하면 본문 없이 304를 반환합니다."""
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response_cache.not_modified += 1
+        return Response(
+            status_code=304,
+            headers={"etag": entry.etag, "x-cache": cache_status}
+        )
+    return apply_raw_headers(
+        Response(content=entry.body, status_code=entry.status_code),
+        entry.headers + [("x-cache", cache_status)]
+    )
+
+# ✅ 유틸리티 함수: 응답 캐시 저장 가능 여부 확인
+def is_cacheable_response(status_code: int, headers: HeaderList) -> bool:
+    """200 응답이면서 no-store/private, Set-Cookie가 없는 경우만 캐시합니다."""
+    if status_code != 200:
+        return False
+    cache_control = get_header(headers, "cache-control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return False
+    if has_header(headers, "set-cookie"):
+        return False
+    return True
+
+# ✅ 유틸리티 함수: 공유된 GET 응답 반환
+def create_shared_response(shared: SharedResponse):
+    """여러 요청이 공유하는 백엔드 응답(원본 바이트)으로 응답을 생성합니다."""
+    return apply_raw_headers(
+        Response(content=shared.body, status_code=shared.status_code),
+        shared.headers
+    )
+
+# ✅ 유틸리티 함수: SSE 요청 여부 확인
+def is_event_stream_request(request: Request) -> bool:
+    """클라이언트가 text/event-stream 응답을 요청했는지 확인합니다. (EventSource 등)"""
+    return "text/event-stream" in request.headers.get("accept", "").lower()
+
+# ✅ SSE 요청을 백엔드에 전달하고 받은 이벤트를 즉시 스트리밍
+async def proxy_event_stream(factory: ServiceProxyFactory, service: ServiceType, method: str, path: str, request: Request, body=None, params=None):
+    """
+    SSE 요청을 캐시와 요청 합치기 없이 백엔드에 전달하고, 응답 청크를 받는 즉시 클라이언트로 보냅니다.
+
+    서비스별 동시 스트림 수(MAX_STREAMS)를 넘으면 503을 반환하고,
+    응답 헤더 이후에는 STREAM_IDLE_TIMEOUT초 동안 이벤트가 없을 때 스트림을 닫습니다.
+    """
+    try:
+        stream_limiter.acquire(service, "sse")
+    except StreamLimitError as e:
+        return JSONResponse(content={"detail": str(e)}, status_code=503, headers={"retry-after": "5"})
+
+    released = False
+
+    def release():
+        nonlocal released
+        if not released:
+            released = True
+            stream_limiter.release(service, "sse")
+
+    try:
+        response = await factory.request(
+            method=method,
+            path=path,
+            headers=request.headers.raw,
+            body=body,
+            params=params,
+            stream=True,
+            stream_idle_timeout=stream_limiter.idle_timeout(service)
+        )
+    except BaseException:
+        release()
+        raise
+
+    if response.is_stream_consumed:
+        # 게이트웨이가 생성한 오류 응답
+        release()
+        return create_passthrough_response(response)
+
+    headers = without_header(filter_response_headers(response.headers), "x-accel-buffering")
+    if not has_header(headers, "cache-control"):
+        headers.append(("cache-control", "no-cache"))
+    # 중간 프록시(nginx 등)의 응답 버퍼링 비활성화
+    headers.append(("x-accel-buffering", "no"))
+    return EventStreamResponse(response, service, release, status_code=response.status_code, headers=headers)
+
+# ✅ 유틸리티 함수: 스트리밍 중인 백엔드 응답 본문을 읽어 공유 가능한 응답으로 변환
+async def read_shared_response(response) -> SharedResponse:
+    """백엔드 응답의 원본 바이트(압축된 경우 압축 상태 그대로)를 읽고 커넥션을 반환합니다."""
+    try:
+        if response.is_stream_consumed:
+            body = response.content
+        else:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+    finally:
+        await response.aclose()
+    return SharedResponse(
+        status_code=response.status_code,
+        headers=filter_response_headers(response.headers),
+        body=body
+    )
+
+# ✅ 유틸리티 함수: 아무도 받지 않은 스트리밍 응답 정리
+async def discard_stream(result):
+    if isinstance(result, httpx.Response):
+        await result.aclose()
+
+# ✅ GET 요청을 백엔드에 전달 (동일 요청은 하나로 합침)
+async def fetch_shared_get(factory: ServiceProxyFactory, service: ServiceType, path: str, request: Request, allow_stream: bool = False):
+    """
+    GET 요청을 백엔드에 전달합니다.
+
+    같은 서비스, 경로, 쿼리, 캐시 키 헤더(Authorization, Cookie 포함)를 가진 요청이 이미 진행 중이면
+    새로 호출하지 않고 진행 중인 호출의 결과(SharedResponse)를 함께 사용합니다.
+    Set-Cookie가 있는 응답은 공유하지 않고 대기자가 각자 백엔드를 호출합니다.
+
+    allow_stream이 True이고 응답 헤더를 받을 때까지 합쳐진 요청이 없으면 본문을 버퍼링하지 않고
+    스트리밍 중인 httpx.Response를 그대로 반환합니다. (호출자가 create_passthrough_response로 전달)
+    """
+    # 조건부 요청 헤더는 게이트웨이가 직접 처리하므로 백엔드에는 전달하지 않음
+    upstream_headers = [
+        (name, value) for name, value in request.headers.raw
+        if name.lower() not in (b"if-none-match", b"if-modified-since")
+    ]
+    params = request.query_params.multi_items()
+
+    async def open_stream():
+        return await factory.request(
+            method="GET",
+            path=path,
+            headers=upstream_headers,
+            params=params,
+            stream=True
+        )
+
+    async def fetch():
+        response = await open_stream()
+        if flight_key is not None:
+            # 응답 헤더를 받은 뒤에는 새 요청을 합치지 않음 (그 이후 요청은 각자 호출)
+            waiters = singleflight.detach(flight_key)
+            if waiters == 0 and allow_stream and not response.is_stream_consumed:
+                return response
+        return await read_shared_response(response)
+
+    if not singleflight.applies_to(service, path):
+        flight_key = None
+        return await fetch()
+
+    # 요청 합치기 키는 캐시 키와 같은 기준(서비스, 경로, 쿼리, 선택된 헤더)으로 생성
+    flight_key = response_cache.make_key(service, path, request.url.query, request.headers)
+    result, coalesced = await singleflight.do(flight_key, fetch, discard=discard_stream)
+    if coalesced:
+        if has_header(result.headers, "set-cookie"):
+            # 다른 클라이언트용 쿠키가 포함된 응답은 공유하지 않음
+            return await read_shared_response(await open_stream())
+        logger.info(f"🔗 진행 중인 요청과 합침: 서비스={service.value}, 경로={path}")
+    return result
+
+# ✅ 캐시 대상 GET 요청 처리
+async def proxy_cached_get(factory: ServiceProxyFactory, service: ServiceType, path: str, request: Request, ttl: float):
+    """
+    캐시 대상 라우트의 GET 요청을 처리합니다.
+
+    캐시 키는 서비스, 경로, 쿼리, 선택된 헤더로 구성되며,
+    Cache-Control: no-cache 요청은 캐시를 조회하지 않고 백엔드 응답으로 캐시를 갱신합니다.
+    """
+    cache_key = response_cache.make_key(service, path, request.url.query, request.headers)
+
+    if "no-cache" not in request.headers.get("cache-control", "").lower():
+        entry = response_cache.get(cache_key)
+        if entry is not None:
+            return create_cached_response(entry, request, "HIT")
+
+    shared = await fetch_shared_get(factory, service, path, request)
+    if not is_cacheable_response(shared.status_code, shared.headers):
+        return create_shared_response(shared)
+
+    entry = response_cache.store(cache_key, shared.status_code, shared.headers, shared.body, ttl)
+    if entry is None:
+        return create_shared_response(shared)
+    return create_cached_response(entry, request, "MISS")
+
 # GET - 일반 동적 라우팅
 @gateway_router.get("/{service}/{path:path}", summary="GET 프록시")
 async def proxy_get(
@@ -88,10 +364,31 @@ async def proxy_get(
 ):
     try:
         factory = ServiceProxyFactory(service_type=service)
+
+        # SSE 요청은 캐시/요청 합치기 없이 스트리밍
+        if is_event_stream_request(request):
+            return await proxy_event_stream(
+                factory, service, "GET", path, request, params=request.query_params.multi_items()
+            )
+
+        # 캐시 대상 라우트인 경우
+        ttl = response_cache.ttl_for(service, path)
+        if ttl is not None:
+            return await proxy_cached_get(factory, service, path, request, ttl)
+
+        # 동일한 요청 합치기 대상인 경우 (패스스루 모드에서만 사용)
+        if RESPONSE_PASSTHROUGH and singleflight.applies_to(service, path):
+            result = await fetch_shared_get(factory, service, path, request, allow_stream=True)
+            if isinstance(result, SharedResponse):
+                return create_shared_response(result)
+            return create_passthrough_response(result)
+
         response = await factory.request(
             method="GET",
             path=path,
-            headers=request.headers.raw
+            headers=request.headers.raw,
+            params=request.query_params.multi_items(),
+            stream=RESPONSE_PASSTHROUGH
         )
         return create_response(response)
     except Exception as e:
@@ -107,39 +404,42 @@ async def proxy_post(
     service: ServiceType, 
     path: str,
     request: Request,
-    file: Optional[UploadFile] = None,
     sheet_names: Optional[List[str]] = Query(None, alias="sheet_name")
 ):
     try:
         # 로깅
         logger.info(f"🌈 POST 요청 받음: 서비스={service}, 경로={path}")
-        if file:
-            logger.info(f"파일명: {file.filename}, 시트 이름: {sheet_names if sheet_names else '없음'}")
+        content_type = request.headers.get("content-type", "")
+        is_multipart = content_type.startswith("multipart/form-data")
+        if is_multipart:
+            logger.info(
+                f"파일 업로드 스트리밍: 크기={request.headers.get('content-length', '알 수 없음')}, "
+                f"시트 이름: {sheet_names if sheet_names else '없음'}"
+            )
 
         # 서비스 팩토리 생성
         factory = ServiceProxyFactory(service_type=service)
         
         # 요청 파라미터 초기화
-        files = None
         params = None
         body = None
         data = None
+        upload_stream = None
         
         # 파일이 필요한 서비스 처리
         if service in FILE_REQUIRED_SERVICES:
             # dsdgen, xbrlgen과 같이 파일이 필요한 서비스인 경우
             
             # 서비스 URI가 upload인 경우만 파일 체크
-            if "upload" in path and not file:
+            if "upload" in path and not is_multipart:
                 raise HTTPException(status_code=400, detail=f"서비스 {service}에는 파일 업로드가 필요합니다.")
             
-            # 파일이 제공된 경우 처리
-            if file:
-                file_content = await file.read()
-                files = {'file': (file.filename, file_content, file.content_type)}
-                
-                # 파일 위치 되돌리기 (다른 코드에서 다시 읽을 수 있도록)
-                await file.seek(0)
+            # 파일이 제공된 경우 multipart 본문을 파싱하지 않고 청크 단위로 그대로 전달
+            # (Content-Type 헤더의 boundary도 그대로 전달되므로 백엔드가 직접 파싱)
+            if is_multipart:
+                upload_stream = LimitedRequestStream(request, max_bytes=MAX_UPLOAD_BYTES)
+                upload_stream.check_declared_length()
+                body = upload_stream
             
             # 시트 이름이 제공된 경우 처리
             if sheet_names:
@@ -163,20 +463,35 @@ async def proxy_post(
             except Exception as e:
                 logger.warning(f"요청 본문 읽기 실패: {str(e)}")
                 
+        # SSE 요청은 응답을 받는 즉시 스트리밍 (LLM 토큰 스트리밍 등)
+        if upload_stream is None and is_event_stream_request(request):
+            return await proxy_event_stream(factory, service, "POST", path, request, body=body, params=params)
+
         # 서비스에 요청 전달
         response = await factory.request(
             method="POST",
             path=path,
             headers=request.headers.raw,
             body=body,
-            files=files,
             params=params,
-            data=data
+            data=data,
+            stream=RESPONSE_PASSTHROUGH
         )
         
+        # 전송 중 최대 업로드 크기를 넘은 경우
+        if upload_stream is not None and upload_stream.exceeded:
+            await response.aclose()
+            raise UploadTooLargeError(MAX_UPLOAD_BYTES)
+        
         # 응답 처리 및 반환
         return create_response(response)
         
+    except UploadTooLargeError as ue:
+        logger.warning(f"업로드 크기 초과: 서비스={service}, 경로={path}")
+        return JSONResponse(
+            content={"detail": str(ue)},
+            status_code=413
+        )
     except HTTPException as he:
         # HTTP 예외는 그대로 반환
         return JSONResponse(
@@ -191,6 +506,23 @@ async def proxy_post(
             status_code=500
         )
 
+# WebSocket - 백엔드 WebSocket으로 터널링
+@gateway_router.websocket("/{service}/{path:path}")
+async def proxy_websocket(websocket: WebSocket, service: ServiceType, path: str):
+    """클라이언트 WebSocket을 백엔드 WebSocket에 연결합니다. 동시 스트림 한도를 넘으면 연결을 거절합니다. (1013)"""
+    try:
+        stream_limiter.acquire(service, "websocket")
+    except StreamLimitError:
+        logger.warning(f"WebSocket 동시 연결 한도 초과: 서비스={service}")
+        await websocket.close(code=1013)
+        return
+    try:
+        await tunnel_websocket(websocket, service, path, stream_limiter.idle_timeout(service))
+    except Exception as e:
+        logger.error(f"WebSocket 프록시 중 오류 발생: {str(e)}")
+    finally:
+        stream_limiter.release(service, "websocket")
+
 # PUT - 일반 동적 라우팅
 @gateway_router.put("/{service}/{path:path}", summary="PUT 프록시")
 async def proxy_put(service: ServiceType, path: str, request: Request):
@@ -200,7 +532,8 @@ async def proxy_put(service: ServiceType, path: str, request: Request):
             method="PUT",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            body=await request.body(),
+            stream=RESPONSE_PASSTHROUGH
         )
         return create_response(response)
     except Exception as e:
@@ -219,7 +552,8 @@ async def proxy_delete(service: ServiceType, path: str, request: Request):
             method="DELETE",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            body=await request.body(),
+            stream=RESPONSE_PASSTHROUGH
         )
         return create_response(response)
     except Exception as e:
@@ -238,7 +572,8 @@ async def proxy_patch(service: ServiceType, path: str, request: Request):
             method="PATCH",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            body=await request.body(),
+            stream=RESPONSE_PASSTHROUGH
         )
         return create_response(response)
     except Exception as e:
@@ -248,9 +583,24 @@ async def proxy_patch(service: ServiceType, path: str, request: Request):
             status_code=500
         )
 
+# ✅ 배치 라우터 등록 (동적 프록시 라우트보다 먼저 등록)
+app.include_router(batch_router)
+
+# ✅ 비동기 작업 라우터 등록 (동적 프록시 라우트보다 먼저 등록)
+app.include_router(job_router)
+
 # ✅ 메인 라우터 등록
 app.include_router(gateway_router)
 
+# ✅ 관리용 라우터 등록 (캐시 통계 등)
+app.include_router(admin_router)
+
+# ✅ 메트릭 라우터 등록 (/metrics)
+app.include_router(metrics_router)
+
+# ✅ 헬스 체크 라우터 등록 (/health, /ready)
+app.include_router(health_router)
+
 # 404 에러 핸들러
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
@@ -266,6 +616,6 @@ async def root():
 
 # ✅ 서버 실행
 if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("SERVICE_PORT", 8080))
-    uvicorn.run("app.main:app", host="0.0.0.0", port=port, reload=True)
+    from app.launcher import run
+    # 캐시, 요청 한도, 비동기 작업 대기열을 프로세스 메모리에 보관하므로 기본 워커는 1개
+    run("app.main:app", port=int(os.getenv("SERVICE_PORT", 8080)), workers=1)
@@ -0,0 +1,222 @@
+# compression_middleware.py
+import os
+import zlib
+from typing import List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli가 설치되지 않은 경우 gzip만 사용
+    brotli = None
+
+# 압축 대상 Content-Type (text/event-stream은 이벤트 단위 전달이 지연되므로 제외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type or media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더의 q 값을 고려해 사용할 인코딩을 고릅니다.
+
+    q 값이 같으면 available에 먼저 나열된 인코딩(br → gzip)을 선택하고, 사용할 수 있는 인코딩이 없으면 None을 반환합니다.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (gzip, brotli)
+
+    클라이언트의 Accept-Encoding에 따라 인코딩을 고르고, 응답 본문을 청크 단위로 압축해 전체 본문을 버퍼링하지 않습니다.
+    본문이 minimum_size보다 작거나, 이미 Content-Encoding이 있는 응답(압축된 업스트림 응답)은 그대로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        enabled: bool = True,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.enabled = enabled
+        self.encodings: List[str] = (["br"] if brotli is not None else []) + ["gzip"]
+
+    @classmethod
+    def options_from_env(cls) -> dict:
+        """환경변수에서 압축 설정을 읽습니다. (app.add_middleware 인자로 사용)"""
+        return {
+            "minimum_size": int(os.getenv("GATEWAY_COMPRESSION_MIN_SIZE", "1024")),
+            "gzip_level": int(os.getenv("GATEWAY_COMPRESSION_GZIP_LEVEL", "6")),
+            "brotli_quality": int(os.getenv("GATEWAY_COMPRESSION_BROTLI_QUALITY", "4")),
+            "enabled": os.getenv("GATEWAY_COMPRESSION_ENABLED", "true").lower() == "true",
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나에 대한 압축 상태"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        # None: 아직 결정 전, True: 압축, False: 그대로 전달
+        self.compress: Optional[bool] = None
+        self.pending: List[bytes] = []
+        self.pending_size = 0
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start_message = message
+            if not self._should_compress(message):
+                self.compress = False
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self.compress is False:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compress is None:
+            # 최소 크기에 도달하거나 본문이 끝날 때까지 앞부분만 모아서 압축 여부를 결정
+            if body:
+                self.pending.append(body)
+                self.pending_size += len(body)
+            if self.pending_size < self.middleware.minimum_size and more_body:
+                return
+            buffered = b"".join(self.pending)
+            self.pending = []
+            if self.pending_size < self.middleware.minimum_size:
+                self.compress = False
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": buffered, "more_body": False})
+                return
+            self._begin_compression()
+            await self._send(self.start_message)
+            body = buffered
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        if chunk or not more_body:
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _should_compress(self, message: Message) -> bool:
+        status = message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+        content_length = headers.get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) < self.middleware.minimum_size:
+            return False
+        return True
+
+    def _begin_compression(self):
+        self.compress = True
+        if self.encoding == "br":
+            self.compressor = _BrotliCompressor(self.middleware.brotli_quality)
+        else:
+            self.compressor = _GzipCompressor(self.middleware.gzip_level)
+
+        headers = MutableHeaders(raw=list(self.start_message["headers"]))
+        del headers["content-length"]
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # 인코딩별로 본문 바이트가 달라지므로 강한 ETag는 약한 ETag로 변환
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = "W/" + etag
+        self.start_message["headers"] = headers.raw
@@ -0,0 +1,83 @@
+# rate_limit_middleware.py
+import json
+import math
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.domain.model.service_type import ServiceType
+from app.platform.rate_limit import RateLimitExceeded, RateLimiter
+
+logger = logging.getLogger("gateway-api")
+
+# 서비스 이름 앞에 오는 경로 접두사 (/api/{service}/..., /api/_jobs/{service}/...)
+PROXY_PREFIXES = ("/api/_jobs/", "/api/")
+
+
+def retry_after_header(retry_after: float) -> str:
+    """Retry-After 헤더 값 (정수 초, 최소 1초)"""
+    return str(max(1, math.ceil(retry_after)))
+
+
+def proxy_target(path: str):
+    """요청 경로에서 (서비스, 서비스 내부 경로)를 찾습니다. 프록시 경로가 아니면 None을 반환합니다."""
+    for prefix in PROXY_PREFIXES:
+        if path.startswith(prefix):
+            service, _, rest = path[len(prefix):].partition("/")
+            try:
+                return ServiceType(service), rest
+            except ValueError:
+                continue
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    프록시 요청(/api/{service}/{path}, WebSocket, POST /api/_jobs/{service}/{path})에
+    클라이언트·라우트별 요청 한도를 적용하는 ASGI 미들웨어
+
+    한도를 넘은 HTTP 요청은 백엔드로 보내지 않고 429와 Retry-After로 응답하며,
+    WebSocket은 handshake 단계에서 연결을 거절합니다.
+    배치 요청과 JSON 작업 제출은 본문에 대상이 있으므로 각 라우터에서 같은 한도를 확인합니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        target = proxy_target(scope["path"])
+        if target is None or scope.get("method") == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        service_type, path = target
+        client = scope.get("client")
+        identity = self.limiter.identify(scope.get("headers", []), client[0] if client else None)
+        try:
+            await self.limiter.check(identity, service_type, path)
+        except RateLimitExceeded as e:
+            if scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1008})
+                return
+            await self._send_throttled(send, e)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _send_throttled(send: Send, error: RateLimitExceeded):
+        body = json.dumps({"detail": str(error)}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", retry_after_header(error.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,67 @@
+# deadline.py
+import os
+import time
+from typing import Optional
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import match_route_value, parse_route_values
+
+# 백엔드로 전달하는 요청 마감 시각 헤더 (Unix epoch 초, 소수점 이하 밀리초)
+DEADLINE_HEADER = "x-request-deadline"
+
+# 기본 라우트별 타임아웃 ("서비스:경로패턴" → 초)
+DEFAULT_ROUTE_TIMEOUTS = "stocktrend:*stocks=10,dsdgen:dsdgen/dsd-auto-fetch=120,irsummary:pdfsummary=180,esgdsd:extract=180"
+
+
+def parse_deadline(value: Optional[str]) -> Optional[float]:
+    """X-Request-Deadline 헤더 값을 epoch 초로 변환합니다. 형식이 잘못되면 None을 반환합니다."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def format_deadline(deadline: float) -> str:
+    """epoch 초를 X-Request-Deadline 헤더 값으로 변환합니다."""
+    return f"{deadline:.3f}"
+
+
+class RouteTimeouts:
+    """
+    라우트별 타임아웃 설정
+
+    GATEWAY_ROUTE_TIMEOUTS에 "서비스:경로패턴=초" 목록으로 지정하며,
+    일치하는 라우트가 없으면 GATEWAY_DEFAULT_TIMEOUT을 사용합니다.
+    """
+
+    def __init__(self, routes, default_timeout: float):
+        self.routes = routes
+        self.default_timeout = default_timeout
+
+    @classmethod
+    def from_env(cls) -> "RouteTimeouts":
+        return cls(
+            routes=parse_route_values(os.getenv("GATEWAY_ROUTE_TIMEOUTS", DEFAULT_ROUTE_TIMEOUTS)),
+            default_timeout=float(os.getenv("GATEWAY_DEFAULT_TIMEOUT", "30")),
+        )
+
+    def timeout_for(self, service_type: ServiceType, path: str) -> float:
+        timeout = match_route_value(self.routes, service_type, path)
+        return timeout if timeout and timeout > 0 else self.default_timeout
+
+    def deadline_for(self, service_type: ServiceType, path: str, incoming_deadline: Optional[float] = None) -> float:
+        """
+        요청의 마감 시각을 계산합니다.
+
+        클라이언트가 X-Request-Deadline을 보낸 경우 라우트 타임아웃과 비교해 더 이른 시각을 사용합니다.
+        """
+        deadline = time.time() + self.timeout_for(service_type, path)
+        if incoming_deadline is not None:
+            deadline = min(deadline, incoming_deadline)
+        return deadline
+
+
+# 게이트웨이 전역 라우트 타임아웃 설정
+route_timeouts = RouteTimeouts.from_env()
@@ -1 +1,105 @@
- 
\ No newline at end of file
+# http_client.py
+import logging
+from typing import AsyncIterator, Callable, Dict
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import service_env_float, service_env_int
+
+logger = logging.getLogger("gateway-api")
+
+
+def get_pool_limits(service_type: ServiceType) -> httpx.Limits:
+    """
+    서비스별 커넥션 풀 제한값을 환경변수에서 읽어 생성합니다.
+
+    서비스별 설정({SERVICE}_POOL_*)이 없으면 게이트웨이 공통 설정(GATEWAY_POOL_*)을 사용합니다.
+    예: DSDGEN_POOL_MAX_CONNECTIONS=50, GATEWAY_POOL_KEEPALIVE_EXPIRY=30
+    """
+    max_connections = service_env_int(service_type, "POOL_MAX_CONNECTIONS", 100)
+    max_keepalive = service_env_int(service_type, "POOL_MAX_KEEPALIVE", 20)
+    keepalive_expiry = service_env_float(service_type, "POOL_KEEPALIVE_EXPIRY", 30.0)
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class CountingStream(httpx.AsyncByteStream):
+    """
+    업스트림 응답 스트림을 감싸 전달된 바이트 수를 세는 스트림
+
+    응답이 닫힐 때 on_close 콜백으로 전체 크기를 한 번 전달합니다.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[int], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+        self.size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self.size += len(chunk)
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close(self.size)
+
+
+class ServiceClientRegistry:
+    """
+    서비스별로 재사용되는 httpx.AsyncClient 레지스트리
+
+    게이트웨이 lifespan에서 start()로 생성하고 shutdown 시 close()로 정리합니다.
+    요청마다 클라이언트를 새로 만들지 않으므로 keep-alive 커넥션이 재사용됩니다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
+
+    def _create_client(self, service_type: ServiceType) -> httpx.AsyncClient:
+        limits = get_pool_limits(service_type)
+        logger.info(
+            f"🔌 {service_type.value} 클라이언트 생성: "
+            f"max_connections={limits.max_connections}, "
+            f"max_keepalive={limits.max_keepalive_connections}, "
+            f"keepalive_expiry={limits.keepalive_expiry}"
+        )
+        return httpx.AsyncClient(limits=limits, timeout=30)
+
+    async def start(self):
+        """모든 서비스 타입에 대한 클라이언트를 미리 생성합니다."""
+        for service_type in ServiceType:
+            if service_type not in self._clients:
+                self._clients[service_type] = self._create_client(service_type)
+
+    def get(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """서비스 타입에 해당하는 공유 클라이언트를 반환합니다."""
+        client = self._clients.get(service_type)
+        if client is None or client.is_closed:
+            # lifespan 밖에서 호출된 경우(테스트, 스크립트 등)에도 동작하도록 지연 생성
+            client = self._create_client(service_type)
+            self._clients[service_type] = client
+        return client
+
+    async def close(self):
+        """모든 클라이언트의 커넥션을 닫습니다."""
+        for service_type, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"{service_type.value} 클라이언트 종료 실패: {str(e)}")
+        self._clients.clear()
+
+
+# 게이트웨이 전역 클라이언트 레지스트리
+client_registry = ServiceClientRegistry()
@@ -0,0 +1,193 @@
+# metrics.py
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# 기본 지연 시간 버킷(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# 기본 크기 버킷(바이트)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+LabelValues = Tuple[str, ...]
+
+
+def status_class(status_code: int) -> str:
+    """HTTP 상태 코드를 2xx, 4xx 같은 상태 클래스로 변환합니다."""
+    return f"{status_code // 100}xx"
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def set(self, labels: LabelValues, value: float):
+        """다른 컴포넌트가 이미 누적 중인 카운터 값을 collector에서 그대로 반영할 때 사용합니다."""
+        self._values[labels] = value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Gauge:
+    """현재 값을 나타내는 게이지"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, labels: LabelValues, value: float):
+        self._values[labels] = value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} gauge"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램
+
+    관측 시에는 해당 버킷 하나만 증가시키고 누적 합계는 출력할 때 계산합니다.
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # 레이블별 [버킷별 개수 리스트, 합계, 개수]
+        self._series: Dict[LabelValues, List] = {}
+
+    def observe(self, labels: LabelValues, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = [[0] * len(self.buckets), 0.0, 0]
+            self._series[labels] = series
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.label_names, labels)} {count}"
+
+
+class MetricsRegistry:
+    """
+    게이트웨이 메트릭 레지스트리
+
+    게이트웨이는 단일 이벤트 루프에서 동작하므로 기록 시 락을 사용하지 않습니다.
+    collector는 출력 직전에 호출되어 다른 컴포넌트(캐시, bulkhead 등)의 상태를 게이지로 반영합니다.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 모든 메트릭을 출력합니다."""
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 게이트웨이 전역 메트릭 레지스트리와 프록시 메트릭
+metrics_registry = MetricsRegistry()
+
+upstream_latency = metrics_registry.register(Histogram(
+    "gateway_upstream_request_duration_seconds",
+    "Upstream response time until headers are received",
+    ("service", "method", "status_class"),
+    LATENCY_BUCKETS,
+))
+upstream_request_size = metrics_registry.register(Histogram(
+    "gateway_upstream_request_size_bytes",
+    "Size of request bodies forwarded to upstream services",
+    ("service", "method"),
+    SIZE_BUCKETS,
+))
+upstream_response_size = metrics_registry.register(Histogram(
+    "gateway_upstream_response_size_bytes",
+    "Size of upstream response bodies as received (before decoding)",
+    ("service", "method", "status_class"),
+    SIZE_BUCKETS,
+))
+upstream_in_flight = metrics_registry.register(Gauge(
+    "gateway_upstream_in_flight_requests",
+    "Upstream requests currently waiting for response headers",
+    ("service",),
+))
+upstream_retries = metrics_registry.register(Counter(
+    "gateway_upstream_retries_total",
+    "Upstream requests retried after a transient failure",
+    ("service",),
+))
+upstream_hedges = metrics_registry.register(Counter(
+    "gateway_upstream_hedged_requests_total",
+    "Hedged requests sent to a second replica after the p95 latency",
+    ("service",),
+))
+rate_limited_requests = metrics_registry.register(Counter(
+    "gateway_rate_limited_requests_total",
+    "Requests rejected with 429 by the per-client rate limiter",
+    ("service",),
+))
@@ -0,0 +1,91 @@
+# priority.py
+import os
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("gateway-api")
+
+# 요청 우선순위 헤더
+PRIORITY_HEADER = "x-priority"
+
+# API 키 헤더 (키별 등급으로 우선순위 결정)
+API_KEY_HEADER = "x-api-key"
+
+# 기본 우선순위 등급과 가중치 (먼저 나열한 등급이 가장 높은 우선순위)
+DEFAULT_PRIORITY_CLASSES = "interactive=8,batch=1"
+
+
+def parse_weights(spec: str) -> List[Tuple[str, float]]:
+    """
+    "등급=가중치" 목록 문자열을 파싱합니다. 순서를 유지합니다.
+
+    예: "interactive=8,batch=1" → [("interactive", 8.0), ("batch", 1.0)]
+    """
+    classes = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, weight = item.partition("=")
+        try:
+            classes.append((name.strip().lower(), float(weight) if weight else 1.0))
+        except ValueError:
+            logger.warning(f"잘못된 우선순위 등급 설정을 무시합니다: {item}")
+    return classes
+
+
+def parse_api_key_tiers(spec: str) -> Dict[str, str]:
+    """"API키:등급" 목록 문자열을 파싱합니다. (예: "batch-key-1:batch,partner-key:interactive")"""
+    tiers = {}
+    for item in spec.split(","):
+        key, _, tier = item.strip().rpartition(":")
+        if key and tier:
+            tiers[key.strip()] = tier.strip().lower()
+    return tiers
+
+
+class PriorityClassifier:
+    """
+    요청을 우선순위 등급으로 분류합니다.
+
+    X-API-Key의 등급(없으면 기본 등급)이 요청이 받을 수 있는 가장 높은 등급이며,
+    X-Priority 헤더로는 그보다 낮은 등급만 선택할 수 있습니다. 알 수 없는 등급은 무시합니다.
+    """
+
+    def __init__(self, classes: List[Tuple[str, float]], default: str, api_key_tiers: Dict[str, str]):
+        self.classes = classes or [("interactive", 1.0)]
+        self.weights: Dict[str, float] = dict(self.classes)
+        self.ranks: Dict[str, int] = {name: rank for rank, (name, _) in enumerate(self.classes)}
+        self.default = default if default in self.weights else self.classes[0][0]
+        self.api_key_tiers = api_key_tiers
+
+    @classmethod
+    def from_env(cls) -> "PriorityClassifier":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            classes=parse_weights(os.getenv("GATEWAY_PRIORITY_CLASSES", DEFAULT_PRIORITY_CLASSES)),
+            default=os.getenv("GATEWAY_PRIORITY_DEFAULT", "interactive").lower(),
+            api_key_tiers=parse_api_key_tiers(os.getenv("GATEWAY_API_KEY_TIERS", "")),
+        )
+
+    @property
+    def highest(self) -> str:
+        """가장 높은 우선순위 등급"""
+        return self.classes[0][0]
+
+    def classify(self, priority: Optional[str], api_key: Optional[str]) -> str:
+        ceiling = self.default
+        if api_key:
+            tier = self.api_key_tiers.get(api_key.strip())
+            if tier in self.weights:
+                ceiling = tier
+        if priority:
+            priority = priority.strip().lower()
+            # 헤더로는 우선순위를 낮추는 것만 허용
+            if priority in self.ranks and self.ranks[priority] > self.ranks[ceiling]:
+                return priority
+        return ceiling
+
+
+# 게이트웨이 전역 우선순위 분류기
+priority_classifier = PriorityClassifier.from_env()
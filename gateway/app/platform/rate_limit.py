@@ -0,0 +1,251 @@
+# rate_limit.py
+import os
+import time
+import hashlib
+import logging
+import ipaddress
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Collection, Dict, Iterable, List, Optional, Tuple, Union
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import parse_route_values
+from app.platform.metrics import rate_limited_requests
+from app.platform.priority import priority_classifier
+
+logger = logging.getLogger("gateway-api")
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# 기본 제한 대상 라우트 ("서비스:경로 패턴" → 분당 요청 수)
+# OCR(esgdsd extract), PDF 요약, OpenDART 할당량을 쓰는 XBRL 수집 경로
+DEFAULT_RATE_LIMITS = (
+    "esgdsd:extract=6,irsummary:pdfsummary=6,"
+    "dsdgen:dsdgen/dsd-auto-fetch=20,dsdgen:opendart/*=20,dsdgen:xbrl-parser/*=20"
+)
+
+
+class RateLimitExceeded(Exception):
+    """클라이언트가 라우트의 요청 한도를 넘은 경우 발생하는 예외"""
+
+    def __init__(self, service_type: ServiceType, retry_after: float):
+        self.service_type = service_type
+        self.retry_after = retry_after
+        super().__init__(f"서비스 {service_type.value}의 요청 한도를 초과했습니다. {retry_after:.0f}초 후 다시 시도해 주세요.")
+
+
+class RateLimitStore(ABC):
+    """
+    토큰 버킷 상태 저장소 인터페이스
+
+    게이트웨이를 여러 레플리카로 실행할 때는 같은 인터페이스로 공유 저장소(Redis 등) 구현을 추가해
+    create_store()에서 선택하도록 합니다. 버킷 갱신은 키 하나에 대해 원자적으로 수행해야 합니다.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, rate: float, burst: float, cost: float = 1.0) -> float:
+        """
+        키의 버킷에서 cost만큼 토큰을 꺼냅니다.
+
+        Args:
+            rate: 초당 충전되는 토큰 수
+            burst: 버킷 최대 토큰 수
+
+        Returns:
+            허용되면 0, 거절되면 다시 시도할 수 있을 때까지 남은 시간(초)
+        """
+
+    def stats(self) -> Dict[str, object]:
+        return {}
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    프로세스 메모리에 버킷을 보관하는 저장소
+
+    버킷은 max_keys개까지 최근 사용 순서로 보관하며, 오래 사용하지 않은 버킷부터 제거합니다.
+    (제거된 버킷은 가득 찬 상태로 다시 시작하므로, 한도를 자주 넘는 클라이언트에는 영향이 거의 없습니다.)
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def consume(self, key: str, rate: float, burst: float, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+
+        retry_after = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+        return retry_after
+
+    def stats(self) -> Dict[str, object]:
+        return {"keys": len(self._buckets), "max_keys": self.max_keys, "evictions": self.evictions}
+
+
+def create_store(kind: str) -> RateLimitStore:
+    """GATEWAY_RATE_LIMIT_STORE 값에 해당하는 저장소를 생성합니다."""
+    if kind != "memory":
+        logger.warning(f"지원하지 않는 요청 한도 저장소입니다: {kind} (memory 사용)")
+    return InMemoryRateLimitStore(max_keys=int(os.getenv("GATEWAY_RATE_LIMIT_MAX_KEYS", "100000")))
+
+
+def parse_networks(spec: str) -> List[Network]:
+    """"IP 또는 CIDR" 목록 문자열을 파싱합니다. (예: "10.0.0.0/8,192.168.0.10")"""
+    networks = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(item, strict=False))
+        except ValueError:
+            logger.warning(f"잘못된 프록시 주소 설정을 무시합니다: {item}")
+    return networks
+
+
+def _is_trusted(address: str, trusted_proxies: Collection[Network]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def forwarded_client(forwarded_for: str, trusted_proxies: Collection[Network]) -> Optional[str]:
+    """
+    X-Forwarded-For에서 클라이언트 IP를 찾습니다.
+
+    왼쪽 항목은 클라이언트가 임의로 넣을 수 있으므로, 오른쪽(게이트웨이에 가까운 쪽)부터
+    신뢰하는 프록시 주소를 건너뛰고 처음 나오는 주소를 사용합니다.
+    """
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted_proxies):
+            return hop
+    return hops[0] if hops else None
+
+
+def client_identity(
+    headers: Iterable[Tuple[bytes, bytes]],
+    client_host: Optional[str],
+    trust_forwarded_for: bool = False,
+    api_keys: Collection[str] = (),
+    trusted_proxies: Collection[Network] = (),
+) -> str:
+    """
+    요청 한도를 적용할 클라이언트 식별자를 반환합니다.
+
+    X-API-Key는 설정된 키(api_keys)와 일치할 때만 식별자로 사용하고, 그 외에는 클라이언트 IP를 사용합니다.
+    (검증하지 않은 키나 Authorization 값을 사용하면 요청마다 값을 바꿔 새 버킷을 받을 수 있기 때문)
+    X-Forwarded-For는 trust_forwarded_for가 켜져 있을 때만 사용합니다. (forwarded_client 참고)
+    """
+    api_key = forwarded_for = None
+    for name, value in headers:
+        name = name.lower()
+        if name == b"x-api-key":
+            api_key = value.decode("latin-1").strip()
+        elif name == b"x-forwarded-for":
+            # 여러 개의 헤더는 순서대로 이어 붙인 것과 같음
+            forwarded_for = value if forwarded_for is None else forwarded_for + b"," + value
+    if api_key and api_key in api_keys:
+        return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    if trust_forwarded_for and forwarded_for:
+        forwarded = forwarded_client(forwarded_for.decode("latin-1"), trusted_proxies)
+        if forwarded:
+            return "ip:" + forwarded
+    return "ip:" + (client_host or "unknown")
+
+
+class RateLimiter:
+    """
+    클라이언트와 라우트별 토큰 버킷 요청 한도
+
+    라우트별 한도는 "서비스:경로패턴=분당 요청 수" 형식으로 지정하며 처음 일치하는 설정을 사용합니다.
+    일치하는 설정이 없으면 기본 한도(0이면 제한 없음)를 사용합니다.
+    버킷은 (클라이언트, 서비스, 경로 패턴)마다 하나씩이므로 같은 패턴에 속하는 경로는 한도를 함께 사용합니다.
+    """
+
+    def __init__(self):
+        self.routes = parse_route_values(os.getenv("GATEWAY_RATE_LIMITS", DEFAULT_RATE_LIMITS))
+        self.bursts = parse_route_values(os.getenv("GATEWAY_RATE_LIMIT_BURSTS", ""))
+        self.default_per_minute = float(os.getenv("GATEWAY_RATE_LIMIT_DEFAULT", "0"))
+        self.trust_forwarded_for = os.getenv("GATEWAY_TRUST_FORWARDED_FOR", "0") == "1"
+        self.trusted_proxies = parse_networks(os.getenv("GATEWAY_TRUSTED_PROXIES", ""))
+        self.store = create_store(os.getenv("GATEWAY_RATE_LIMIT_STORE", "memory"))
+
+        self.allowed = 0
+        self.throttled: Dict[ServiceType, int] = {}
+
+    def identify(self, headers: Iterable[Tuple[bytes, bytes]], client_host: Optional[str]) -> str:
+        return client_identity(
+            headers,
+            client_host,
+            self.trust_forwarded_for,
+            api_keys=priority_classifier.api_key_tiers,
+            trusted_proxies=self.trusted_proxies,
+        )
+
+    def _match(self, service_type: ServiceType, path: str) -> Optional[Tuple[str, float]]:
+        """서비스와 경로에 적용할 (경로 패턴, 분당 요청 수)를 반환합니다. 제한이 없으면 None을 반환합니다."""
+        path = path.strip("/")
+        for service, pattern, per_minute in self.routes:
+            if fnmatchcase(service_type.value, service) and fnmatchcase(path, pattern):
+                return (pattern, per_minute) if per_minute > 0 else None
+        if self.default_per_minute > 0:
+            return "*", self.default_per_minute
+        return None
+
+    def _burst(self, service_type: ServiceType, pattern: str, per_minute: float) -> float:
+        """버킷 크기: 설정이 없으면 10초 동안 허용되는 요청 수 (최소 1)"""
+        for service, burst_pattern, burst in self.bursts:
+            if fnmatchcase(service_type.value, service) and burst_pattern == pattern:
+                return max(1.0, burst)
+        return max(1.0, per_minute / 6)
+
+    async def check(self, client: str, service_type: ServiceType, path: str):
+        """
+        요청을 허용할지 확인합니다.
+
+        Raises:
+            RateLimitExceeded: 클라이언트가 라우트의 요청 한도를 넘은 경우
+        """
+        limit = self._match(service_type, path)
+        if limit is None:
+            return
+        pattern, per_minute = limit
+        key = f"{client}|{service_type.value}|{pattern}"
+        retry_after = await self.store.consume(key, per_minute / 60, self._burst(service_type, pattern, per_minute))
+        if retry_after > 0:
+            self.throttled[service_type] = self.throttled.get(service_type, 0) + 1
+            rate_limited_requests.inc((service_type.value,))
+            logger.info(f"🚦 요청 한도 초과: 클라이언트={client}, 서비스={service_type.value}, 경로={path}, 재시도={retry_after:.1f}초")
+            raise RateLimitExceeded(service_type, retry_after)
+        self.allowed += 1
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "allowed": self.allowed,
+            "throttled": {service_type.value: count for service_type, count in self.throttled.items()},
+            "default_per_minute": self.default_per_minute,
+            "routes": [
+                {"service": service, "pattern": pattern, "per_minute": per_minute}
+                for service, pattern, per_minute in self.routes
+            ],
+            "store": self.store.stats(),
+        }
+
+
+# 게이트웨이 전역 요청 한도
+rate_limiter = RateLimiter()
@@ -0,0 +1,327 @@
+# resilience.py
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import service_env_float, service_env_int
+from app.platform.priority import priority_classifier
+
+logger = logging.getLogger("gateway-api")
+
+
+class BulkheadFullError(Exception):
+    """서비스의 동시 실행 한도와 대기열이 모두 찬 경우 발생하는 예외"""
+
+    def __init__(self, service_type: ServiceType):
+        self.service_type = service_type
+        super().__init__(f"서비스 {service_type.value}의 요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.")
+
+
+class CircuitOpenError(Exception):
+    """서비스의 서킷 브레이커가 열려 있어 요청을 보내지 않는 경우 발생하는 예외"""
+
+    def __init__(self, service_type: ServiceType, retry_after: float):
+        self.service_type = service_type
+        self.retry_after = retry_after
+        super().__init__(f"서비스 {service_type.value}가 일시적으로 응답하지 않습니다. (서킷 브레이커 열림)")
+
+
+class Bulkhead:
+    """
+    서비스별 동시 실행 한도와 우선순위 등급별 가중 공정 대기열(WFQ)
+
+    동시에 max_concurrent개까지 실행하고, 초과 요청은 최대 max_queue개까지 queue_timeout초 동안 기다립니다.
+    대기열이 가득 찼거나 대기 시간이 지나면 BulkheadFullError를 발생시켜 즉시 503으로 응답하게 합니다.
+
+    - 슬롯이 비면 등급별 가중치에 비례해 다음 요청을 고릅니다. (가중치 8:1이면 양쪽이 밀려 있을 때 8:1로 배분)
+    - 가장 높은 등급 외의 요청은 합쳐서 max_concurrent - reserved_slots개까지만 동시에 실행할 수 있어,
+      낮은 등급 요청이 오래 걸려도 높은 등급 요청이 곧바로 실행될 자리가 남습니다.
+    """
+
+    def __init__(
+        self,
+        service_type: ServiceType,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        weights: Optional[Dict[str, float]] = None,
+        reserved_slots: int = 0,
+    ):
+        self.service_type = service_type
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.weights = weights or {"default": 1.0}
+        self.highest = next(iter(self.weights))
+        self.reserved_slots = max(0, min(reserved_slots, max_concurrent - 1)) if len(self.weights) > 1 else 0
+
+        # 등급별 대기열: (가상 종료 시각, 슬롯 배정 future)
+        self._queues: Dict[str, Deque[Tuple[float, asyncio.Future]]] = {name: deque() for name in self.weights}
+        self._last_finish: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.active_by_class: Dict[str, int] = {name: 0 for name in self.weights}
+        self.admitted_by_class: Dict[str, int] = {name: 0 for name in self.weights}
+
+    def _class_of(self, priority: Optional[str]) -> str:
+        return priority if priority in self.weights else self.highest
+
+    def _can_admit(self, priority: str) -> bool:
+        """슬롯이 비어 있고, 낮은 등급이면 예약 슬롯을 제외한 만큼만 사용 중인지 확인합니다."""
+        if self.active >= self.max_concurrent:
+            return False
+        if priority == self.highest:
+            return True
+        return self.active - self.active_by_class[self.highest] < self.max_concurrent - self.reserved_slots
+
+    def _admit(self, priority: str):
+        self.active += 1
+        self.active_by_class[priority] += 1
+        self.admitted_by_class[priority] += 1
+
+    def _dispatch(self):
+        """빈 슬롯을 실행 가능한 대기 요청 중 가상 종료 시각이 가장 이른 요청에 배정합니다."""
+        while self.active < self.max_concurrent:
+            best = None
+            for priority, queue in self._queues.items():
+                # 대기 시간이 지나 취소된 요청은 건너뜀
+                while queue and queue[0][1].done():
+                    queue.popleft()
+                    self.waiting -= 1
+                if not queue or not self._can_admit(priority):
+                    continue
+                if best is None or queue[0][0] < self._queues[best][0][0]:
+                    best = priority
+            if best is None:
+                return
+            tag, future = self._queues[best].popleft()
+            self.waiting -= 1
+            self._virtual_time = tag
+            self._admit(best)
+            future.set_result(None)
+
+    async def acquire(self, priority: Optional[str] = None):
+        priority = self._class_of(priority)
+
+        # 여유가 있으면 대기 없이 바로 획득
+        # (빈 슬롯을 쓸 수 있는 대기 요청은 _dispatch에서 이미 배정되므로 남은 대기 요청보다 앞지르지 않음)
+        if self._can_admit(priority):
+            self._admit(priority)
+            return
+
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise BulkheadFullError(self.service_type)
+
+        # 가중치가 클수록 가상 종료 시각이 천천히 늘어나 더 자주 선택됨
+        tag = max(self._virtual_time, self._last_finish[priority]) + 1.0 / self.weights[priority]
+        self._last_finish[priority] = tag
+        entry = (tag, asyncio.get_running_loop().create_future())
+        self._queues[priority].append(entry)
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(entry[1], timeout=self.queue_timeout)
+        except BaseException as e:
+            if entry[1].done() and not entry[1].cancelled():
+                # 슬롯을 배정받은 직후 취소된 경우 슬롯을 돌려줌
+                self.release(priority)
+            else:
+                try:
+                    self._queues[priority].remove(entry)
+                    self.waiting -= 1
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise BulkheadFullError(self.service_type)
+            raise
+
+    def release(self, priority: Optional[str] = None):
+        priority = self._class_of(priority)
+        self.active -= 1
+        self.active_by_class[priority] -= 1
+        self._dispatch()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "reserved_slots": self.reserved_slots,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "classes": {
+                priority: {
+                    "weight": weight,
+                    "active": self.active_by_class[priority],
+                    "waiting": sum(1 for _, future in self._queues[priority] if not future.done()),
+                    "admitted": self.admitted_by_class[priority],
+                }
+                for priority, weight in self.weights.items()
+            },
+        }
+
+
+class CircuitBreaker:
+    """
+    서비스별 서킷 브레이커
+
+    - closed: 정상 상태. 연속 실패(오류 또는 slow_call_seconds를 넘는 느린 응답)가 failure_threshold에 도달하면 open
+    - open: open_seconds 동안 요청을 보내지 않고 즉시 CircuitOpenError 발생
+    - half_open: open_seconds가 지나면 시험 요청 하나만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, service_type: ServiceType, failure_threshold: int, open_seconds: float, slow_call_seconds: Optional[float]):
+        self.service_type = service_type
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.slow_call_seconds = slow_call_seconds
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened_count = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+
+    def before_call(self):
+        """요청 전에 호출합니다. 요청을 보낼 수 없으면 CircuitOpenError를 발생시킵니다."""
+        if self.state == self.OPEN:
+            remaining = self.opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.service_type, remaining)
+            self.state = self.HALF_OPEN
+            logger.info(f"🟡 서킷 브레이커 half-open: {self.service_type.value}")
+
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError(self.service_type, self.open_seconds)
+            self._trial_in_flight = True
+
+    def after_call(self, success: Optional[bool], duration: float):
+        """
+        요청이 끝난 뒤 결과를 기록합니다.
+
+        success가 None이면(요청 취소 등) 결과를 기록하지 않습니다.
+        """
+        was_trial = self.state == self.HALF_OPEN and self._trial_in_flight
+        if was_trial:
+            self._trial_in_flight = False
+        if success is None:
+            return
+
+        slow = self.slow_call_seconds is not None and duration > self.slow_call_seconds
+        if success and not slow:
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                logger.info(f"🟢 서킷 브레이커 closed: {self.service_type.value}")
+            return
+
+        self.consecutive_failures += 1
+        if was_trial or self.consecutive_failures >= self.failure_threshold:
+            self._open(slow)
+
+    def _open(self, slow: bool):
+        if self.state != self.OPEN:
+            self.opened_count += 1
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        reason = "느린 응답" if slow else "오류"
+        logger.warning(
+            f"🔴 서킷 브레이커 open: {self.service_type.value} "
+            f"(연속 실패 {self.consecutive_failures}회, 마지막 원인: {reason}, {self.open_seconds}초)"
+        )
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "open_seconds": self.open_seconds,
+            "slow_call_seconds": self.slow_call_seconds,
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
+
+
+class ServiceGuard:
+    """서비스 하나의 bulkhead와 서킷 브레이커 묶음"""
+
+    def __init__(self, service_type: ServiceType):
+        self.service_type = service_type
+        max_concurrent = service_env_int(service_type, "MAX_CONCURRENCY", 50)
+        self.bulkhead = Bulkhead(
+            service_type,
+            max_concurrent=max_concurrent,
+            max_queue=service_env_int(service_type, "MAX_QUEUE", 100),
+            queue_timeout=service_env_float(service_type, "QUEUE_TIMEOUT", 5.0),
+            weights=priority_classifier.weights,
+            reserved_slots=service_env_int(service_type, "PRIORITY_RESERVED_SLOTS", max_concurrent // 10),
+        )
+        slow_call_seconds = service_env_float(service_type, "BREAKER_SLOW_CALL_SECONDS", 0)
+        self.breaker = CircuitBreaker(
+            service_type,
+            failure_threshold=service_env_int(service_type, "BREAKER_FAILURE_THRESHOLD", 5),
+            open_seconds=service_env_float(service_type, "BREAKER_OPEN_SECONDS", 30.0),
+            slow_call_seconds=slow_call_seconds or None,
+        )
+
+    async def enter(self, priority: Optional[str] = None):
+        """
+        요청을 보내기 전에 호출합니다. priority는 요청의 우선순위 등급입니다.
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+            BulkheadFullError: 동시 실행 한도와 대기열이 모두 찬 경우
+        """
+        self.breaker.before_call()
+        try:
+            await self.bulkhead.acquire(priority)
+        except BaseException:
+            # 대기 중 거절/취소된 경우 half-open 시험 요청 슬롯을 돌려줌
+            self.breaker.after_call(None, 0.0)
+            raise
+
+    def exit(self, success: Optional[bool], duration: float, priority: Optional[str] = None):
+        """요청이 끝난 뒤 enter에 넘긴 것과 같은 priority로 호출합니다."""
+        self.bulkhead.release(priority)
+        self.breaker.after_call(success, duration)
+
+    def stats(self) -> Dict[str, object]:
+        return {"bulkhead": self.bulkhead.stats(), "breaker": self.breaker.stats()}
+
+
+class ServiceGuardRegistry:
+    """서비스 타입별 ServiceGuard 레지스트리"""
+
+    def __init__(self):
+        self._guards: Dict[ServiceType, ServiceGuard] = {}
+
+    def get(self, service_type: ServiceType) -> ServiceGuard:
+        guard = self._guards.get(service_type)
+        if guard is None:
+            guard = ServiceGuard(service_type)
+            self._guards[service_type] = guard
+        return guard
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {service_type.value: guard.stats() for service_type, guard in self._guards.items()}
+
+
+# 게이트웨이 전역 서비스 가드 레지스트리
+service_guards = ServiceGuardRegistry()
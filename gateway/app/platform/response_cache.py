@@ -0,0 +1,208 @@
+# response_cache.py
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import match_route_value, parse_route_values
+from app.platform.response_headers import HeaderList, get_header, without_header
+
+logger = logging.getLogger("gateway-api")
+
+# 기본 캐시 대상 라우트 ("서비스:경로 패턴" → TTL 초)
+DEFAULT_CACHE_ROUTES = "stocktrend:*stocks=30,dsdgen:dsdgen/dsd-source=60,dsdcheck:financial-data=300"
+
+# 캐시 키에 포함되는 요청 헤더 (헤더 값이 다르면 다른 응답으로 취급)
+DEFAULT_VARY_HEADERS = "authorization,cookie,accept,accept-encoding"
+
+# 설정과 관계없이 항상 캐시 키에 포함하는 헤더 (사용자별 응답이 다른 사용자에게 전달되지 않도록)
+REQUIRED_VARY_HEADERS = ("authorization", "cookie")
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장된 백엔드 응답"""
+    status_code: int
+    headers: HeaderList
+    body: bytes
+    etag: str
+    expires_at: float
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.monotonic()) < self.expires_at
+
+
+def generate_etag(body: bytes) -> str:
+    """응답 본문 해시로 강한 ETag를 생성합니다."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 약한 비교로 확인합니다."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    멱등 GET 요청을 위한 TTL + LRU 응답 캐시
+
+    항목 수와 전체 바이트 크기 두 가지로 제한되며, 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    게이트웨이는 단일 이벤트 루프에서 동작하고 캐시 연산 중에 await가 없으므로 별도의 락을 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[Tuple[str, str, float]],
+        vary_headers: Sequence[str],
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 5 * 1024 * 1024,
+        enabled: bool = True,
+    ):
+        self.routes = list(routes)
+        self.vary_headers = [h.strip().lower() for h in vary_headers if h.strip()]
+        self.vary_headers += [h for h in REQUIRED_VARY_HEADERS if h not in self.vary_headers]
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._total_bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """환경변수에서 캐시 설정을 읽어 생성합니다."""
+        return cls(
+            routes=parse_route_values(os.getenv("GATEWAY_CACHE_ROUTES", DEFAULT_CACHE_ROUTES)),
+            vary_headers=os.getenv("GATEWAY_CACHE_VARY_HEADERS", DEFAULT_VARY_HEADERS).split(","),
+            max_entries=int(os.getenv("GATEWAY_CACHE_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            max_entry_bytes=int(os.getenv("GATEWAY_CACHE_MAX_ENTRY_BYTES", str(5 * 1024 * 1024))),
+            enabled=os.getenv("GATEWAY_CACHE_ENABLED", "true").lower() == "true",
+        )
+
+    def ttl_for(self, service_type: ServiceType, path: str) -> Optional[float]:
+        """라우트에 설정된 TTL을 반환합니다. 캐시 대상이 아니면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        ttl = match_route_value(self.routes, service_type, path)
+        return ttl if ttl and ttl > 0 else None
+
+    def make_key(self, service_type: ServiceType, path: str, query: str, headers) -> str:
+        """서비스, 경로, 정렬된 쿼리 문자열, 선택된 헤더 값으로 캐시 키를 생성합니다."""
+        query_part = "&".join(sorted(query.split("&"))) if query else ""
+        header_part = "\n".join(f"{name}:{headers.get(name, '')}" for name in self.vary_headers)
+        raw = f"{service_type.value}\n{path.strip('/')}\n{query_part}\n{header_part}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """신선한 캐시 항목을 반환하고 LRU 순서를 갱신합니다."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if not entry.is_fresh():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(self, key: str, status_code: int, headers: HeaderList, body: bytes, ttl: float) -> Optional[CachedResponse]:
+        """
+        응답을 캐시에 저장합니다.
+
+        업스트림 ETag가 있으면 그대로 사용하고, 없으면 본문 해시로 생성합니다.
+        항목 크기가 max_entry_bytes를 넘으면 저장하지 않고 None을 반환합니다.
+        """
+        if len(body) > self.max_entry_bytes:
+            return None
+
+        etag = get_header(headers, "etag") or generate_etag(body)
+        entry = CachedResponse(
+            status_code=status_code,
+            headers=without_header(headers, "etag") + [("etag", etag)],
+            body=body,
+            etag=etag,
+            expires_at=time.monotonic() + ttl,
+        )
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        self.stores += 1
+
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def clear(self):
+        """모든 캐시 항목을 제거합니다."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 적중/실패 카운터와 현재 사용량을 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "routes": [
+                {"service": service, "path": pattern, "ttl": ttl}
+                for service, pattern, ttl in self.routes
+            ],
+        }
+
+
+# 게이트웨이 전역 응답 캐시
+response_cache = ResponseCache.from_env()
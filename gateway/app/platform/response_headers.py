@@ -0,0 +1,46 @@
+# response_headers.py
+from typing import List, Optional, Tuple
+
+from starlette.responses import Response
+
+# (이름, 값) 응답 헤더 목록. Set-Cookie처럼 같은 이름이 여러 번 나오는 헤더를 합치지 않고 보관
+HeaderList = List[Tuple[str, str]]
+
+
+def get_header(headers: HeaderList, name: str, default: Optional[str] = None) -> Optional[str]:
+    """헤더 목록에서 이름이 같은 첫 번째 헤더 값을 찾습니다. (대소문자 무시)"""
+    name = name.lower()
+    for header_name, value in headers:
+        if header_name.lower() == name:
+            return value
+    return default
+
+
+def has_header(headers: HeaderList, name: str) -> bool:
+    return get_header(headers, name) is not None
+
+
+def without_header(headers: HeaderList, name: str) -> HeaderList:
+    name = name.lower()
+    return [(header_name, value) for header_name, value in headers if header_name.lower() != name]
+
+
+def apply_raw_headers(response: Response, headers: HeaderList) -> Response:
+    """
+    Starlette 응답에 헤더 목록을 그대로 설정합니다.
+
+    Response(headers=...)는 매핑만 받아 같은 이름의 헤더를 하나로 합치므로 raw_headers를 직접 설정합니다.
+    본문 길이를 알고 있는 응답은 Starlette가 계산한 content-length를 유지합니다.
+    """
+    names = {name.lower() for name, _ in headers}
+    kept = [
+        (name, value) for name, value in response.raw_headers
+        if name == b"content-length" or name.decode("latin-1") not in names
+    ]
+    has_length = any(name == b"content-length" for name, _ in kept)
+    response.raw_headers = kept + [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers
+        if not (has_length and name.lower() == "content-length")
+    ]
+    return response
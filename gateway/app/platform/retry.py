@@ -0,0 +1,193 @@
+# retry.py
+import os
+import time
+import random
+import logging
+from collections import deque
+from typing import Dict, Optional
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.settings import service_env_float, service_env_int
+
+logger = logging.getLogger("gateway-api")
+
+# 재시도해도 서버 상태가 달라지지 않는 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RetryBudget:
+    """
+    게이트웨이 전역 재시도 예산
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도(헤지 요청 포함) 한 번에 토큰 1개를 사용합니다.
+    트래픽이 적을 때를 위해 초당 min_per_second개의 토큰이 추가로 쌓이며, 잔액은 max_balance를 넘지 않습니다.
+    장애 중에는 토큰이 바닥나 재시도가 전체 요청의 ratio 비율을 넘지 않으므로 재시도가 장애를 키우지 않습니다.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 5.0, max_balance: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self.balance = max_balance
+        self._last_refill = time.monotonic()
+
+        # 통계 카운터
+        self.requests = 0
+        self.withdrawn = 0
+        self.exhausted = 0
+
+    @classmethod
+    def from_env(cls) -> "RetryBudget":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            ratio=float(os.getenv("GATEWAY_RETRY_BUDGET_RATIO", "0.1")),
+            min_per_second=float(os.getenv("GATEWAY_RETRY_BUDGET_MIN_PER_SECOND", "5")),
+            max_balance=float(os.getenv("GATEWAY_RETRY_BUDGET_MAX", "100")),
+        )
+
+    def _refill(self, amount: float = 0.0):
+        now = time.monotonic()
+        amount += (now - self._last_refill) * self.min_per_second
+        self._last_refill = now
+        self.balance = min(self.max_balance, self.balance + amount)
+
+    def record_request(self):
+        """원 요청(재시도 제외)마다 호출합니다."""
+        self.requests += 1
+        self._refill(self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """재시도 또는 헤지 요청 전에 호출합니다. 예산이 없으면 False를 반환합니다."""
+        self._refill()
+        if self.balance >= 1.0:
+            self.balance -= 1.0
+            self.withdrawn += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def stats(self) -> Dict[str, object]:
+        self._refill()
+        return {
+            "balance": round(self.balance, 3),
+            "ratio": self.ratio,
+            "min_per_second": self.min_per_second,
+            "max_balance": self.max_balance,
+            "requests": self.requests,
+            "withdrawn": self.withdrawn,
+            "exhausted": self.exhausted,
+        }
+
+
+class LatencyTracker:
+    """최근 성공 응답 지연 시간으로 백분위수를 계산합니다. (헤지 지연 시간 결정용)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._cached: Optional[float] = None
+        self._since_update = 0
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+        self._since_update += 1
+
+    def p95(self) -> Optional[float]:
+        """표본이 min_samples보다 적으면 None을 반환합니다. 값은 표본 10개마다 다시 계산합니다."""
+        if len(self._samples) < self.min_samples:
+            return None
+        if self._cached is None or self._since_update >= 10:
+            ordered = sorted(self._samples)
+            self._cached = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            self._since_update = 0
+        return self._cached
+
+
+class RetryPolicy:
+    """
+    서비스별 재시도 및 헤지 정책
+
+    - 재시도: 멱등 메서드만, 연결 실패(요청이 전송되지 않은 경우)는 모든 메서드에 대해 재시도
+    - 백오프: full jitter (0 ~ min(max_delay, base_delay * 2^n) 사이 무작위)
+    - 헤지: 최근 p95 지연 시간이 지나도 응답이 없으면 다른 레플리카로 같은 요청을 한 번 더 보냄
+    """
+
+    def __init__(self, service_type: ServiceType):
+        self.service_type = service_type
+        self.max_retries = service_env_int(service_type, "RETRY_MAX_RETRIES", 2)
+        self.base_delay = service_env_float(service_type, "RETRY_BASE_DELAY", 0.05)
+        self.max_delay = service_env_float(service_type, "RETRY_MAX_DELAY", 1.0)
+        self.hedge_enabled = service_env_int(service_type, "HEDGE_ENABLED", 0) == 1
+        self.hedge_min_delay = service_env_float(service_type, "HEDGE_MIN_DELAY", 0.05)
+        self.latency = LatencyTracker()
+
+        # 통계 카운터
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def backoff(self, retry_number: int) -> float:
+        """retry_number번째 재시도 전 대기 시간(초)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+
+    def should_retry(self, method: str, error: Optional[BaseException], status_code: Optional[int]) -> bool:
+        """
+        실패한 시도를 재시도할지 판단합니다.
+
+        연결 단계 실패는 요청이 백엔드에 도달하지 않았으므로 메서드와 관계없이 재시도하고,
+        그 밖의 전송 오류와 502/503/504 응답은 멱등 메서드만 재시도합니다.
+        """
+        if self.max_retries <= 0:
+            return False
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError) and not isinstance(error, httpx.TimeoutException)
+        return status_code is not None
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 때까지 기다릴 시간. 헤지를 사용하지 않거나 표본이 부족하면 None"""
+        if not self.hedge_enabled:
+            return None
+        p95 = self.latency.p95()
+        if p95 is None:
+            return None
+        return max(self.hedge_min_delay, p95)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "retries": self.retries,
+            "hedge_enabled": self.hedge_enabled,
+            "hedge_delay": self.hedge_delay(),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class RetryPolicyRegistry:
+    """서비스 타입별 RetryPolicy 레지스트리"""
+
+    def __init__(self):
+        self._policies: Dict[ServiceType, RetryPolicy] = {}
+
+    def get(self, service_type: ServiceType) -> RetryPolicy:
+        policy = self._policies.get(service_type)
+        if policy is None:
+            policy = RetryPolicy(service_type)
+            self._policies[service_type] = policy
+        return policy
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {service_type.value: policy.stats() for service_type, policy in self._policies.items()}
+
+
+# 게이트웨이 전역 재시도 예산과 서비스별 재시도 정책
+retry_budget = RetryBudget.from_env()
+retry_policies = RetryPolicyRegistry()
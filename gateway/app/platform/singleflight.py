@@ -0,0 +1,157 @@
+# singleflight.py
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.domain.model.service_type import ServiceType
+from app.platform.response_headers import HeaderList
+
+logger = logging.getLogger("gateway-api")
+
+# 기본 요청 합치기 대상 라우트 (응답 캐시 대상 라우트와 같은 조회성 API)
+DEFAULT_COALESCE_ROUTES = "stocktrend:*stocks,dsdgen:dsdgen/dsd-source,dsdcheck:financial-data"
+
+
+@dataclass
+class SharedResponse:
+    """여러 대기 요청이 함께 사용하는 백엔드 응답 (본문은 원본 바이트 그대로)"""
+    status_code: int
+    headers: HeaderList
+    body: bytes
+
+
+def parse_route_patterns(spec: str) -> List[Tuple[str, str]]:
+    """
+    "서비스:경로패턴" 목록 문자열을 파싱합니다. 서비스와 경로 모두 fnmatch 패턴을 사용합니다.
+
+    예: "stocktrend:*stocks,dsdgen:*"
+    """
+    routes = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        service, _, pattern = item.partition(":")
+        routes.append((service.strip(), (pattern or "*").strip().strip("/")))
+    return routes
+
+
+class SingleFlight:
+    """
+    동일한 키로 동시에 들어온 요청을 하나의 업스트림 호출로 합치는 유틸리티
+
+    첫 번째 호출자(leader)가 실행한 결과를 같은 키로 기다리던 나머지 호출자에게 그대로 전달합니다.
+    실행은 별도 태스크에서 이루어지므로 leader 클라이언트가 연결을 끊어도 다른 대기자는 결과를 받습니다.
+    호출이 끝나면 키를 즉시 제거하므로 결과를 보관하지 않으며, 캐시 미스의 의미는 그대로 유지됩니다.
+
+    leader는 detach()로 더 이상 대기자를 받지 않도록 키를 분리할 수 있습니다. 그때까지 합쳐진 대기자가 없으면
+    결과를 공유할 필요가 없으므로 leader가 응답을 버퍼링하지 않고 그대로 스트리밍할 수 있습니다.
+    """
+
+    def __init__(self, routes: List[Tuple[str, str]], enabled: bool = True):
+        self.routes = routes
+        self.enabled = enabled
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+        # 통계 카운터
+        self.leaders = 0
+        self.coalesced = 0
+        self.detached = 0
+
+    @classmethod
+    def from_env(cls) -> "SingleFlight":
+        """환경변수에서 설정을 읽어 생성합니다."""
+        return cls(
+            routes=parse_route_patterns(os.getenv("GATEWAY_COALESCE_ROUTES", DEFAULT_COALESCE_ROUTES)),
+            enabled=os.getenv("GATEWAY_COALESCE_ENABLED", "true").lower() == "true",
+        )
+
+    def applies_to(self, service_type: ServiceType, path: str) -> bool:
+        """요청 합치기 대상 라우트인지 확인합니다."""
+        if not self.enabled:
+            return False
+        path = path.strip("/")
+        return any(
+            fnmatchcase(service_type.value, service) and fnmatchcase(path, pattern)
+            for service, pattern in self.routes
+        )
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        discard: Optional[Callable[[Any], Awaitable[None]]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        키에 해당하는 호출이 진행 중이면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            discard: leader가 결과를 받기 전에 취소된 경우 결과를 정리하는 함수 (스트리밍 응답 닫기 등)
+
+        Returns:
+            tuple: (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            self._waiters[key] += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        self._waiters[key] = 0
+        self.leaders += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        try:
+            return await asyncio.shield(task), False
+        except asyncio.CancelledError:
+            if discard is not None:
+                task.add_done_callback(lambda t: self._discard(t, discard))
+            raise
+
+    def detach(self, key: str) -> int:
+        """
+        현재 태스크(leader)의 키를 분리하여 이후 요청이 합쳐지지 않도록 하고, 그때까지 합쳐진 대기자 수를 반환합니다.
+
+        fn 안에서 호출해야 합니다. 대기자가 0이면 결과는 leader만 사용합니다.
+        """
+        task = asyncio.current_task()
+        if self._calls.get(key) is not task:
+            return 0
+        del self._calls[key]
+        waiters = self._waiters.pop(key, 0)
+        if waiters == 0:
+            self.detached += 1
+        return waiters
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            self._waiters.pop(key, None)
+        # 대기자가 모두 사라진 경우에도 "exception was never retrieved" 경고가 나지 않도록 확인
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"합쳐진 요청 실패: {task.exception()}")
+
+    def _discard(self, task: asyncio.Task, discard: Callable[[Any], Awaitable[None]]):
+        """leader가 취소되어 아무도 받지 않은 결과를 정리합니다."""
+        if not task.cancelled() and task.exception() is None:
+            asyncio.ensure_future(discard(task.result()))
+
+    def stats(self) -> Dict[str, object]:
+        """요청 합치기 통계를 반환합니다."""
+        return {
+            "enabled": self.enabled,
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "detached": self.detached,
+            "in_flight": len(self._calls),
+            "routes": [{"service": service, "path": pattern} for service, pattern in self.routes],
+        }
+
+
+# 게이트웨이 전역 요청 합치기 인스턴스
+singleflight = SingleFlight.from_env()
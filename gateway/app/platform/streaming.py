@@ -0,0 +1,247 @@
+# streaming.py
+import time
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from app.domain.model.service_type import ServiceType
+from app.domain.service.discovery_service import service_discovery
+from app.foundation.settings import service_env_float, service_env_int
+from app.platform.response_headers import HeaderList, apply_raw_headers
+
+try:
+    from websockets.asyncio.client import connect as websocket_connect
+    from websockets.exceptions import ConnectionClosed, InvalidHandshake, InvalidURI
+except ImportError:  # websockets가 설치되지 않은 경우 WebSocket 프록시를 사용하지 않음
+    websocket_connect = None
+
+logger = logging.getLogger("gateway-api")
+
+# 백엔드 WebSocket 연결 시 전달하는 클라이언트 헤더
+WEBSOCKET_FORWARD_HEADERS = ("authorization", "cookie", "user-agent", "x-request-id")
+
+# 프레임으로 보낼 수 없는 예약 종료 코드(RFC 6455 7.4.1)를 클라이언트에 보낼 코드로 변환
+# 1005: 백엔드가 상태 코드 없이 종료, 1006/1015: 비정상 종료 또는 TLS 실패
+RESERVED_CLOSE_CODES = {1005: 1000, 1006: 1011, 1015: 1011}
+
+
+class StreamLimitError(Exception):
+    """서비스의 동시 스트림(SSE, WebSocket) 수가 한도에 도달한 경우 발생하는 예외"""
+
+    def __init__(self, service_type: ServiceType):
+        self.service_type = service_type
+        super().__init__(f"서비스 {service_type.value}의 동시 스트림 수가 한도에 도달했습니다. 잠시 후 다시 시도해 주세요.")
+
+
+class StreamLimiter:
+    """
+    서비스별 동시 스트림(SSE 응답, WebSocket 터널) 수 제한
+
+    스트림은 bulkhead와 달리 응답 헤더 이후에도 오래 유지되므로 별도의 한도로 관리하고,
+    한도를 넘으면 기다리지 않고 즉시 StreamLimitError를 발생시킵니다.
+    """
+
+    def __init__(self):
+        self._active: Dict[ServiceType, Dict[str, int]] = {}
+        self.rejected: Dict[ServiceType, int] = {}
+
+    def max_streams(self, service_type: ServiceType) -> int:
+        return service_env_int(service_type, "MAX_STREAMS", 100)
+
+    def idle_timeout(self, service_type: ServiceType) -> float:
+        """스트림에서 이 시간(초) 동안 데이터가 오가지 않으면 연결을 닫습니다."""
+        return service_env_float(service_type, "STREAM_IDLE_TIMEOUT", 60.0)
+
+    def active(self, service_type: ServiceType) -> int:
+        return sum(self._active.get(service_type, {}).values())
+
+    def acquire(self, service_type: ServiceType, kind: str):
+        """
+        스트림 슬롯을 획득합니다.
+
+        Raises:
+            StreamLimitError: 서비스의 동시 스트림 수가 한도에 도달한 경우
+        """
+        if self.active(service_type) >= self.max_streams(service_type):
+            self.rejected[service_type] = self.rejected.get(service_type, 0) + 1
+            raise StreamLimitError(service_type)
+        counts = self._active.setdefault(service_type, {})
+        counts[kind] = counts.get(kind, 0) + 1
+
+    def release(self, service_type: ServiceType, kind: str):
+        counts = self._active.get(service_type, {})
+        counts[kind] = max(0, counts.get(kind, 0) - 1)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {
+            service_type.value: {
+                **counts,
+                "max_streams": self.max_streams(service_type),
+                "rejected": self.rejected.get(service_type, 0),
+            }
+            for service_type, counts in self._active.items()
+        }
+
+
+async def relay_event_stream(response: httpx.Response, service_type: ServiceType, on_close) -> AsyncIterator[bytes]:
+    """
+    업스트림 SSE 응답을 받은 즉시 클라이언트로 전달합니다.
+
+    유휴 타임아웃은 업스트림 요청의 read 타임아웃으로 적용되며, 유휴 시간이 지나거나 업스트림 연결이 끊기면
+    스트림을 정상 종료합니다. 클라이언트가 연결을 끊으면 제너레이터가 취소되고 finally에서 업스트림 연결을 닫습니다.
+    """
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    except httpx.ReadTimeout:
+        logger.info(f"⏱️ 유휴 시간 초과로 스트림 종료: 서비스={service_type.value}")
+    except httpx.TransportError as e:
+        logger.warning(f"업스트림 스트림 종료: 서비스={service_type.value}, 원인={type(e).__name__}")
+    finally:
+        try:
+            await response.aclose()
+        finally:
+            on_close()
+
+
+class EventStreamResponse(StreamingResponse):
+    """
+    업스트림 SSE 응답을 중계하는 StreamingResponse
+
+    클라이언트가 본문을 받기 전에 연결을 끊거나 전송 중 오류가 나면 relay_event_stream의 finally가 실행되지 않으므로,
+    응답 처리가 어떻게 끝나든 업스트림 연결을 닫고 on_close를 호출합니다. (on_close는 여러 번 호출되어도 안전해야 함)
+    """
+
+    def __init__(self, upstream: httpx.Response, service_type: ServiceType, on_close, status_code: int, headers: HeaderList):
+        super().__init__(relay_event_stream(upstream, service_type, on_close), status_code=status_code)
+        apply_raw_headers(self, headers)
+        self.upstream = upstream
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                await self.upstream.aclose()
+            finally:
+                self.on_close()
+
+
+def client_close_code(code: Optional[int]) -> int:
+    """백엔드 WebSocket 종료 코드를 클라이언트에 보낼 수 있는 종료 코드로 변환합니다."""
+    if code is None:
+        return 1000
+    return RESERVED_CLOSE_CODES.get(code, code)
+
+
+def websocket_url(base_url: str, path: str, query: str) -> str:
+    url = base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1) + f"/{path}"
+    return f"{url}?{query}" if query else url
+
+
+async def tunnel_websocket(websocket: WebSocket, service_type: ServiceType, path: str, idle_timeout: float):
+    """
+    클라이언트 WebSocket을 백엔드 WebSocket과 연결해 메시지를 양방향으로 전달합니다.
+
+    백엔드 연결에 실패하면 handshake 단계에서 연결을 거절하고(1011),
+    어느 한쪽이 닫히거나 idle_timeout초 동안 메시지가 없으면 양쪽 연결을 모두 닫습니다.
+    """
+    if websocket_connect is None:
+        await websocket.close(code=1011, reason="websocket proxy unavailable")
+        return
+
+    replica = service_discovery.pick(service_type)
+    url = websocket_url(replica.url, path, websocket.url.query)
+    headers = [
+        (name, value) for name, value in websocket.headers.items()
+        if name.lower() in WEBSOCKET_FORWARD_HEADERS
+    ]
+    subprotocols = [
+        protocol.strip()
+        for protocol in websocket.headers.get("sec-websocket-protocol", "").split(",")
+        if protocol.strip()
+    ]
+
+    service_discovery.acquire(replica)
+    success: Optional[bool] = None
+    try:
+        try:
+            upstream = await websocket_connect(
+                url,
+                additional_headers=headers,
+                subprotocols=subprotocols or None,
+                open_timeout=service_env_float(service_type, "WEBSOCKET_CONNECT_TIMEOUT", 10.0),
+                max_size=None,
+            )
+        except (OSError, asyncio.TimeoutError, InvalidHandshake, InvalidURI) as e:
+            success = False
+            logger.warning(f"백엔드 WebSocket 연결 실패: {url} ({type(e).__name__})")
+            await websocket.close(code=1011)
+            return
+
+        success = True
+        await websocket.accept(subprotocol=upstream.subprotocol)
+        logger.info(f"🔀 WebSocket 터널 시작: 서비스={service_type.value}, 경로={path}")
+        last_activity = time.monotonic()
+
+        async def client_to_upstream():
+            nonlocal last_activity
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                last_activity = time.monotonic()
+                if message.get("text") is not None:
+                    await upstream.send(message["text"])
+                elif message.get("bytes") is not None:
+                    await upstream.send(message["bytes"])
+
+        async def upstream_to_client():
+            nonlocal last_activity
+            try:
+                async for data in upstream:
+                    last_activity = time.monotonic()
+                    if isinstance(data, str):
+                        await websocket.send_text(data)
+                    else:
+                        await websocket.send_bytes(data)
+            except ConnectionClosed:
+                pass
+
+        async def idle_watchdog():
+            while True:
+                idle_for = time.monotonic() - last_activity
+                if idle_for >= idle_timeout:
+                    logger.info(f"⏱️ 유휴 시간 초과로 WebSocket 종료: 서비스={service_type.value}")
+                    return
+                await asyncio.sleep(idle_timeout - idle_for)
+
+        tasks = [
+            asyncio.ensure_future(client_to_upstream()),
+            asyncio.ensure_future(upstream_to_client()),
+            asyncio.ensure_future(idle_watchdog()),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await upstream.close()
+            try:
+                await websocket.close(code=client_close_code(upstream.close_code))
+            except (RuntimeError, WebSocketDisconnect):
+                # 클라이언트가 이미 연결을 닫은 경우
+                pass
+    finally:
+        service_discovery.release(replica, success)
+
+
+# 게이트웨이 전역 스트림 제한
+stream_limiter = StreamLimiter()
@@ -0,0 +1,48 @@
+# upload_stream.py
+from typing import AsyncIterator, Optional
+
+from fastapi import Request
+
+
+class UploadTooLargeError(Exception):
+    """업로드 본문이 허용된 최대 크기를 초과한 경우 발생하는 예외"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"업로드 크기가 최대 허용 크기({max_bytes} bytes)를 초과했습니다.")
+
+
+class LimitedRequestStream:
+    """
+    들어온 요청 본문을 청크 단위로 그대로 백엔드에 전달하는 비동기 이터러블
+
+    multipart 본문을 파싱하거나 메모리에 모으지 않으므로
+    업로드 한 건이 차지하는 메모리는 ASGI 서버의 청크 크기로 제한됩니다.
+    전달한 바이트 수가 max_bytes를 넘으면 exceeded를 설정하고 전송을 중단합니다.
+    """
+
+    def __init__(self, request: Request, max_bytes: Optional[int] = None):
+        self.request = request
+        self.max_bytes = max_bytes
+        self.received = 0
+        self.exceeded = False
+
+    def check_declared_length(self):
+        """Content-Length 헤더로 크기 초과 여부를 전송 전에 확인합니다."""
+        declared = self.request.headers.get("content-length")
+        if self.max_bytes and declared and declared.isdigit() and int(declared) > self.max_bytes:
+            self.exceeded = True
+            raise UploadTooLargeError(self.max_bytes)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        async for chunk in self.request.stream():
+            if not chunk:
+                continue
+            self.received += len(chunk)
+            if self.max_bytes and self.received > self.max_bytes:
+                self.exceeded = True
+                raise UploadTooLargeError(self.max_bytes)
+            yield chunk
@@ -0,0 +1,396 @@
+# run_benchmark.py
+"""
+게이트웨이 오버헤드 벤치마크
+
+서비스 타입별 stub 백엔드를 같은 프로세스에서 띄우고, 게이트웨이는 별도 uvicorn 프로세스로 실행합니다.
+각 시나리오를 고정 동시성으로 백엔드에 직접 보낸 경우와 게이트웨이를 거친 경우 두 번 실행하여
+처리량, p50/p99 지연 시간, 게이트웨이가 추가한 지연 시간, 게이트웨이 프로세스의 최대 RSS를 JSON으로 저장합니다.
+
+사용 예 (gateway 디렉토리에서):
+    python -m benchmarks.run_benchmark --concurrency 1,8,32 --requests 400 --output benchmark-results.json
+    python -m benchmarks.run_benchmark --baseline previous.json
+"""
+import os
+import sys
+import json
+import math
+import time
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from benchmarks.stub_backend import StubCluster
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 순수 프록시 오버헤드를 측정하기 위해 기본적으로 끄는 게이트웨이 기능
+DEFAULT_GATEWAY_ENV = {
+    "GATEWAY_CACHE_ENABLED": "false",
+    "GATEWAY_COALESCE_ENABLED": "false",
+}
+
+
+@dataclass
+class Scenario:
+    """벤치마크 시나리오 하나"""
+    name: str
+    service: str
+    method: str = "GET"
+    payload_bytes: int = 1024
+    latency: float = 0.0
+    upload_bytes: int = 0
+
+    @property
+    def service_type(self) -> ServiceType:
+        return ServiceType(self.service)
+
+
+@dataclass
+class RunStats:
+    """고정 동시성으로 한 번 실행한 결과"""
+    requests: int
+    errors: int
+    elapsed: float
+    rps: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class ScenarioResult:
+    scenario: Dict[str, object]
+    concurrency: int
+    direct: RunStats
+    gateway: RunStats
+    added_p50_ms: float
+    added_p99_ms: float
+    gateway_rss_bytes: Optional[int] = None
+    gateway_peak_rss_bytes: Optional[int] = None
+
+
+def default_scenarios() -> List[Scenario]:
+    """모든 서비스 타입에 대한 기본 GET과 크기/지연/업로드 변형 시나리오"""
+    scenarios = [
+        Scenario(name=f"{service_type.value}-get-1k", service=service_type.value)
+        for service_type in ServiceType
+    ]
+    scenarios += [
+        Scenario(name="stocktrend-get-256k", service=ServiceType.STOCKTREND.value, payload_bytes=256 * 1024),
+        Scenario(name="irsummary-get-50ms", service=ServiceType.IRSUMMARY.value, latency=0.05),
+        Scenario(name="chatbot-post-4k", service=ServiceType.CHATBOT.value, method="POST", payload_bytes=4 * 1024),
+        Scenario(name="dsdgen-upload-1m", service=ServiceType.DSDGEN.value, method="UPLOAD", upload_bytes=1024 * 1024),
+        Scenario(name="dsdgen-upload-10m", service=ServiceType.DSDGEN.value, method="UPLOAD", upload_bytes=10 * 1024 * 1024),
+    ]
+    return scenarios
+
+
+def load_scenarios(path: str) -> List[Scenario]:
+    """JSON 파일(시나리오 객체 배열)에서 시나리오를 읽습니다."""
+    with open(path, encoding="utf-8") as f:
+        return [Scenario(**item) for item in json.load(f)]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(1, math.ceil(pct / 100.0 * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def read_rss(pid: int) -> Dict[str, Optional[int]]:
+    """/proc에서 프로세스의 현재 RSS와 최대 RSS(VmHWM)를 바이트 단위로 읽습니다. (Linux 전용)"""
+    result: Dict[str, Optional[int]] = {"rss": None, "peak": None}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    result["rss"] = int(line.split()[1]) * 1024
+                elif line.startswith("VmHWM:"):
+                    result["peak"] = int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class GatewayProcess:
+    """stub 백엔드를 바라보도록 설정한 게이트웨이 uvicorn 프로세스"""
+
+    def __init__(self, port: int, env: Dict[str, str], show_logs: bool = False):
+        self.port = port
+        self.env = env
+        self.show_logs = show_logs
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self, timeout: float = 30.0):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app",
+             "--host", "127.0.0.1", "--port", str(self.port),
+             "--log-level", "warning", "--no-access-log"],
+            cwd=GATEWAY_DIR,
+            env={**os.environ, **self.env},
+            stdout=None if self.show_logs else subprocess.DEVNULL,
+            stderr=None if self.show_logs else subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"게이트웨이 프로세스가 종료되었습니다. (exit={self.process.returncode})")
+            try:
+                if httpx.get(f"{self.base_url}/metrics", timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.1)
+        raise RuntimeError("게이트웨이가 제시간에 시작되지 않았습니다.")
+
+    def rss(self) -> Dict[str, Optional[int]]:
+        return read_rss(self.process.pid) if self.process else {"rss": None, "peak": None}
+
+    def stop(self):
+        if self.process is None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def build_request_kwargs(scenario: Scenario, upload_body: Optional[Tuple[str, bytes]]) -> Dict[str, object]:
+    """시나리오를 stub 백엔드 기준의 (method, path, 요청 인자)로 변환합니다."""
+    params = {"delay": scenario.latency}
+    if scenario.method == "GET":
+        params["size"] = scenario.payload_bytes
+        return {"method": "GET", "path": "bench/payload", "params": params}
+    if scenario.method == "POST":
+        body = ('{"data":"' + "x" * max(0, scenario.payload_bytes - 11) + '"}').encode()
+        return {
+            "method": "POST", "path": "bench/echo", "params": params,
+            "content": body, "headers": {"content-type": "application/json"},
+        }
+    if scenario.method == "UPLOAD":
+        # multipart 본문을 미리 만들어 두고 매 요청마다 재사용
+        return {
+            "method": "POST", "path": "bench/upload", "params": params,
+            "content": upload_body[1], "headers": {"content-type": upload_body[0]},
+        }
+    raise ValueError(f"지원하지 않는 시나리오 메서드입니다: {scenario.method}")
+
+
+def build_multipart(size: int) -> Tuple[str, bytes]:
+    """size 바이트 파일 하나를 담은 multipart 본문과 Content-Type을 생성합니다."""
+    boundary = "gateway-benchmark-boundary"
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="bench.bin"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return f"multipart/form-data; boundary={boundary}", head + b"\0" * size + tail
+
+
+async def drive(base_url: str, prefix: str, request_kwargs: Dict[str, object], concurrency: int, total: int, warmup: int) -> RunStats:
+    """concurrency개의 워커가 total개의 요청을 나누어 순차적으로 보내고 지연 시간을 측정합니다."""
+    kwargs = dict(request_kwargs)
+    method = kwargs.pop("method")
+    url = f"{base_url}/{prefix}{kwargs.pop('path')}"
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=120.0) as client:
+        for _ in range(warmup):
+            await client.request(method, url, **kwargs)
+
+        latencies: List[float] = []
+        errors = 0
+        remaining = total
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, **kwargs)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return RunStats(
+        requests=len(latencies),
+        errors=errors,
+        elapsed=round(elapsed, 4),
+        rps=round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+        max_ms=round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    )
+
+
+async def run_scenarios(
+    scenarios: List[Scenario],
+    concurrency_levels: List[int],
+    total: int,
+    warmup: int,
+    stubs: StubCluster,
+    gateway: GatewayProcess,
+) -> List[ScenarioResult]:
+    results: List[ScenarioResult] = []
+    for scenario in scenarios:
+        upload_body = build_multipart(scenario.upload_bytes) if scenario.method == "UPLOAD" else None
+        request_kwargs = build_request_kwargs(scenario, upload_body)
+        for concurrency in concurrency_levels:
+            direct = await drive(stubs.url(scenario.service_type), "", request_kwargs, concurrency, total, warmup)
+            via_gateway = await drive(
+                gateway.base_url, f"api/{scenario.service}/", request_kwargs, concurrency, total, warmup
+            )
+            rss = gateway.rss()
+            result = ScenarioResult(
+                scenario=asdict(scenario),
+                concurrency=concurrency,
+                direct=direct,
+                gateway=via_gateway,
+                added_p50_ms=round(via_gateway.p50_ms - direct.p50_ms, 3),
+                added_p99_ms=round(via_gateway.p99_ms - direct.p99_ms, 3),
+                gateway_rss_bytes=rss["rss"],
+                gateway_peak_rss_bytes=rss["peak"],
+            )
+            results.append(result)
+            print(
+                f"[INFO] {scenario.name:<24} c={concurrency:<4} "
+                f"gateway {via_gateway.rps:>9.1f} rps  p50 {via_gateway.p50_ms:>8.2f}ms  p99 {via_gateway.p99_ms:>8.2f}ms  "
+                f"added p50 {result.added_p50_ms:>+7.2f}ms  p99 {result.added_p99_ms:>+7.2f}ms  "
+                f"errors {via_gateway.errors}"
+            )
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=GATEWAY_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(results: List[Dict[str, object]], baseline_path: str):
+    """이전 결과 파일과 시나리오/동시성별로 처리량과 추가 지연 시간 변화를 출력합니다."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {
+        (item["scenario"]["name"], item["concurrency"]): item
+        for item in baseline.get("results", [])
+    }
+    print(f"\n[INFO] 기준 결과와 비교: {baseline_path} (commit={baseline.get('meta', {}).get('git_revision')})")
+    for item in results:
+        key = (item["scenario"]["name"], item["concurrency"])
+        before = previous.get(key)
+        if before is None:
+            continue
+        rps_before = before["gateway"]["rps"]
+        rps_change = (item["gateway"]["rps"] - rps_before) / rps_before * 100 if rps_before else 0.0
+        print(
+            f"  {key[0]:<24} c={key[1]:<4} "
+            f"rps {rps_change:>+7.1f}%  "
+            f"added p50 {item['added_p50_ms'] - before['added_p50_ms']:>+7.2f}ms  "
+            f"added p99 {item['added_p99_ms'] - before['added_p99_ms']:>+7.2f}ms"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="게이트웨이 오버헤드 벤치마크")
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성 수준 (기본: 1,8,32)")
+    parser.add_argument("--requests", type=int, default=400, help="시나리오/동시성별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--scenarios", help="시나리오 JSON 파일 (기본: 내장 시나리오)")
+    parser.add_argument("--only", help="실행할 시나리오 이름 (쉼표 구분)")
+    parser.add_argument("--output", default="benchmark-results.json", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--stub-port", type=int, default=19100, help="stub 백엔드 시작 포트")
+    parser.add_argument("--gateway-port", type=int, default=0, help="게이트웨이 포트 (0이면 임의 포트)")
+    parser.add_argument(
+        "--gateway-env", action="append", default=[], metavar="KEY=VALUE",
+        help="게이트웨이 프로세스에 추가할 환경변수 (예: GATEWAY_CACHE_ENABLED=true)",
+    )
+    parser.add_argument("--gateway-logs", action="store_true", help="게이트웨이 프로세스 로그를 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scenarios = load_scenarios(args.scenarios) if args.scenarios else default_scenarios()
+    if args.only:
+        names = {name.strip() for name in args.only.split(",")}
+        scenarios = [scenario for scenario in scenarios if scenario.name in names]
+    concurrency_levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    gateway_env = dict(DEFAULT_GATEWAY_ENV)
+    for item in args.gateway_env:
+        key, _, value = item.partition("=")
+        gateway_env[key] = value
+
+    stubs = StubCluster(list(ServiceType), base_port=args.stub_port)
+    stubs.start()
+    gateway = GatewayProcess(args.gateway_port or free_port(), {**stubs.service_env(), **gateway_env}, args.gateway_logs)
+    try:
+        gateway.start()
+        results = asyncio.run(
+            run_scenarios(scenarios, concurrency_levels, args.requests, args.warmup, stubs, gateway)
+        )
+        peak = gateway.rss()["peak"]
+    finally:
+        gateway.stop()
+        stubs.stop()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": concurrency_levels,
+            "gateway_env": gateway_env,
+        },
+        "gateway_peak_rss_bytes": peak,
+        "results": [asdict(result) for result in results],
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[INFO] 결과 저장: {args.output}")
+
+    if args.baseline:
+        compare_with_baseline(report["results"], args.baseline)
+
+
+if __name__ == "__main__":
+    main()
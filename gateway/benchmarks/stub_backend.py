@@ -0,0 +1,117 @@
+# stub_backend.py
+import time
+import asyncio
+import threading
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.domain.model.service_type import ServiceType
+
+
+def _payload(size: int, cache: Dict[int, bytes]) -> bytes:
+    """size 바이트 크기의 JSON 본문을 만들고 재사용합니다."""
+    body = cache.get(size)
+    if body is None:
+        filler = max(0, size - len('{"data":""}'))
+        body = ('{"data":"' + "x" * filler + '"}').encode()
+        cache[size] = body
+    return body
+
+
+def create_stub_app(service_type: ServiceType) -> FastAPI:
+    """
+    벤치마크용 백엔드 stub 앱을 생성합니다.
+
+    - GET  /bench/payload?size=&delay= : 지정한 크기의 JSON 응답을 delay초 뒤에 반환
+    - POST /bench/echo?delay=          : 요청 본문을 읽고 받은 바이트 수를 반환
+    - POST /bench/upload?delay=        : 업로드 본문(multipart 포함)을 파싱 없이 읽고 받은 바이트 수를 반환
+    """
+    app = FastAPI(title=f"{service_type.value} benchmark stub")
+    payload_cache: Dict[int, bytes] = {}
+
+    @app.get("/bench/payload")
+    async def payload(size: int = 1024, delay: float = 0.0):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return Response(content=_payload(size, payload_cache), media_type="application/json")
+
+    @app.post("/bench/echo")
+    async def echo(request: Request, delay: float = 0.0):
+        body = await request.body()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return JSONResponse({"service": service_type.value, "received": len(body)})
+
+    @app.post("/bench/upload")
+    async def upload(request: Request, delay: float = 0.0):
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return JSONResponse({"service": service_type.value, "received": received})
+
+    return app
+
+
+class StubCluster:
+    """
+    서비스 타입별 stub 백엔드를 하나의 백그라운드 스레드에서 실행합니다.
+
+    벤치마크 부하 생성기와 이벤트 루프를 공유하지 않도록 별도 스레드의 이벤트 루프에서
+    서비스마다 하나씩 uvicorn 서버를 띄웁니다.
+    """
+
+    def __init__(self, service_types: List[ServiceType], host: str = "127.0.0.1", base_port: int = 19100):
+        self.host = host
+        self.ports: Dict[ServiceType, int] = {
+            service_type: base_port + index for index, service_type in enumerate(service_types)
+        }
+        self._servers: List[uvicorn.Server] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def url(self, service_type: ServiceType) -> str:
+        return f"http://{self.host}:{self.ports[service_type]}"
+
+    def service_env(self) -> Dict[str, str]:
+        """게이트웨이 프로세스에 전달할 *_SERVICE_URL 환경변수를 반환합니다."""
+        return {
+            f"{service_type.name}_SERVICE_URL": self.url(service_type)
+            for service_type in self.ports
+        }
+
+    def start(self, timeout: float = 10.0):
+        for service_type, port in self.ports.items():
+            config = uvicorn.Config(
+                create_stub_app(service_type),
+                host=self.host,
+                port=port,
+                log_level="warning",
+                access_log=False,
+                lifespan="off",
+            )
+            self._servers.append(uvicorn.Server(config))
+
+        self._thread = threading.Thread(target=self._run, name="benchmark-stubs", daemon=True)
+        self._thread.start()
+
+        deadline = time.monotonic() + timeout
+        while not all(server.started for server in self._servers):
+            if time.monotonic() >= deadline or not self._thread.is_alive():
+                raise RuntimeError("stub 백엔드를 시작하지 못했습니다.")
+            time.sleep(0.05)
+
+    def _run(self):
+        async def serve_all():
+            await asyncio.gather(*(server.serve() for server in self._servers))
+
+        asyncio.run(serve_all())
+
+    def stop(self):
+        for server in self._servers:
+            server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
@@ -0,0 +1,78 @@
+# test_deadline.py
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model import service_factory as service_factory_module
+from app.domain.model.service_factory import ServiceProxyFactory
+from app.domain.model.service_type import ServiceType
+from app.domain.service.discovery_service import ServiceDiscovery
+from app.platform.deadline import DEADLINE_HEADER, RouteTimeouts, format_deadline, parse_deadline
+from app.platform.http_client import client_registry
+from app.foundation.settings import parse_route_values
+
+SERVICE = ServiceType.STOCKTREND
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """ServiceProxyFactory가 MockTransport 백엔드로 요청을 보내도록 설정하고, 받은 요청 목록을 반환합니다."""
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(service_factory_module, "service_discovery", ServiceDiscovery({SERVICE: ["http://backend"]}))
+    monkeypatch.setitem(client_registry._clients, SERVICE, httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return received
+
+
+def test_parse_and_format_deadline():
+    assert parse_deadline("1700000000.250") == 1700000000.25
+    assert parse_deadline("soon") is None
+    assert parse_deadline(None) is None
+    assert format_deadline(1700000000.25) == "1700000000.250"
+
+
+def test_route_timeout_is_clamped_by_incoming_deadline():
+    timeouts = RouteTimeouts(parse_route_values("stocktrend:*stocks=10"), default_timeout=30)
+    now = time.time()
+    assert timeouts.timeout_for(SERVICE, "/api/stocks") == 10
+    assert timeouts.timeout_for(SERVICE, "other") == 30
+    assert timeouts.deadline_for(SERVICE, "api/stocks") == pytest.approx(now + 10, abs=1)
+    # 클라이언트가 보낸 마감 시각이 더 이르면 그 시각을 사용
+    assert timeouts.deadline_for(SERVICE, "api/stocks", now + 2) == now + 2
+    assert timeouts.deadline_for(SERVICE, "api/stocks", now + 100) == pytest.approx(now + 10, abs=1)
+
+
+def test_factory_forwards_earliest_deadline(backend):
+    incoming = time.time() + 3
+    response = asyncio.run(ServiceProxyFactory(SERVICE).request(
+        method="GET",
+        path="other",
+        headers=[(DEADLINE_HEADER.encode(), format_deadline(incoming).encode())],
+        timeout=60,
+    ))
+    assert response.status_code == 200
+    forwarded = parse_deadline(backend[0].headers[DEADLINE_HEADER])
+    assert forwarded == pytest.approx(incoming, abs=0.001)
+
+
+def test_factory_sets_deadline_from_timeout(backend):
+    before = time.time()
+    asyncio.run(ServiceProxyFactory(SERVICE).request(method="GET", path="other", timeout=5))
+    forwarded = parse_deadline(backend[0].headers[DEADLINE_HEADER])
+    # 헤더 값은 밀리초 단위로 반올림됨
+    assert before + 5 - 0.001 <= forwarded <= time.time() + 5 + 0.001
+
+
+def test_factory_does_not_call_backend_after_deadline(backend):
+    expired = format_deadline(time.time() - 1).encode()
+    response = asyncio.run(ServiceProxyFactory(SERVICE).request(
+        method="GET", path="other", headers=[(DEADLINE_HEADER.encode(), expired)],
+    ))
+    assert response.status_code == 504
+    assert backend == []
@@ -0,0 +1,162 @@
+# test_resilience.py
+import time
+import asyncio
+
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.platform.priority import PriorityClassifier
+from app.platform.resilience import Bulkhead, BulkheadFullError, CircuitBreaker, CircuitOpenError
+
+SERVICE = ServiceType.DSDGEN
+WEIGHTS = {"interactive": 8.0, "batch": 1.0}
+
+
+def make_bulkhead(max_concurrent=1, max_queue=100, queue_timeout=5.0, reserved_slots=0) -> Bulkhead:
+    return Bulkhead(SERVICE, max_concurrent, max_queue, queue_timeout, weights=dict(WEIGHTS), reserved_slots=reserved_slots)
+
+
+def test_bulkhead_weighted_fair_order():
+    """양쪽 등급이 밀려 있으면 가중치(8:1)에 비례해 슬롯을 배분합니다."""
+    async def scenario():
+        bulkhead = make_bulkhead(max_concurrent=1)
+        await bulkhead.acquire("interactive")  # 슬롯 점유
+        order = []
+
+        async def worker(priority):
+            await bulkhead.acquire(priority)
+            order.append(priority)
+            bulkhead.release(priority)
+
+        tasks = [asyncio.ensure_future(worker("batch")) for _ in range(9)]
+        tasks += [asyncio.ensure_future(worker("interactive")) for _ in range(9)]
+        await asyncio.sleep(0)
+        bulkhead.release("interactive")
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(scenario())
+    # 처음 9개 중 batch는 1개만 (batch가 먼저 대기했어도 interactive가 8:1로 앞섬)
+    assert order[:9].count("batch") == 1
+    assert order.count("batch") == 9 and order.count("interactive") == 9
+
+
+def test_bulkhead_reserved_slots_keep_room_for_highest_class():
+    async def scenario():
+        bulkhead = make_bulkhead(max_concurrent=4, reserved_slots=1, queue_timeout=0.05)
+        for _ in range(3):
+            await bulkhead.acquire("batch")
+        # 낮은 등급은 예약 슬롯을 쓸 수 없어 대기하다 거절됨
+        with pytest.raises(BulkheadFullError):
+            await bulkhead.acquire("batch")
+        # 가장 높은 등급은 예약 슬롯으로 바로 실행
+        await asyncio.wait_for(bulkhead.acquire("interactive"), timeout=0.01)
+        return bulkhead
+
+    bulkhead = asyncio.run(scenario())
+    assert bulkhead.active == 4
+    assert bulkhead.timed_out == 1
+    assert bulkhead.waiting == 0
+
+
+def test_bulkhead_rejects_when_queue_full():
+    async def scenario():
+        bulkhead = make_bulkhead(max_concurrent=1, max_queue=1)
+        await bulkhead.acquire("interactive")
+        waiter = asyncio.ensure_future(bulkhead.acquire("interactive"))
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullError):
+            await bulkhead.acquire("interactive")
+        bulkhead.release("interactive")
+        await waiter
+        return bulkhead
+
+    bulkhead = asyncio.run(scenario())
+    assert bulkhead.rejected == 1
+    assert bulkhead.active == 1
+
+
+def test_bulkhead_cancelled_waiter_does_not_leak_slot():
+    async def scenario():
+        bulkhead = make_bulkhead(max_concurrent=1)
+        await bulkhead.acquire("batch")
+        waiter = asyncio.ensure_future(bulkhead.acquire("batch"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        bulkhead.release("batch")
+        return bulkhead
+
+    bulkhead = asyncio.run(scenario())
+    assert bulkhead.active == 0
+    assert bulkhead.waiting == 0
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(SERVICE, failure_threshold=3, open_seconds=30.0, slow_call_seconds=None)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.after_call(False, 0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    # 성공하면 연속 실패 수가 초기화됨
+    breaker.before_call()
+    breaker.after_call(True, 0.1)
+    assert breaker.consecutive_failures == 0
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.after_call(False, 0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_counts_slow_calls_and_ignores_cancelled():
+    breaker = CircuitBreaker(SERVICE, failure_threshold=2, open_seconds=30.0, slow_call_seconds=1.0)
+    breaker.before_call()
+    breaker.after_call(True, 2.0)  # 느린 성공은 실패로 계산
+    breaker.before_call()
+    breaker.after_call(None, 5.0)  # 취소된 요청은 기록하지 않음
+    assert breaker.consecutive_failures == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_allows_single_trial():
+    breaker = CircuitBreaker(SERVICE, failure_threshold=1, open_seconds=30.0, slow_call_seconds=None)
+    breaker.before_call()
+    breaker.after_call(False, 0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.opened_at = time.monotonic() - 31
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # 시험 요청이 실패하면 다시 open
+    breaker.after_call(False, 0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.opened_at = time.monotonic() - 31
+    breaker.before_call()
+    breaker.after_call(True, 0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_priority_header_can_only_lower_the_tier():
+    classifier = PriorityClassifier(
+        classes=[("interactive", 8.0), ("batch", 1.0)],
+        default="batch",
+        api_key_tiers={"partner": "interactive", "bulk": "batch"},
+    )
+    # 키가 없으면 기본 등급이 상한
+    assert classifier.classify("interactive", None) == "batch"
+    assert classifier.classify(None, "unknown-key") == "batch"
+    # 키 등급이 상한이며 헤더로는 낮추기만 가능
+    assert classifier.classify(None, "partner") == "interactive"
+    assert classifier.classify("batch", "partner") == "batch"
+    assert classifier.classify("interactive", "bulk") == "batch"
+    # 알 수 없는 등급은 무시
+    assert classifier.classify("urgent", "partner") == "interactive"
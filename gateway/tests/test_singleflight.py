@@ -0,0 +1,129 @@
+# test_singleflight.py
+import asyncio
+
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.platform.singleflight import SingleFlight, parse_route_patterns
+
+
+def make_singleflight() -> SingleFlight:
+    return SingleFlight(parse_route_patterns("stocktrend:*stocks,dsdcheck:financial-data"))
+
+
+def test_applies_to_configured_routes_only():
+    flight = make_singleflight()
+    assert flight.applies_to(ServiceType.STOCKTREND, "/api/stocks")
+    assert flight.applies_to(ServiceType.DSDCHECK, "financial-data")
+    assert not flight.applies_to(ServiceType.DSDGEN, "dsdgen/dsd-source")
+    assert not SingleFlight(parse_route_patterns("*:*"), enabled=False).applies_to(ServiceType.DSDGEN, "x")
+
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight = make_singleflight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+    assert calls == 1
+    assert [result for result, _ in results] == ["result"] * 5
+    assert [coalesced for _, coalesced in results].count(False) == 1
+    assert flight.stats()["coalesced"] == 4
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_detach_without_waiters_lets_leader_keep_result():
+    async def scenario():
+        flight = make_singleflight()
+        waiters_seen = []
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            waiters_seen.append(flight.detach("key"))
+            await asyncio.sleep(0.05)
+            return "stream"
+
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0.03)
+        # 분리된 뒤 들어온 요청은 합쳐지지 않고 새로 실행
+        later = await flight.do("key", lambda: asyncio.sleep(0, result="fresh"))
+        return flight, waiters_seen, await leader, later
+
+    flight, waiters_seen, leader, later = asyncio.run(scenario())
+    assert waiters_seen == [0]
+    assert leader == ("stream", False)
+    assert later == ("fresh", False)
+    assert flight.stats()["detached"] == 1
+
+
+def test_detach_reports_waiters_that_already_joined():
+    async def scenario():
+        flight = make_singleflight()
+        waiters_seen = []
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            waiters_seen.append(flight.detach("key"))
+            return "shared"
+
+        results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(3)])
+        return flight, waiters_seen, results
+
+    flight, waiters_seen, results = asyncio.run(scenario())
+    assert waiters_seen == [2]
+    assert [result for result, _ in results] == ["shared"] * 3
+    assert flight.stats()["detached"] == 0
+
+
+def test_detach_from_other_task_is_ignored():
+    async def scenario():
+        flight = make_singleflight()
+        leader = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(0.02, result="ok")))
+        await asyncio.sleep(0)
+        ignored = flight.detach("key")
+        in_flight = flight.stats()["in_flight"]
+        await leader
+        return ignored, in_flight
+
+    assert asyncio.run(scenario()) == (0, 1)
+
+
+def test_cancelled_leader_discards_unclaimed_result():
+    async def scenario():
+        flight = make_singleflight()
+        discarded = []
+
+        async def discard(result):
+            discarded.append(result)
+
+        leader = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(0.02, result="stream"), discard=discard))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        await asyncio.sleep(0.05)
+        return discarded
+
+    assert asyncio.run(scenario()) == ["stream"]
+
+
+def test_waiters_get_result_when_leader_is_cancelled():
+    async def scenario():
+        flight = make_singleflight()
+        leader = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(0.02, result="ok")))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(0, result="unused")))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(scenario()) == ("ok", True)
@@ -1,5 +1,6 @@
 # irsummary_router.py 
 from fastapi import APIRouter, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from app.domain.controller.irsummary_controller import get_irsummary_controller
 from app.domain.model.irsummary_schema import IRAnalysisResponse
 from app.foundation.file_utils import process_uploaded_pdf, cleanup_file
@@ -63,8 +64,8 @@ async def analyze_pdf(file: UploadFile = File(...)) -> IRAnalysisResponse:
         # 파일 처리 (유효성 검사, 임시 저장)
         temp_file_path, _ = await process_uploaded_pdf(file)
         
-        # 컨트롤러를 통한 도메인 로직 실행
-        result = controller.analyze(temp_file_path)
+        # 컨트롤러를 통한 도메인 로직 실행 (PDF 파싱과 요약 호출은 동기 작업이므로 스레드풀에서 실행)
+        result = await run_in_threadpool(controller.analyze, temp_file_path)
         
         return IRAnalysisResponse(
             success=True,
@@ -17,6 +17,8 @@ from app.foundation.pdf_parser import (
 )
 from app.platform.openai_client import summarize_ir_report_content
 from app.domain.model.irsummary_schema import IRSummaryResult
+from app.middleware.deadline_middleware import check_deadline
+from app.platform.tracing import tracer
 
 # 환경변수 로드
 load_dotenv()
@@ -28,6 +30,7 @@ class IRSummaryService:
         """IRSummary 서비스 초기화"""
         self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     
+    @tracer.traced("irsummary.investment_opinion")
     def extract_investment_opinion(self, pdf_path: str) -> Dict[str, str]:
         """
         PDF의 첫 페이지에서 투자의견, 목표주가, 타겟 PER을 추출합니다.
@@ -53,6 +56,7 @@ class IRSummaryService:
                 "target_per": ""
             }
     
+    @tracer.traced("irsummary.financial_forecast")
     def extract_financial_forecast(self, pdf_path: str) -> Dict[str, Dict[str, float]]:
         """
         PDF에서 Camelot을 사용하여 재무 전망 테이블을 추출합니다.
@@ -89,6 +93,7 @@ class IRSummaryService:
             print(f"재무 전망 추출 중 오류 발생: {e}")
             return {}
     
+    @tracer.traced("irsummary.summarize")
     def summarize_main_contents(self, pdf_path: str) -> str:
         """
         PDF의 첫 1-2페이지 본문을 GPT-3.5-turbo로 요약합니다.
@@ -113,6 +118,7 @@ class IRSummaryService:
             print(f"본문 요약 중 오류 발생: {e}")
             return f"요약 생성 중 오류가 발생했습니다: {str(e)}"
     
+    @tracer.traced("irsummary.analyze")
     def analyze_ir_report(self, pdf_path: str) -> IRSummaryResult:
         """
         IR 리포트를 종합적으로 분석합니다.
@@ -124,13 +130,16 @@ class IRSummaryService:
             IRSummaryResult: 분석 결과
         """
         try:
-            # 1. 투자의견 추출
+            # 1. 투자의견 추출 (단계마다 요청 마감 시각 확인)
+            check_deadline("investment_opinion")
             investment_opinion = self.extract_investment_opinion(pdf_path)
             
             # 2. 재무 전망 추출
+            check_deadline("financial_forecast")
             financial_forecast = self.extract_financial_forecast(pdf_path)
             
             # 3. 본문 요약
+            check_deadline("summarize")
             summary = self.summarize_main_contents(pdf_path)
             
             return IRSummaryResult(
@@ -6,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 from app.api.irsummary_router import router as irsummary_router
+from app.middleware.deadline_middleware import DeadlineMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
 
 # 환경변수 로드
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -27,10 +29,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="irsummary")
+
 # 라우터 등록
 app.include_router(irsummary_router, tags=["irsummary"])
 
 if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("PORT", 8083))
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    from app.launcher import run
+    run("app.main:app", port=8083) 
\ No newline at end of file
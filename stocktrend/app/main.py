@@ -2,6 +2,8 @@ from fastapi import FastAPI
 import os
 from dotenv import load_dotenv
 from app.api.stocktrend_router import router
+from app.middleware.deadline_middleware import DeadlineMiddleware
+from app.middleware.tracing_middleware import TracingMiddleware
 from icecream import ic
 from starlette.middleware.cors import CORSMiddleware
 
@@ -25,9 +27,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 게이트웨이가 전달한 요청 마감 시각(X-Request-Deadline)이 지나면 처리 취소
+app.add_middleware(DeadlineMiddleware)
+
+# 게이트웨이가 전달한 traceparent를 이어서 요청 처리 구간(span)을 기록
+app.add_middleware(TracingMiddleware, service_name="stocktrend")
+
 # Router 연결
 app.include_router(router, prefix="/api/stocktrend")
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8081)
\ No newline at end of file
+    from app.launcher import run
+    run("app.main:app", port=8081)
\ No newline at end of file